@@ -0,0 +1,190 @@
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator, KruskalGenerator
+from src.renderer import ConsoleRenderer
+from src.solver import BacktrackSolver, BreadthFirstSearchSolver
+from src.vectorized_solver import DeadEndFillingSolver, VectorizedBFSSolver, np
+
+logger = logging.getLogger(__name__)
+
+SEED = 20241017
+# Лестница размеров: квадратные лабиринты примерно из 10^2 ... 10^7 клеток.
+LADDER = [10 ** exponent for exponent in range(2, 8)]
+
+
+def maze_sides(cells: int) -> Tuple[int, int]:
+    """
+    Подбирает размеры лабиринта, близкого к квадратному, с заданным числом клеток.
+
+    Args:
+        cells (int): Желаемое число клеток.
+
+    Returns:
+        Tuple[int, int]: Высота и ширина.
+    """
+    height = max(1, math.isqrt(cells))
+    return height, max(2, cells // height)
+
+
+def solve_case(solver) -> Callable[[int, int], Callable[[], object]]:
+    """
+    Создаёт сценарий решения лабиринта из левого верхнего угла в правый нижний. Лабиринт генерируется при
+    подготовке сценария и в замер не входит.
+
+    Args:
+        solver: Класс решателя.
+
+    Returns:
+        Callable[[int, int], Callable[[], object]]: Функция подготовки сценария по размерам лабиринта.
+    """
+    def prepare(height: int, width: int) -> Callable[[], object]:
+        maze = KruskalGenerator.generate(height, width, seed=SEED)
+        return lambda: solver.solve(maze, Coordinate(1, 1), Coordinate(height, width))
+    return prepare
+
+
+def render_case(height: int, width: int) -> Callable[[], object]:
+    """
+    Создаёт сценарий отрисовки лабиринта заданных размеров.
+
+    Args:
+        height (int): Высота лабиринта.
+        width (int): Ширина лабиринта.
+
+    Returns:
+        Callable[[], object]: Замеряемая функция.
+    """
+    maze = KruskalGenerator.generate(height, width, seed=SEED)
+    return lambda: ConsoleRenderer.render(maze)
+
+
+CASES: Dict[str, Callable[[int, int], Callable[[], object]]] = {
+    'backtrack_generator': lambda height, width: lambda: BacktrackGenerator.generate(height, width, seed=SEED),
+    'kruskal_generator': lambda height, width: lambda: KruskalGenerator.generate(height, width, seed=SEED),
+    'backtrack_solver': solve_case(BacktrackSolver),
+    'bfs_solver': solve_case(BreadthFirstSearchSolver),
+    'console_renderer': render_case,
+}
+if np is not None:
+    CASES['vectorized_bfs_solver'] = solve_case(VectorizedBFSSolver)
+    CASES['dead_end_filling_solver'] = solve_case(DeadEndFillingSolver)
+
+
+def measure(name: str, cells: int, with_memory: bool, repeat: int = 1) -> dict:
+    """
+    Замеряет один сценарий: лучшее из repeat время работы и, при необходимости, пиковое выделение памяти
+    (tracemalloc). Память замеряется отдельным прогоном, чтобы трассировка не искажала время.
+
+    Args:
+        name (str): Название сценария (ключ CASES).
+        cells (int): Число клеток лабиринта.
+        with_memory (bool): Замерять ли пиковую память.
+        repeat (int): Число повторов замера времени.
+
+    Returns:
+        dict: Результат замера.
+    """
+    height, width = maze_sides(cells)
+    run = CASES[name](height, width)
+
+    seconds = math.inf
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        run()
+        seconds = min(seconds, time.perf_counter() - begin)
+
+    peak = None
+    if with_memory:
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    result = {'case': name, 'height': height, 'width': width, 'cells': height * width, 'seconds': seconds,
+              'cells_per_second': height * width / seconds if seconds > 0 else None, 'peak_bytes': peak}
+    logger.info("%-20s %9d клеток: %8.3f с, %12.0f клеток/с, пик памяти %s", name, height * width, seconds,
+                result['cells_per_second'] or 0, peak)
+    return result
+
+
+def compare(results: List[dict], baseline: List[dict], tolerance: float) -> List[str]:
+    """
+    Сравнивает результаты с базовыми и возвращает описания регрессий - замеров, которые медленнее или требуют
+    больше памяти, чем базовые, более чем в (1 + tolerance) раз.
+
+    Args:
+        results (List[dict]): Текущие результаты.
+        baseline (List[dict]): Базовые результаты.
+        tolerance (float): Допустимое относительное ухудшение.
+
+    Returns:
+        List[str]: Описания регрессий.
+    """
+    reference = {(item['case'], item['cells']): item for item in baseline}
+    regressions = []
+    for item in results:
+        base = reference.get((item['case'], item['cells']))
+        if base is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            if item[metric] is None or not base.get(metric):
+                continue
+            if item[metric] > base[metric] * (1 + tolerance):
+                regressions.append(f"{item['case']} ({item['cells']} клеток): {metric} {item[metric]:.6g} "
+                                   f"против {base[metric]:.6g} в базовом замере")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Замеры производительности генераторов, решателей и отрисовки.")
+    parser.add_argument('--max-cells', type=int, default=10 ** 5, help="Наибольший размер лабиринта из лестницы.")
+    parser.add_argument('--cases', nargs='*', choices=sorted(CASES), default=sorted(CASES), help="Сценарии.")
+    parser.add_argument('--repeat', type=int, default=3, help="Число повторов замера времени (берётся лучший).")
+    parser.add_argument('--no-memory', action='store_true', help="Не замерять пиковую память.")
+    parser.add_argument('--output', default=None, help="Файл для сохранения результатов в JSON.")
+    parser.add_argument('--baseline', default=None, help="Файл базовых результатов для сравнения.")
+    parser.add_argument('--update-baseline', action='store_true', help="Записать результаты как базовые.")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Допустимое относительное ухудшение времени и памяти (0.25 = 25%%).")
+    args = parser.parse_args(argv)
+
+    results = [measure(name, cells, not args.no_memory, args.repeat)
+               for cells in LADDER if cells <= args.max_cells for name in args.cases]
+    report = {'python': platform.python_version(), 'machine': platform.machine(), 'seed': SEED, 'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline and args.update_baseline:
+        with open(args.baseline, 'w') as baseline:
+            json.dump(report, baseline, indent=2)
+        logger.info("Базовые результаты записаны в %s", args.baseline)
+    elif args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as baseline:
+            regressions = compare(results, json.load(baseline)['results'], args.tolerance)
+        for regression in regressions:
+            logger.error("Регрессия: %s", regression)
+        if regressions:
+            return 1
+        logger.info("Регрессий относительно %s нет", args.baseline)
+    elif args.baseline:
+        logger.warning("Файл базовых результатов %s не найден, сравнение пропущено", args.baseline)
+
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    logging.getLogger().setLevel(logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,248 @@
+import argparse
+import csv
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator, EllerGenerator, KruskalGenerator
+from src.maze import Maze
+from src.solver import AStarSolver, BacktrackSolver, BidirectionalBFSSolver, BreadthFirstSearchSolver
+
+logger = logging.getLogger(__name__)
+
+# Доступные в манифесте алгоритмы генерации и решения.
+GENERATORS = {
+    'backtracking': BacktrackGenerator,
+    'kruskal': KruskalGenerator,
+    'eller': EllerGenerator,
+}
+SOLVERS = {
+    'backtracking': BacktrackSolver,
+    'bfs': BreadthFirstSearchSolver,
+    'astar': AStarSolver,
+    'bidirectional_bfs': BidirectionalBFSSolver,
+}
+
+
+@dataclass(frozen=True)
+class BatchTask:
+    """
+    Задание пакетной обработки: сгенерировать лабиринт и найти в нём путь.
+
+    Атрибуты:
+        id (str): Идентификатор задания.
+        algorithm (str): Алгоритм генерации (ключ GENERATORS).
+        height (int): Высота лабиринта.
+        width (int): Ширина лабиринта.
+        seed (Optional[int]): Зерно генерации.
+        start (Coordinate): Стартовая клетка.
+        finish (Coordinate): Финишная клетка.
+        solver (str): Алгоритм решения (ключ SOLVERS).
+    """
+    id: str
+    algorithm: str
+    height: int
+    width: int
+    seed: Optional[int]
+    start: Coordinate
+    finish: Coordinate
+    solver: str = 'bfs'
+
+
+@dataclass
+class BatchResult:
+    """
+    Результат выполнения задания пакетной обработки.
+
+    Атрибуты:
+        id (str): Идентификатор задания.
+        found (bool): Найден ли путь.
+        path_length (int): Число клеток в найденном пути.
+        fingerprint (str): Отпечаток сгенерированного лабиринта.
+        generate_seconds (float): Время генерации.
+        solve_seconds (float): Время решения.
+        path (Optional[List[Tuple[int, int]]]): Найденный путь, если он был запрошен.
+        maze (Optional[bytes]): Лабиринт в компактном представлении Maze.to_bytes, если он был запрошен.
+    """
+    id: str
+    found: bool
+    path_length: int
+    fingerprint: str
+    generate_seconds: float
+    solve_seconds: float
+    path: Optional[List[Tuple[int, int]]] = None
+    maze: Optional[bytes] = field(default=None, repr=False)
+
+
+class BatchRunner:
+    """
+    Пакетная генерация и решение лабиринтов по манифесту с распределением заданий по процессам.
+    """
+    CSV_FIELDS = ['id', 'algorithm', 'height', 'width', 'seed', 'start_row', 'start_col', 'finish_row', 'finish_col',
+                  'solver']
+
+    @staticmethod
+    def make_task(record: dict, default_id: str) -> BatchTask:
+        """
+        Создаёт задание из записи манифеста с проверкой алгоритмов и координат.
+
+        Args:
+            record (dict): Запись манифеста.
+            default_id (str): Идентификатор задания, если он не указан в записи.
+
+        Returns:
+            BatchTask: Задание.
+        """
+        height = int(record['height'])
+        width = int(record['width'])
+
+        if 'start' in record:
+            start = Coordinate(*map(int, record['start']))
+        else:
+            start = Coordinate(int(record.get('start_row') or 1), int(record.get('start_col') or 1))
+        if 'finish' in record:
+            finish = Coordinate(*map(int, record['finish']))
+        else:
+            finish = Coordinate(int(record.get('finish_row') or height), int(record.get('finish_col') or width))
+
+        seed = record.get('seed')
+        task = BatchTask(id=str(record.get('id') or default_id), algorithm=record['algorithm'], height=height,
+                         width=width, seed=int(seed) if seed not in (None, '') else None, start=start, finish=finish,
+                         solver=record.get('solver') or 'bfs')
+
+        if task.algorithm not in GENERATORS:
+            raise ValueError(f"Неизвестный алгоритм генерации '{task.algorithm}' в задании {task.id}.")
+        if task.solver not in SOLVERS:
+            raise ValueError(f"Неизвестный алгоритм решения '{task.solver}' в задании {task.id}.")
+        for coordinate in (task.start, task.finish):
+            if not (1 <= coordinate.row <= height and 1 <= coordinate.col <= width):
+                raise ValueError(f"Координата {coordinate} вне лабиринта в задании {task.id}.")
+        return task
+
+    @staticmethod
+    def parse_manifest(lines: Iterable[str], csv_format: bool = False) -> List[BatchTask]:
+        """
+        Разбирает манифест: JSON-объект на строку или CSV с заголовком (поля CSV_FIELDS).
+
+        Args:
+            lines (Iterable[str]): Строки манифеста.
+            csv_format (bool): True, если манифест в формате CSV.
+
+        Returns:
+            List[BatchTask]: Задания в порядке следования в манифесте.
+        """
+        if csv_format:
+            records = csv.DictReader(lines)
+        else:
+            records = (json.loads(line) for line in lines if line.strip())
+
+        return [BatchRunner.make_task(record, str(i)) for i, record in enumerate(records)]
+
+    @staticmethod
+    def read_manifest(path: str) -> List[BatchTask]:
+        """
+        Читает манифест из файла. Формат определяется по расширению: .csv - CSV, иначе JSON lines.
+
+        Args:
+            path (str): Путь к файлу манифеста.
+
+        Returns:
+            List[BatchTask]: Задания.
+        """
+        with open(path, newline='') as manifest:
+            return BatchRunner.parse_manifest(manifest, csv_format=path.endswith('.csv'))
+
+    @staticmethod
+    def run_task(task: BatchTask, include_path: bool = False, include_maze: bool = False) -> BatchResult:
+        """
+        Выполняет одно задание: генерирует лабиринт и решает его. Запускается в процессе-исполнителе.
+
+        Args:
+            task (BatchTask): Задание.
+            include_path (bool): Возвращать ли найденный путь.
+            include_maze (bool): Возвращать ли лабиринт в компактном представлении.
+
+        Returns:
+            BatchResult: Результат с замерами времени.
+        """
+        begin = time.perf_counter()
+        maze: Maze = GENERATORS[task.algorithm].generate(task.height, task.width, seed=task.seed)
+        generated = time.perf_counter()
+        found, path = SOLVERS[task.solver].solve(maze, task.start, task.finish)
+        solved = time.perf_counter()
+
+        return BatchResult(id=task.id, found=found, path_length=len(path), fingerprint=maze.fingerprint(),
+                           generate_seconds=generated - begin, solve_seconds=solved - generated,
+                           path=[(c.row, c.col) for c in path] if include_path else None,
+                           maze=maze.to_bytes() if include_maze else None)
+
+    @staticmethod
+    def run_chunk(tasks: List[BatchTask], include_path: bool, include_maze: bool) -> List[BatchResult]:
+        """
+        Выполняет группу заданий в одном процессе-исполнителе, чтобы уменьшить накладные расходы на передачу
+        мелких заданий.
+
+        Args:
+            tasks (List[BatchTask]): Задания.
+            include_path (bool): Возвращать ли найденные пути.
+            include_maze (bool): Возвращать ли лабиринты.
+
+        Returns:
+            List[BatchResult]: Результаты заданий.
+        """
+        return [BatchRunner.run_task(task, include_path, include_maze) for task in tasks]
+
+    @staticmethod
+    def run(tasks: List[BatchTask], max_workers: Optional[int] = None, chunk_size: int = 1,
+            include_path: bool = False, include_maze: bool = False) -> Iterator[BatchResult]:
+        """
+        Распределяет задания по пулу процессов и выдаёт результаты в порядке завершения.
+
+        Args:
+            tasks (List[BatchTask]): Задания.
+            max_workers (Optional[int]): Число процессов. По умолчанию - число ядер.
+            chunk_size (int): Сколько заданий передаётся исполнителю за один раз.
+            include_path (bool): Возвращать ли найденные пути.
+            include_maze (bool): Возвращать ли лабиринты в компактном представлении.
+
+        Yields:
+            BatchResult: Результат очередного завершившегося задания.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(BatchRunner.run_chunk, tasks[i:i + chunk_size], include_path, include_maze)
+                       for i in range(0, len(tasks), chunk_size)]
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Пакетная генерация и решение лабиринтов по манифесту.")
+    parser.add_argument('manifest', help="Файл манифеста: JSON lines или CSV (по расширению .csv).")
+    parser.add_argument('--workers', type=int, default=None, help="Число процессов (по умолчанию - число ядер).")
+    parser.add_argument('--chunk-size', type=int, default=1, help="Число заданий на одну передачу исполнителю.")
+    parser.add_argument('--include-path', action='store_true', help="Выводить найденные пути.")
+    args = parser.parse_args(argv)
+
+    tasks = BatchRunner.read_manifest(args.manifest)
+    logger.info("Заданий в манифесте: %d", len(tasks))
+
+    begin = time.perf_counter()
+    for result in BatchRunner.run(tasks, args.workers, args.chunk_size, include_path=args.include_path):
+        record = asdict(result)
+        del record['maze']
+        if record['path'] is None:
+            del record['path']
+        sys.stdout.write(json.dumps(record) + '\n')
+        sys.stdout.flush()
+    logger.info("Все задания выполнены за %.3f с", time.perf_counter() - begin)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    logging.getLogger().setLevel(logging.INFO)
+    main()
@@ -1,3 +1,9 @@
+# Битовые флаги ячейки в упакованном представлении лабиринта (один байт на ячейку).
+LEFT_WALL = 1
+UPPER_WALL = 2
+CAPTURED = 4
+
+
 class Cell:
     def __init__(self, left_wall: bool, upper_wall: bool, captured: bool):
         """
@@ -12,6 +18,17 @@ class Cell:
         self._upper_wall = upper_wall
         self._captured = captured
 
+    @property
+    def flags(self) -> int:
+        """
+        Возвращает упакованное представление ячейки в виде битовых флагов.
+
+        Returns:
+            int: Комбинация флагов LEFT_WALL, UPPER_WALL и CAPTURED.
+        """
+        return (LEFT_WALL if self.left_wall else 0) | (UPPER_WALL if self.upper_wall else 0) | \
+            (CAPTURED if self.captured else 0)
+
     @property
     def left_wall(self) -> bool:
         """
@@ -71,3 +88,69 @@ class Cell:
             value (bool): True если ячейка заблокирована, иначе False.
         """
         self._captured = captured
+
+
+class CellView(Cell):
+    """
+    Тонкое представление ячейки, хранящейся в упакованном буфере лабиринта.
+    Не хранит состояние само: чтение и запись свойств идут напрямую в байт буфера.
+    """
+    def __init__(self, buffer, offset: int):
+        """
+        Инициализация представления ячейки.
+
+        Args:
+            buffer: Изменяемый буфер байтов (bytearray, memoryview, mmap) с флагами ячеек.
+            offset (int): Смещение ячейки в буфере.
+        """
+        self._buffer = buffer
+        self._offset = offset
+
+    def _get_flag(self, flag: int) -> bool:
+        """
+        Проверяет, установлен ли флаг в байте ячейки.
+
+        Args:
+            flag (int): Проверяемый флаг.
+
+        Returns:
+            bool: True, если флаг установлен, иначе False.
+        """
+        return bool(self._buffer[self._offset] & flag)
+
+    def _set_flag(self, flag: int, value: bool) -> None:
+        """
+        Устанавливает или сбрасывает флаг в байте ячейки.
+
+        Args:
+            flag (int): Изменяемый флаг.
+            value (bool): True для установки флага, False для сброса.
+        """
+        if value:
+            self._buffer[self._offset] |= flag
+        else:
+            self._buffer[self._offset] &= ~flag & 0xFF
+
+    @property
+    def left_wall(self) -> bool:
+        return self._get_flag(LEFT_WALL)
+
+    @left_wall.setter
+    def left_wall(self, left_wall: bool) -> None:
+        self._set_flag(LEFT_WALL, left_wall)
+
+    @property
+    def upper_wall(self) -> bool:
+        return self._get_flag(UPPER_WALL)
+
+    @upper_wall.setter
+    def upper_wall(self, upper_wall: bool) -> None:
+        self._set_flag(UPPER_WALL, upper_wall)
+
+    @property
+    def captured(self) -> bool:
+        return self._get_flag(CAPTURED)
+
+    @captured.setter
+    def captured(self, captured: bool) -> None:
+        self._set_flag(CAPTURED, captured)
@@ -0,0 +1,314 @@
+import argparse
+import importlib
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from src.coordinate import Coordinate
+from src.maze import Maze, FILE_MAGIC
+
+# Алгоритмы задаются именем модуля и класса и импортируются только при обращении, чтобы запуск команды не тратил
+# время на загрузку модулей, которые ей не нужны.
+GENERATORS = {
+    'backtracking': ('src.generator', 'BacktrackGenerator'),
+    'kruskal': ('src.generator', 'KruskalGenerator'),
+    'eller': ('src.generator', 'EllerGenerator'),
+    'parallel': ('src.parallel_generator', 'ParallelTiledGenerator'),
+}
+SOLVERS = {
+    'backtracking': ('src.solver', 'BacktrackSolver'),
+    'bfs': ('src.solver', 'BreadthFirstSearchSolver'),
+    'astar': ('src.solver', 'AStarSolver'),
+    'bidirectional_bfs': ('src.solver', 'BidirectionalBFSSolver'),
+    'vectorized_bfs': ('src.vectorized_solver', 'VectorizedBFSSolver'),
+    'dead_end_filling': ('src.vectorized_solver', 'DeadEndFillingSolver'),
+}
+COMMANDS = ('generate', 'solve', 'render', 'bench')
+
+
+def load(registry: Dict[str, Tuple[str, str]], name: str):
+    """
+    Импортирует класс алгоритма по его имени в реестре.
+
+    Args:
+        registry (Dict[str, Tuple[str, str]]): Реестр алгоритмов (GENERATORS или SOLVERS).
+        name (str): Имя алгоритма.
+
+    Returns:
+        Класс генератора или решателя.
+    """
+    if name not in registry:
+        raise ValueError(f"Неизвестный алгоритм '{name}'.")
+    module, attribute = registry[name]
+    return getattr(importlib.import_module(module), attribute)
+
+
+def read_maze(path: str) -> Maze:
+    """
+    Читает лабиринт из файла или стандартного ввода ('-'). Принимаются оба формата: файл Maze.save
+    (файл отображается в память через Maze.load) и компактное представление Maze.to_bytes.
+
+    Args:
+        path (str): Путь к файлу или '-'.
+
+    Returns:
+        Maze: Лабиринт.
+    """
+    if path != '-':
+        with open(path, 'rb') as file:
+            magic = file.read(len(FILE_MAGIC))
+        if magic == FILE_MAGIC:
+            return Maze.load(path)
+        with open(path, 'rb') as file:
+            return Maze.from_bytes(file.read())
+
+    data = sys.stdin.buffer.read()
+    if data.startswith(FILE_MAGIC):
+        return Maze.from_file_bytes(data)
+    return Maze.from_bytes(data)
+
+
+def coordinate(value: Optional[List[int]], default: Coordinate) -> Coordinate:
+    """
+    Преобразует пару чисел из аргументов командной строки в координату.
+
+    Args:
+        value (Optional[List[int]]): Строка и столбец или None.
+        default (Coordinate): Координата по умолчанию.
+
+    Returns:
+        Coordinate: Координата.
+    """
+    return Coordinate(*value) if value else default
+
+
+def solve(maze: Maze, args: argparse.Namespace, stats=None) -> Tuple[bool, List[Coordinate]]:
+    """
+    Решает лабиринт выбранным в аргументах алгоритмом.
+
+    Args:
+        maze (Maze): Лабиринт.
+        args (argparse.Namespace): Аргументы команды (solver, start, finish).
+        stats (Optional[Stats]): Статистика поиска.
+
+    Returns:
+        Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и путь.
+    """
+    start = coordinate(args.start, Coordinate(1, 1))
+    finish = coordinate(args.finish, Coordinate(maze.height, maze.width))
+    for point in (start, finish):
+        if not maze.coordinate_inside_map(point):
+            raise ValueError(f"Координата {point} вне лабиринта {maze.height}x{maze.width}.")
+    return load(SOLVERS, args.solver).solve(maze, start, finish, stats)
+
+
+def generate(args: argparse.Namespace, stats=None) -> Maze:
+    """
+    Генерирует лабиринт по аргументам команды.
+
+    Args:
+        args (argparse.Namespace): Аргументы команды (algorithm, height, width, seed, origin).
+        stats (Optional[Stats]): Статистика генерации.
+
+    Returns:
+        Maze: Лабиринт.
+    """
+    if args.height is None or args.width is None:
+        raise ValueError("Не заданы размеры лабиринта (--height и --width).")
+    generator = load(GENERATORS, args.algorithm)
+    if args.origin:
+        # Начальная клетка есть только у бэктрекинга, у остальных генераторов третий параметр - зерно.
+        if args.algorithm != 'backtracking':
+            raise ValueError(f"--origin применим только к алгоритму backtracking, а не к '{args.algorithm}'.")
+        return generator.generate(args.height, args.width, start=Coordinate(*args.origin), seed=args.seed,
+                                  stats=stats)
+    return generator.generate(args.height, args.width, seed=args.seed, stats=stats)
+
+
+def command_generate(args: argparse.Namespace) -> None:
+    """
+    Команда generate: генерирует лабиринт и записывает его в файл (формат Maze.save) или в стандартный вывод
+    (компактное представление Maze.to_bytes).
+    """
+    maze = generate(args)
+    if args.output == '-':
+        sys.stdout.buffer.write(maze.to_bytes())
+        sys.stdout.buffer.flush()
+    else:
+        maze.save(args.output, args.algorithm, args.seed)
+
+
+def command_solve(args: argparse.Namespace) -> None:
+    """
+    Команда solve: решает лабиринт и выводит результат строкой JSON.
+    """
+    found, path = solve(read_maze(args.maze), args)
+    record = {'found': found, 'length': len(path)}
+    if not args.no_path:
+        record['path'] = [[c.row, c.col] for c in path]
+    sys.stdout.write(json.dumps(record) + '\n')
+
+
+def command_render(args: argparse.Namespace) -> None:
+    """
+    Команда render: выводит изображение лабиринта, при заданном решателе - вместе с найденным маршрутом.
+    """
+    from src.renderer import ConsoleRenderer
+
+    maze = read_maze(args.maze)
+    path = solve(maze, args)[1] if args.solver else None
+    ConsoleRenderer.write(maze, path, sys.stdout)
+
+
+def command_bench(args: argparse.Namespace) -> None:
+    """
+    Команда bench: повторяет генерацию, решение и (по флагу --render) отрисовку лабиринта и выводит строкой JSON
+    минимальное и медианное время каждой фазы и, для решателей, работающих проходами по сетке, число проходов.
+    """
+    import statistics
+
+    from src.renderer import ConsoleRenderer
+    from src.stats import Stats
+
+    phases: Dict[str, List[float]] = {}
+    for _ in range(args.repeat):
+        stats = Stats()
+        maze = generate(args, stats)
+        found, path = solve(maze, args, stats)
+        if args.render:
+            with open(os.devnull, 'w') as sink:
+                ConsoleRenderer.write(maze, path, sink, stats=stats)
+        for phase, seconds in stats.phases.items():
+            phases.setdefault(phase, []).append(seconds)
+
+    cells = args.height * args.width
+    record = {'algorithm': args.algorithm, 'solver': args.solver, 'height': args.height, 'width': args.width,
+              'repeat': args.repeat, 'found': found, 'length': len(path),
+              'phases': {phase: {'min': min(times), 'median': statistics.median(times),
+                                 'cells_per_second': cells / min(times) if min(times) > 0 else None}
+                         for phase, times in phases.items()}}
+    if stats.passes:
+        record['passes'] = stats.passes
+    sys.stdout.write(json.dumps(record) + '\n')
+
+
+def build_parser(defaults: Optional[Dict[str, dict]] = None) -> argparse.ArgumentParser:
+    """
+    Создаёт разборщик аргументов командной строки с командами generate, solve, render и bench.
+
+    Args:
+        defaults (Optional[Dict[str, dict]]): Значения по умолчанию для аргументов команд, заменяющие встроенные.
+
+    Returns:
+        argparse.ArgumentParser: Разборщик аргументов.
+    """
+    defaults = defaults or {}
+    parser = argparse.ArgumentParser(description="Неинтерактивная генерация, решение и отрисовка лабиринтов.")
+    parser.add_argument('--params', metavar='FILE',
+                        help="JSON-объект с параметрами команды (ключи - имена флагов через '_'); '-' - "
+                             "стандартный ввод. Флаги командной строки имеют приоритет.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_generation(command: argparse.ArgumentParser) -> None:
+        command.add_argument('--algorithm', choices=list(GENERATORS), default='kruskal', help="Алгоритм генерации.")
+        command.add_argument('--height', type=int, help="Высота лабиринта.")
+        command.add_argument('--width', type=int, help="Ширина лабиринта.")
+        command.add_argument('--seed', type=int, help="Зерно генерации.")
+        command.add_argument('--origin', type=int, nargs=2, metavar=('ROW', 'COL'),
+                             help="Начальная клетка (только для backtracking).")
+
+    def add_solving(command: argparse.ArgumentParser, solver: Optional[str]) -> None:
+        command.add_argument('--solver', choices=list(SOLVERS), default=solver, help="Алгоритм решения.")
+        command.add_argument('--start', type=int, nargs=2, metavar=('ROW', 'COL'),
+                             help="Стартовая клетка (по умолчанию левый верхний угол).")
+        command.add_argument('--finish', type=int, nargs=2, metavar=('ROW', 'COL'),
+                             help="Финишная клетка (по умолчанию правый нижний угол).")
+
+    command = commands.add_parser('generate', help="Сгенерировать лабиринт.")
+    add_generation(command)
+    command.add_argument('--output', '-o', default='-',
+                         help="Файл лабиринта (формат Maze.save); '-' - компактное представление в стандартный вывод.")
+    command.set_defaults(handler=command_generate, **defaults.get('generate', {}))
+
+    command = commands.add_parser('solve', help="Найти путь в лабиринте.")
+    command.add_argument('--maze', default='-', help="Файл лабиринта; '-' - стандартный ввод.")
+    add_solving(command, 'bfs')
+    command.add_argument('--no-path', action='store_true', help="Выводить только признак и длину пути.")
+    command.set_defaults(handler=command_solve, **defaults.get('solve', {}))
+
+    command = commands.add_parser('render', help="Отрисовать лабиринт.")
+    command.add_argument('--maze', default='-', help="Файл лабиринта; '-' - стандартный ввод.")
+    add_solving(command, None)
+    command.set_defaults(handler=command_render, **defaults.get('render', {}))
+
+    command = commands.add_parser('bench', help="Замерить время генерации, решения и отрисовки.")
+    add_generation(command)
+    add_solving(command, 'bfs')
+    command.add_argument('--repeat', type=int, default=3, help="Число повторов.")
+    command.add_argument('--render', action='store_true', help="Замерять также отрисовку.")
+    command.set_defaults(handler=command_bench, **defaults.get('bench', {}))
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Разбирает аргументы командной строки. Если задан --params, параметры из JSON-объекта становятся значениями
+    по умолчанию команды, а флаги командной строки имеют приоритет над ними.
+
+    Args:
+        argv (Optional[List[str]]): Аргументы командной строки. По умолчанию sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: Аргументы команды.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.params is None:
+        return check_args(parser, args)
+
+    if args.params == '-':
+        params = json.load(sys.stdin)
+    else:
+        with open(args.params) as file:
+            params = json.load(file)
+    if not isinstance(params, dict):
+        parser.error("--params должен содержать JSON-объект.")
+    unknown = set(params) - set(vars(args)) | {'handler', 'command', 'params'} & set(params)
+    if unknown:
+        parser.error(f"неизвестные параметры команды {args.command}: {', '.join(sorted(unknown))}")
+
+    args = build_parser({args.command: params}).parse_args(argv)
+    if args.params == '-' and getattr(args, 'maze', None) == '-':
+        parser.error("стандартный ввод занят параметрами, лабиринт нужно передать файлом в --maze.")
+    return check_args(parser, args)
+
+
+def check_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> argparse.Namespace:
+    """
+    Проверяет значения аргументов, которые argparse не проверяет сам (в том числе заданные через --params).
+
+    Args:
+        parser (argparse.ArgumentParser): Разборщик аргументов, через который сообщается об ошибке.
+        args (argparse.Namespace): Аргументы команды.
+
+    Returns:
+        argparse.Namespace: Те же аргументы.
+    """
+    if getattr(args, 'repeat', 1) < 1:
+        parser.error(f"--repeat должен быть положительным, получено {args.repeat}.")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else list(argv))
+    try:
+        args.handler(args)
+    except (ImportError, OSError, ValueError) as error:
+        sys.stderr.write(f"{args.command}: {error}\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,13 @@
+from array import array
+
+
 class DisjointSetUnion:
     """
-    Реализация системы непересекающихся множеств с эвристикой сжатия путей и ранговой эвристикой.
-    Обеспечивает почти константное время работы O(a(n)) на запрос, где n - размер системы,
+    Реализация системы непересекающихся множеств с эвристикой сжатия путей (итеративное деление пути пополам)
+    и ранговой эвристикой. Обеспечивает почти константное время работы O(a(n)) на запрос, где n - размер системы,
     a - обратная функция Аккермана.
+
+    Родители и ранги хранятся в компактных массивах array, а не в списках Python-объектов.
     """
     def __init__(self, elements: int):
         """
@@ -11,11 +16,8 @@ class DisjointSetUnion:
         Args:
             elements (int): Количество элементов в системе.
         """
-        self._parent = [None] * elements
-        self._rank = [None] * elements
-
-        for i in range(elements):
-            self.init_set(i)
+        self._parent = array('i', range(elements))
+        self._rank = array('b', bytes(elements))
 
     def init_set(self, v: int) -> None:
         """
@@ -37,13 +39,13 @@ class DisjointSetUnion:
         Returns:
             int: Лидер множества.
         """
-        if v == self._parent[v]:
-            return v
+        parent = self._parent
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
 
-        self._parent[v] = self.get_set(self._parent[v])
-        return self._parent[v]
-
-    def unite_sets(self, v: int, u: int) -> None:
+    def unite_sets(self, v: int, u: int) -> bool:
         """
         Объединяет два указанных множества (множество, в котором находится элемент v,
         и множество, в котором находится элемент u)
@@ -51,14 +53,20 @@ class DisjointSetUnion:
         Args:
             v (int): Первый элемент.
             u (int): Второй элемент.
+
+        Returns:
+            bool: True, если элементы были в разных множествах и множества объединены, иначе False.
         """
         v = self.get_set(v)
         u = self.get_set(u)
 
-        if v != u:
-            if self._rank[v] < self._rank[u]:
-                v, u = u, v
+        if v == u:
+            return False
+
+        if self._rank[v] < self._rank[u]:
+            v, u = u, v
 
-            self._parent[u] = v
-            if self._rank[v] == self._rank[u]:
-                self._rank[v] += 1
+        self._parent[u] = v
+        if self._rank[v] == self._rank[u]:
+            self._rank[v] += 1
+        return True
@@ -1,14 +1,13 @@
 import random
 from abc import abstractmethod, ABC
-from typing import List, Tuple
+from array import array
+from typing import Iterator, Optional, Union
 
-from src.coordinate import Coordinate, delta, delta_right_down
+from src.cell import LEFT_WALL, UPPER_WALL, CAPTURED
+from src.coordinate import Coordinate, delta
 from src.disjoint_set_union import DisjointSetUnion
 from src.maze import Maze
-
-import sys
-
-sys.setrecursionlimit(10_000_000)
+from src.stats import Stats
 
 
 class IGenerator(ABC):
@@ -18,61 +17,119 @@ class IGenerator(ABC):
     """
     @staticmethod
     @abstractmethod
-    def generate(height: int, width: int) -> Maze:
+    def generate(height: int, width: int, seed: Union[int, random.Random, None] = None,
+                 stats: Optional[Stats] = None) -> Maze:
         """
         Генерирует лабиринт заданной высоты и ширины.
 
         Args:
             height (int): Высота лабиринта.
             width (int): Ширина лабиринта.
+            seed (Union[int, random.Random, None]): Зерно или собственный генератор случайных чисел. При одинаковом
+            зерне генерируется одинаковый лабиринт.
+            stats (Optional[Stats]): Статистика, в которую записываются счётчики и время фаз генерации.
 
         Returns:
             Maze: Сгенерированный лабиринт.
         """
         pass
 
+    @staticmethod
+    def make_random(seed: Union[int, random.Random, None] = None) -> random.Random:
+        """
+        Возвращает отдельный генератор случайных чисел для одной генерации, чтобы генерации не делили
+        глобальное состояние модуля random (в том числе в разных потоках).
+
+        Args:
+            seed (Union[int, random.Random, None]): Зерно, готовый генератор (возвращается как есть) или None
+            для генератора, инициализированного из системного источника случайности.
+
+        Returns:
+            random.Random: Генератор случайных чисел.
+        """
+        if isinstance(seed, random.Random):
+            return seed
+        return random.Random(seed)
+
 
 class BacktrackGenerator(IGenerator):
     """
-    Генератор лабиринта, использующий алгоритм рекурсивного бэктрекинга.
+    Генератор лабиринта, использующий алгоритм бэктрекинга (рандомизированный поиск в глубину).
     """
     @staticmethod
-    def recursive_backtrack(cur: Coordinate, maze: Maze):
+    def iterative_backtrack(start: Coordinate, maze: Maze, rng: random.Random) -> int:
         """
-        Рекурсивный бэктрекинг для генерации лабиринта.
+        Бэктрекинг для генерации лабиринта на явном стеке вместо рекурсии.
+
+        На каждом шаге стека хранятся смещение клетки в буфере карты и ещё не рассмотренные направления выхода из неё,
+        упакованные по 2 бита в одно число (старший единичный бит - признак конца), поэтому глубина обхода ограничена
+        только памятью, а не стеком интерпретатора. Порядок обращений к генератору случайных чисел совпадает с
+        рекурсивной версией алгоритма, так что распределение лабиринтов остаётся прежним.
 
         Args:
-            cur (Coordinate): Текущая клетка.
+            start (Coordinate): Клетка, с которой начинается обход.
             maze (Maze): Лабиринт.
-        """
-        maze.update_cell(cur, captured=True)
-        possibilities = []
+            rng (random.Random): Генератор случайных чисел.
 
-        for d in delta:
-            neighbor = Coordinate(cur.row + d[0], cur.col + d[1])
-            if maze.coordinate_inside_map(neighbor, consider_auxiliary_area=False):
-                possibilities.append(neighbor)
+        Returns:
+            int: Наибольшая глубина стека за время обхода.
+        """
+        buffer = maze.buffer
+        map_width = maze.map_width
+        height, width = maze.height, maze.width
+        offsets = [d[0] * map_width + d[1] for d in delta]
+
+        stack_cells = array('q')
+        stack_moves = array('i')
+        peak = 0
+
+        def enter(index: int) -> None:
+            nonlocal peak
+            buffer[index] |= CAPTURED
+            row, col = divmod(index, map_width)
+            moves = [k for k, d in enumerate(delta) if 1 <= row + d[0] <= height and 1 <= col + d[1] <= width]
+            rng.shuffle(moves)
+
+            packed = 1
+            for move in reversed(moves):
+                packed = (packed << 2) | move
+            stack_cells.append(index)
+            stack_moves.append(packed)
+            peak = max(peak, len(stack_cells))
+
+        enter(maze.index(start))
+        while stack_cells:
+            moves = stack_moves[-1]
+            if moves == 1:
+                stack_cells.pop()
+                stack_moves.pop()
+                continue
 
-        random.shuffle(possibilities)
-        for neighbor in possibilities:
-            if maze.get_cell(neighbor).captured:
+            stack_moves[-1] = moves >> 2
+            move = moves & 3
+            cur = stack_cells[-1]
+            neighbor = cur + offsets[move]
+            if buffer[neighbor] & CAPTURED:
                 continue
 
-            if neighbor.row < cur.row:
-                maze.update_cell(cur, upper_wall=False)
-            if neighbor.row > cur.row:
-                maze.update_cell(neighbor, upper_wall=False)
-            if neighbor.col < cur.col:
-                maze.update_cell(cur, left_wall=False)
-            if neighbor.col > cur.col:
-                maze.update_cell(neighbor, left_wall=False)
+            if move == 0:
+                buffer[neighbor] &= ~LEFT_WALL
+            elif move == 1:
+                buffer[neighbor] &= ~UPPER_WALL
+            elif move == 2:
+                buffer[cur] &= ~LEFT_WALL
+            else:
+                buffer[cur] &= ~UPPER_WALL
+
+            enter(neighbor)
 
-            BacktrackGenerator.recursive_backtrack(neighbor, maze)
+        return peak
 
     default_start = Coordinate(1, 1)
 
     @staticmethod
-    def generate(height: int, width: int, start: Coordinate = default_start) -> Maze:
+    def generate(height: int, width: int, start: Optional[Coordinate] = default_start,
+                 seed: Union[int, random.Random, None] = None, stats: Optional[Stats] = None) -> Maze:
         """
         Генерация лабиринта методом бэктрекинга.
 
@@ -80,6 +137,8 @@ class BacktrackGenerator(IGenerator):
             height (int): Высота лабиринта.
             width (int): Ширина лабиринта.
             start (Coordinate): Точка запуска бэктрекинга. По умолчанию (1, 1).
+            seed (Union[int, random.Random, None]): Зерно или собственный генератор случайных чисел.
+            stats (Optional[Stats]): Статистика генерации.
 
         Returns:
             Maze: Сгенерированный лабиринт.
@@ -87,10 +146,17 @@ class BacktrackGenerator(IGenerator):
         if start is None:
             start = BacktrackGenerator.default_start
 
+        stats = Stats.ensure(stats)
+        stats.begin()
         maze = Maze(height, width)
 
         maze.reset_captured()
-        BacktrackGenerator.recursive_backtrack(start, maze)
+        stats.lap('reset')
+        peak = BacktrackGenerator.iterative_backtrack(start, maze, IGenerator.make_random(seed))
+        stats.lap('generate')
+        # Обход посещает все клетки и из каждой один раз пробует каждого соседа внутри лабиринта.
+        stats.record(nodes_expanded=height * width, walls_checked=2 * (height * (width - 1) + width * (height - 1)),
+                     frontier=peak)
         return maze
 
 
@@ -99,68 +165,154 @@ class KruskalGenerator(IGenerator):
    Генератор лабиринта, использующий алгоритм Краскала.
    """
     @staticmethod
-    def gen_neighbors_pairs(maze: Maze) -> List[Tuple[Coordinate, Coordinate]]:
+    def gen_edges(height: int, width: int) -> array:
         """
-        Генерирует список пар соседних ячеек лабиринта.
+        Генерирует номера всех внутренних стен лабиринта. Клетка (row, col) рабочей части получает номер
+        k = (row - 1) * width + (col - 1), её правая стена - номер 2k, нижняя - 2k + 1.
 
         Args:
-            maze (Maze): Лабиринт.
+            height (int): Высота лабиринта.
+            width (int): Ширина лабиринта.
 
         Returns:
-            List[Tuple[Coordinate, Coordinate]]: Список пар соседних ячеек.
+            array: Массив номеров стен.
         """
-        neighbors = []
-        for i in range(1, maze.height + 1):
-            for j in range(1, maze.width + 1):
-                cur = Coordinate(i, j)
-                for d in delta_right_down:
-                    neighbor = Coordinate(cur.row + d[0], cur.col + d[1])
-                    if maze.coordinate_inside_map(neighbor):
-                        neighbors.append((cur, neighbor))
-
-        return neighbors
+        edges = array('q' if 2 * height * width >= 2 ** 31 else 'i')
+        for row in range(height):
+            begin = 2 * row * width
+            edges.extend(range(begin, begin + 2 * (width - 1), 2))
+            if row + 1 < height:
+                edges.extend(range(begin + 1, begin + 2 * width, 2))
+        return edges
 
     @staticmethod
-    def get_coord_index(coord: Coordinate, maze: Maze):
+    def generate(height: int, width: int, seed: Union[int, random.Random, None] = None,
+                 stats: Optional[Stats] = None) -> Maze:
         """
-        Преобразует координаты клетки в одно число - индекс для использования в DSU.
+        Генерация лабиринта методом Краскала.
 
         Args:
-            coord (Coordinate): Координата клетки.
-            maze (Maze): Лабиринт.
+            height (int): Высота лабиринта.
+            width (int): Ширина лабиринта.
+            seed (Union[int, random.Random, None]): Зерно или собственный генератор случайных чисел.
+            stats (Optional[Stats]): Статистика генерации.
 
         Returns:
-            int: Индекс клетки.
+            Maze: Сгенерированный лабиринт.
         """
-        return (coord.col - 1) * maze.height + (coord.row - 1)
+        stats = Stats.ensure(stats)
+        stats.begin()
+        maze = Maze(height, width)
+        dsu = DisjointSetUnion(height * width)
+        buffer = maze.buffer
+        map_width = maze.map_width
 
+        edges = KruskalGenerator.gen_edges(height, width)
+        IGenerator.make_random(seed).shuffle(edges)
+        stats.lap('reset')
+
+        for edge in edges:
+            cur = edge >> 1
+            neighbor = cur + width if edge & 1 else cur + 1
+            if not dsu.unite_sets(cur, neighbor):
+                continue
+
+            row, col = divmod(neighbor, width)
+            if edge & 1:
+                buffer[(row + 1) * map_width + col + 1] &= ~UPPER_WALL
+            else:
+                buffer[(row + 1) * map_width + col + 1] &= ~LEFT_WALL
+        stats.lap('generate')
+
+        stats.record(nodes_expanded=height * width, walls_checked=len(edges))
+        return maze
+
+
+class EllerGenerator(IGenerator):
+    """
+    Генератор лабиринта, использующий алгоритм Эллера: идеальный лабиринт строится построчно, и в памяти хранятся
+    только метки множеств клеток текущей строки, поэтому расход памяти O(width) не зависит от высоты.
+    """
     @staticmethod
-    def generate(height: int, width: int) -> Maze:
+    def iter_rows(height: int, width: int, seed: Union[int, random.Random, None] = None) -> Iterator[bytes]:
         """
-        Генерация лабиринта методом Краскала.
+        Последовательно генерирует строки лабиринта в формате Maze.buffer, начиная с верхней вспомогательной строки
+        и заканчивая нижней. Строки можно сразу записывать на диск или передавать в
+        ConsoleRenderer.iter_lines_from_rows, не собирая лабиринт целиком.
 
         Args:
             height (int): Высота лабиринта.
             width (int): Ширина лабиринта.
+            seed (Union[int, random.Random, None]): Зерно или собственный генератор случайных чисел.
 
-        Returns:
-            Maze: Сгенерированный лабиринт.
+        Yields:
+            bytes: Очередная строка карты длины width + 2.
         """
-        maze = Maze(height, width)
-        dsu = DisjointSetUnion(height * width)
+        rng = IGenerator.make_random(seed)
+        yield bytes([CAPTURED]) * (width + 2)
+
+        labels = list(range(width))
+        open_above = bytearray(width)
+        for row in range(height):
+            dsu = DisjointSetUnion(width)
+            first = {}
+            for col, label in enumerate(labels):
+                if label in first:
+                    dsu.unite_sets(first[label], col)
+                else:
+                    first[label] = col
+
+            cells = bytearray([CAPTURED]) + bytearray([LEFT_WALL | UPPER_WALL]) * width + \
+                bytearray([LEFT_WALL | CAPTURED])
+            if row > 0:
+                for col in range(width):
+                    if open_above[col]:
+                        cells[col + 1] &= ~UPPER_WALL
+
+            last = row == height - 1
+            for col in range(width - 1):
+                if (last or rng.random() < 0.5) and dsu.unite_sets(col, col + 1):
+                    cells[col + 2] &= ~LEFT_WALL
+            yield bytes(cells)
+
+            if last:
+                break
+
+            groups = {}
+            for col in range(width):
+                groups.setdefault(dsu.get_set(col), []).append(col)
+
+            open_above = bytearray(width)
+            labels = [width + col for col in range(width)]
+            for root, members in groups.items():
+                down = [col for col in members if rng.random() < 0.5]
+                if not down:
+                    down = [rng.choice(members)]
+                for col in down:
+                    open_above[col] = 1
+                    labels[col] = root
+
+        yield bytes([CAPTURED]) + bytes([UPPER_WALL | CAPTURED]) * width + bytes([CAPTURED])
 
-        neighbors_pairs = KruskalGenerator.gen_neighbors_pairs(maze)
-        random.shuffle(neighbors_pairs)
-
-        for cur, neighbor in neighbors_pairs:
-            v = KruskalGenerator.get_coord_index(cur, maze)
-            u = KruskalGenerator.get_coord_index(neighbor, maze)
+    @staticmethod
+    def generate(height: int, width: int, seed: Union[int, random.Random, None] = None,
+                 stats: Optional[Stats] = None) -> Maze:
+        """
+        Генерация лабиринта алгоритмом Эллера со сборкой строк в обычный Maze.
 
-            if dsu.get_set(v) != dsu.get_set(u):
-                dsu.unite_sets(v, u)
-                if neighbor.row > cur.row:
-                    maze.update_cell(neighbor, upper_wall=False)
-                if neighbor.col > cur.col:
-                    maze.update_cell(neighbor, left_wall=False)
+        Args:
+            height (int): Высота лабиринта.
+            width (int): Ширина лабиринта.
+            seed (Union[int, random.Random, None]): Зерно или собственный генератор случайных чисел.
+            stats (Optional[Stats]): Статистика генерации.
 
+        Returns:
+            Maze: Сгенерированный лабиринт.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        maze = Maze.from_buffer(height, width, bytearray(b''.join(EllerGenerator.iter_rows(height, width, seed))))
+        stats.lap('generate')
+        # В памяти алгоритма одновременно находится только одна строка клеток.
+        stats.record(nodes_expanded=height * width, walls_checked=2 * height * width - height - width, frontier=width)
         return maze
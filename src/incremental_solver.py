@@ -0,0 +1,208 @@
+from array import array
+from heapq import heappop, heappush
+from typing import List, Optional, Tuple
+
+from src.coordinate import Coordinate
+from src.maze import Maze
+from src.solver import passage_steps
+from src.stats import Stats
+
+# Расстояние до недостижимой клетки. Значение заведомо больше длины любого пути и помещается в array('i').
+INFINITY = 1 << 30
+
+
+class LifelongPlanningAStarSolver:
+    """
+    Инкрементальный поиск кратчайшего пути алгоритмом Lifelong Planning A* (LPA*), привязанный к лабиринту
+    и паре старт-финиш.
+
+    Решатель подписывается на изменения стен лабиринта (Maze.add_listener) и после каждого изменения
+    пересчитывает оценки только у клеток, затронутых изменённой стеной. Следующий вызов solve раскрывает лишь
+    клетки, чьё расстояние от старта действительно изменилось, поэтому время ответа после правки пропорционально
+    размеру изменения, а не размеру лабиринта. Для каждой клетки хранятся текущее расстояние g и его одношаговая
+    оценка rhs по соседям, а в очереди с приоритетами лежат клетки, у которых они не совпадают.
+    """
+    def __init__(self, maze: Maze, start: Coordinate, finish: Coordinate):
+        """
+        Инициализация решателя и подписка на изменения лабиринта.
+
+        Args:
+            maze (Maze): Лабиринт.
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+        """
+        self._maze = maze
+        self._start = start
+        self._finish = finish
+        self._source = maze.index(start)
+        self._target = maze.index(finish)
+        self._steps = passage_steps(maze)
+
+        size = maze.map_height * maze.map_width
+        self._g = array('i', [INFINITY]) * size
+        self._rhs = array('i', [INFINITY]) * size
+        self._queued = {}
+        self._heap = []
+        self._expanded = 0
+
+        self._rhs[self._source] = 0
+        self._push(self._source)
+        maze.add_listener(self._on_wall_changed)
+
+    @property
+    def expanded(self) -> int:
+        """
+        Возвращает число клеток, раскрытых последним вызовом solve.
+
+        Returns:
+            int: Число раскрытых клеток.
+        """
+        return self._expanded
+
+    def close(self) -> None:
+        """
+        Отписывает решатель от изменений лабиринта.
+        """
+        self._maze.remove_listener(self._on_wall_changed)
+
+    def _heuristic(self, index: int) -> int:
+        """
+        Манхэттенское расстояние от клетки до финиша.
+
+        Args:
+            index (int): Смещение клетки.
+
+        Returns:
+            int: Оценка оставшегося пути.
+        """
+        row, col = divmod(index, self._maze.map_width)
+        return abs(row - self._finish.row) + abs(col - self._finish.col)
+
+    def _key(self, index: int) -> Tuple[int, int]:
+        """
+        Вычисляет приоритет клетки в очереди.
+
+        Args:
+            index (int): Смещение клетки.
+
+        Returns:
+            Tuple[int, int]: Приоритет LPA*: (min(g, rhs) + h, min(g, rhs)).
+        """
+        best = min(self._g[index], self._rhs[index])
+        return best + self._heuristic(index), best
+
+    def _push(self, index: int) -> None:
+        """
+        Ставит клетку в очередь с актуальным приоритетом. Прежние записи клетки в куче не удаляются, а считаются
+        устаревшими, если их приоритет не совпадает с записанным в _queued.
+
+        Args:
+            index (int): Смещение клетки.
+        """
+        key = self._key(index)
+        self._queued[index] = key
+        heappush(self._heap, (key[0], key[1], index))
+
+    def _update(self, index: int) -> None:
+        """
+        Пересчитывает rhs клетки по её соседям и ставит клетку в очередь, если g и rhs расходятся.
+
+        Args:
+            index (int): Смещение клетки.
+        """
+        if index != self._source:
+            mask = self._maze.passage_mask(index)
+            g = self._g
+            best = INFINITY
+            for bit, step in self._steps:
+                if mask & bit and g[index + step] + 1 < best:
+                    best = g[index + step] + 1
+            self._rhs[index] = best
+
+        self._queued.pop(index, None)
+        if self._g[index] != self._rhs[index]:
+            self._push(index)
+
+    def _on_wall_changed(self, maze: Maze, coordinate: Coordinate) -> None:
+        """
+        Обработчик изменения левой или верхней стены клетки: пересчитывает оценки клетки и её соседей слева
+        и сверху, с которыми эти стены её разделяют.
+
+        Args:
+            maze (Maze): Изменённый лабиринт.
+            coordinate (Coordinate): Клетка, у которой изменились стены.
+        """
+        for cell in (coordinate, Coordinate(coordinate.row, coordinate.col - 1),
+                     Coordinate(coordinate.row - 1, coordinate.col)):
+            if maze.coordinate_inside_map(cell):
+                self._update(maze.index(cell))
+
+    def _top_key(self) -> Tuple[int, int]:
+        """
+        Возвращает наименьший актуальный приоритет в очереди, удаляя устаревшие записи с вершины кучи.
+
+        Returns:
+            Tuple[int, int]: Наименьший приоритет или (INFINITY, INFINITY), если очередь пуста.
+        """
+        heap = self._heap
+        while heap:
+            first, second, index = heap[0]
+            if self._queued.get(index) == (first, second):
+                return first, second
+            heappop(heap)
+        return INFINITY, INFINITY
+
+    def _compute(self) -> None:
+        """
+        Раскрывает клетки очереди, пока расстояние до финиша не станет согласованным.
+        """
+        g, rhs, steps = self._g, self._rhs, self._steps
+        target = self._target
+        self._expanded = 0
+
+        while self._top_key() < self._key(target) or g[target] != rhs[target]:
+            if not self._queued:
+                break
+            _, _, cur = heappop(self._heap)
+            del self._queued[cur]
+            self._expanded += 1
+
+            mask = self._maze.passage_mask(cur)
+            if g[cur] > rhs[cur]:
+                g[cur] = rhs[cur]
+            else:
+                g[cur] = INFINITY
+                self._update(cur)
+            for bit, step in steps:
+                if mask & bit:
+                    self._update(cur + step)
+
+    def solve(self, stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
+        """
+        Возвращает кратчайший путь с учётом всех изменений лабиринта с момента предыдущего вызова.
+
+        Args:
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и кратчайший путь.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        self._compute()
+        stats.lap('search')
+        stats.record(nodes_expanded=self._expanded, walls_checked=4 * self._expanded, frontier=len(self._queued))
+
+        g = self._g
+        if g[self._target] >= INFINITY:
+            return False, []
+
+        path = [self._target]
+        cur = self._target
+        while cur != self._source:
+            mask = self._maze.passage_mask(cur)
+            cur = min((cur + step for bit, step in self._steps if mask & bit), key=g.__getitem__)
+            path.append(cur)
+        path.reverse()
+        stats.lap('path')
+        return True, [self._maze.coordinate(index) for index in path]
@@ -1,14 +1,42 @@
+import argparse
 import logging
+import sys
+from typing import List, Optional
 
-from src.user_interaction import UserInteraction
+from src import cli
 
 logging.basicConfig()
 logging.getLogger().setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def main() -> None:
-    UserInteraction.read_maze_params_and_gen_maze()
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Команды неинтерактивного режима обрабатываются src.cli без загрузки интерактивного интерфейса и алгоритмов.
+    if argv and argv[0] in cli.COMMANDS + ('--params',):
+        sys.exit(cli.main(argv))
+
+    from src.stats import Stats, profiled
+    from src.user_interaction import UserInteraction
+
+    parser = argparse.ArgumentParser(description="Генерация, решение и отрисовка лабиринтов. Неинтерактивные команды: "
+                                                 f"{', '.join(cli.COMMANDS)} (подробнее: python -m src.cli --help).")
+    parser.add_argument('--stats', action='store_true',
+                        help="Собрать счётчики и время фаз генерации, решения и отрисовки и вывести их в журнал.")
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='FILE',
+                        help="Выполнить запуск под cProfile, вывести самые затратные функции в журнал "
+                             "и сохранить pstats в FILE, если он указан.")
+    args = parser.parse_args(argv)
+
+    stats = Stats() if args.stats else None
+    if args.profile is not None:
+        with profiled(args.profile or None):
+            UserInteraction.read_maze_params_and_gen_maze(stats)
+    else:
+        UserInteraction.read_maze_params_and_gen_maze(stats)
+
+    if stats is not None:
+        stats.log(logger)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,62 @@
-from src.cell import Cell
+import hashlib
+import mmap
+import struct
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, Tuple
+
+from src.cell import Cell, CellView, LEFT_WALL, UPPER_WALL, CAPTURED
 from src.coordinate import Coordinate
 
+# Таблица для bytes.translate, сбрасывающая флаг блокировки во всех байтах строки.
+_CLEAR_CAPTURED = bytes(b & ~CAPTURED for b in range(256))
+# Таблица для bytes.translate, оставляющая в байтах только флаги стен.
+_WALLS_ONLY = bytes(b & (LEFT_WALL | UPPER_WALL) for b in range(256))
+
+# Заголовок компактного сериализованного представления: высота и ширина рабочей части лабиринта.
+_HEADER = struct.Struct('<II')
+
+# Заголовок файла лабиринта: сигнатура, версия формата, флаги, высота, ширина, алгоритм генерации, зерно.
+# Заголовок дополнен до 64 байт, за ним следует упакованная карта в формате Maze.buffer.
+_FILE_HEADER = struct.Struct('<4sHHII16sq24x')
+FILE_MAGIC = b'MAZE'
+FILE_VERSION = 1
+_FILE_HAS_SEED = 1
+
+# Биты маски проходов клетки: бит k установлен, если из клетки можно пройти в направлении delta[k].
+PASSAGE_RIGHT = 1
+PASSAGE_DOWN = 2
+PASSAGE_LEFT = 4
+PASSAGE_UP = 8
+
+# Таблицы для bytes.translate, превращающие флаги стен в биты маски проходов.
+_RIGHT_PASSAGE = bytes(0 if b & LEFT_WALL else PASSAGE_RIGHT for b in range(256))
+_DOWN_PASSAGE = bytes(0 if b & UPPER_WALL else PASSAGE_DOWN for b in range(256))
+_OWN_PASSAGES = bytes((0 if b & LEFT_WALL else PASSAGE_LEFT) | (0 if b & UPPER_WALL else PASSAGE_UP)
+                      for b in range(256))
+
+# Число клеток, для которых маски проходов вычисляются за один шаг. Временные данные шага занимают несколько
+# таких блоков, поэтому построение масок для большой карты не требует памяти, кратной размеру карты.
+_MASK_CHUNK_CELLS = 1 << 16
+
+
+@dataclass(frozen=True)
+class MazeFileHeader:
+    """
+    Заголовок файла лабиринта.
+
+    Атрибуты:
+        height (int): Высота рабочей части лабиринта.
+        width (int): Ширина рабочей части лабиринта.
+        algorithm (str): Алгоритм, которым был сгенерирован лабиринт (пустая строка, если неизвестен).
+        seed (Optional[int]): Зерно генерации, если известно.
+        version (int): Версия формата файла.
+    """
+    height: int
+    width: int
+    algorithm: str = ''
+    seed: Optional[int] = None
+    version: int = FILE_VERSION
+
 
 class Maze:
     def __init__(self, height: int, width: int, walls_inside: bool = True):
@@ -20,6 +76,11 @@ class Maze:
         self._map_height = height + 2
         self._map_width = width + 2
         self._map = None
+        self._version = 0
+        self._listeners = []
+        self._masks = None
+        self._masks_version = -1
+        self._mapped = None
         self.init_map(walls_inside)
 
     def init_map(self, walls_inside: bool) -> None:
@@ -27,23 +88,222 @@ class Maze:
         Инициализирует карту лабиринта с ячейками. Карта устроена так, что с каждой стороны есь полоска вспомогательных
         клеток, которые изначально помечаются заблокированными, чтобы при обходе рабочей части лабиринта не обрабатывать
         выходы за границы.
+
+        Карта хранится построчно в одном bytearray: ячейка (row, col) занимает байт со смещением
+        row * map_width + col, в котором упакованы флаги LEFT_WALL, UPPER_WALL и CAPTURED.
+        """
+        inside = LEFT_WALL | UPPER_WALL if walls_inside else 0
+
+        upper_row = bytes([CAPTURED]) * self._map_width
+        inner_row = bytes([CAPTURED]) + bytes([inside]) * self._width + bytes([LEFT_WALL | CAPTURED])
+        lower_row = bytes([CAPTURED]) + bytes([UPPER_WALL | CAPTURED]) * self._width + bytes([CAPTURED])
+
+        self._map = bytearray(upper_row + inner_row * self._height + lower_row)
+
+    @classmethod
+    def from_buffer(cls, height: int, width: int, buffer) -> 'Maze':
+        """
+        Создаёт лабиринт поверх готового буфера карты без копирования (bytearray, memoryview, mmap).
+
+        Args:
+            height (int): Высота рабочей части лабиринта.
+            width (int): Ширина рабочей части лабиринта.
+            buffer: Буфер размера (height + 2) * (width + 2) в формате Maze.buffer.
+
+        Returns:
+            Maze: Лабиринт, работающий непосредственно с переданным буфером.
+        """
+        if len(buffer) != (height + 2) * (width + 2):
+            raise ValueError(f"Размер буфера {len(buffer)} не соответствует лабиринту {height}x{width}.")
+
+        maze = cls.__new__(cls)
+        maze._height = height
+        maze._width = width
+        maze._map_height = height + 2
+        maze._map_width = width + 2
+        maze._map = buffer
+        maze._version = 0
+        maze._listeners = []
+        maze._masks = None
+        maze._masks_version = -1
+        maze._mapped = None
+        return maze
+
+    def to_bytes(self) -> bytes:
+        """
+        Сериализует лабиринт в компактное представление: заголовок с размерами и упакованная карта.
+
+        Returns:
+            bytes: Сериализованный лабиринт.
+        """
+        return _HEADER.pack(self._height, self._width) + bytes(self._map)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Maze':
+        """
+        Восстанавливает лабиринт из представления, полученного методом to_bytes.
+
+        Args:
+            data (bytes): Сериализованный лабиринт.
+
+        Returns:
+            Maze: Восстановленный лабиринт.
+        """
+        height, width = cls.read_size(data)
+        return cls.from_buffer(height, width, bytearray(data[_HEADER.size:]))
+
+    @staticmethod
+    def read_size(data: bytes) -> Tuple[int, int]:
+        """
+        Читает размеры лабиринта из заголовка представления to_bytes, не разбирая карту.
+
+        Args:
+            data (bytes): Сериализованный лабиринт.
+
+        Returns:
+            Tuple[int, int]: Высота и ширина рабочей части лабиринта.
+        """
+        return _HEADER.unpack_from(data)
+
+    def save(self, path: str, algorithm: str = '', seed: Optional[int] = None) -> None:
+        """
+        Сохраняет лабиринт в бинарный файл: 64-байтный заголовок (MazeFileHeader) и упакованная карта.
+
+        Args:
+            path (str): Путь к файлу.
+            algorithm (str): Название алгоритма генерации для заголовка (не длиннее 16 байт в UTF-8).
+            seed (Optional[int]): Зерно генерации для заголовка.
+        """
+        encoded_algorithm = algorithm.encode()
+        if len(encoded_algorithm) > 16:
+            raise ValueError(f"Название алгоритма '{algorithm}' длиннее 16 байт.")
+
+        header = _FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, _FILE_HAS_SEED if seed is not None else 0,
+                                   self._height, self._width, encoded_algorithm, seed if seed is not None else 0)
+        with open(path, 'wb') as file:
+            file.write(header)
+            file.write(self._map)
+
+    @staticmethod
+    def read_header(path: str) -> MazeFileHeader:
+        """
+        Читает и проверяет заголовок файла лабиринта.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Returns:
+            MazeFileHeader: Заголовок файла.
+        """
+        with open(path, 'rb') as file:
+            return Maze._parse_header(file.read(_FILE_HEADER.size))
+
+    @staticmethod
+    def _parse_header(data: bytes) -> MazeFileHeader:
+        """
+        Разбирает заголовок файла лабиринта.
+
+        Args:
+            data (bytes): Первые байты файла.
+
+        Returns:
+            MazeFileHeader: Заголовок файла.
+        """
+        if len(data) < _FILE_HEADER.size:
+            raise ValueError("Файл слишком короткий для файла лабиринта.")
+
+        magic, version, flags, height, width, algorithm, seed = _FILE_HEADER.unpack_from(data)
+        if magic != FILE_MAGIC:
+            raise ValueError("Файл не является файлом лабиринта.")
+        if version != FILE_VERSION:
+            raise ValueError(f"Неподдерживаемая версия формата файла лабиринта: {version}.")
+
+        return MazeFileHeader(height=height, width=width, algorithm=algorithm.rstrip(b'\0').decode(),
+                              seed=seed if flags & _FILE_HAS_SEED else None, version=version)
+
+    @staticmethod
+    def _check_file_size(header: MazeFileHeader, length: int) -> None:
+        """
+        Проверяет, что размер файла лабиринта совпадает с размером, записанным в заголовке.
+
+        Args:
+            header (MazeFileHeader): Заголовок файла.
+            length (int): Размер файла в байтах.
+        """
+        if length != _FILE_HEADER.size + (header.height + 2) * (header.width + 2):
+            raise ValueError(f"Размер файла не соответствует лабиринту {header.height}x{header.width}.")
+
+    @classmethod
+    def from_file_bytes(cls, data: bytes) -> 'Maze':
+        """
+        Восстанавливает лабиринт из содержимого файла, записанного методом save, с теми же проверками, что и load.
+        В отличие от load, карта копируется в память.
+
+        Args:
+            data (bytes): Содержимое файла лабиринта.
+
+        Returns:
+            Maze: Лабиринт.
+        """
+        header = cls._parse_header(data)
+        cls._check_file_size(header, len(data))
+        return cls.from_buffer(header.height, header.width, bytearray(data[_FILE_HEADER.size:]))
+
+    @classmethod
+    def load(cls, path: str, writable: bool = False) -> 'Maze':
+        """
+        Открывает лабиринт из файла, отображая его в память (mmap). Карта не читается целиком: ячейки подгружаются
+        операционной системой по мере обращения к ним, поэтому даже многогигабайтный лабиринт открывается сразу,
+        а check_wall и поиск в ширину (BreadthFirstSearchSolver.solve_in_place) работают непосредственно
+        с отображённым буфером, не строя масок проходов.
+
+        Args:
+            path (str): Путь к файлу.
+            writable (bool): True - изменения лабиринта записываются в файл, False - лабиринт открыт только для
+            чтения.
+
+        Returns:
+            Maze: Лабиринт поверх отображённого в память файла. Отображение закрывается методом close
+            (или при выходе из блока with).
         """
-        def create_cell(left_wall=False, upper_wall=False, captured=False) -> Cell:
-            return Cell(left_wall=left_wall, upper_wall=upper_wall, captured=captured)
+        with open(path, 'r+b' if writable else 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
 
-        self._map = [[create_cell(left_wall=walls_inside, upper_wall=walls_inside)
-                      for _ in range(self._map_width)] for _ in range(self._map_height)]
+        try:
+            header = cls._parse_header(mapped[:_FILE_HEADER.size])
+            cls._check_file_size(header, len(mapped))
+        except ValueError:
+            mapped.close()
+            raise
 
-        for x in range(self._map_height):
-            self.set_cell(Coordinate(x, 0), create_cell(captured=True))
-            self.set_cell(Coordinate(x, self._map_width - 1), create_cell(left_wall=True, captured=True))
+        maze = cls.from_buffer(header.height, header.width, memoryview(mapped)[_FILE_HEADER.size:])
+        maze._mapped = mapped
+        return maze
 
-        for y in range(self._map_width):
-            self.set_cell(Coordinate(0, y), create_cell(captured=True))
-            self.set_cell(Coordinate(self._map_height - 1, y), create_cell(upper_wall=True, captured=True))
+    def close(self) -> None:
+        """
+        Закрывает отображение файла, открытого через load. После закрытия лабиринт использовать нельзя.
+        Для лабиринтов в памяти метод ничего не делает.
+        """
+        if self._mapped is None:
+            return
+        self._masks = None
+        self._masks_version = -1
+        self._map.release()
+        self._mapped.close()
+        self._mapped = None
 
-        self.set_cell(Coordinate(self._map_height - 1, 0), create_cell(captured=True))
-        self.set_cell(Coordinate(self._map_height - 1, self._map_width - 1), create_cell(captured=True))
+    def __enter__(self) -> 'Maze':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __reduce__(self):
+        """
+        Передаёт лабиринт между процессами (pickle) в компактном виде to_bytes.
+        """
+        return Maze.from_bytes, (self.to_bytes(),)
 
     @property
     def height(self) -> int:
@@ -85,6 +345,96 @@ class Maze:
         """
         return self._map_width
 
+    @property
+    def version(self) -> int:
+        """
+        Возвращает номер версии лабиринта, который увеличивается при каждом изменении ячейки через set_cell
+        и update_cell. По нему кеши результатов решения узнают, что лабиринт изменился. Запись напрямую в buffer
+        или через представления ячеек из get_cell версию не меняет.
+
+        Returns:
+            int: Номер версии.
+        """
+        return self._version
+
+    def add_listener(self, listener: Callable[['Maze', Coordinate], None]) -> None:
+        """
+        Подписывает функцию на изменения стен. Она вызывается с лабиринтом и координатой клетки после того,
+        как set_cell или update_cell изменили левую или верхнюю стену этой клетки.
+
+        Args:
+            listener (Callable[[Maze, Coordinate], None]): Функция-обработчик.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[['Maze', Coordinate], None]) -> None:
+        """
+        Отписывает функцию от изменений стен.
+
+        Args:
+            listener (Callable[[Maze, Coordinate], None]): Ранее подписанная функция-обработчик.
+        """
+        self._listeners.remove(listener)
+
+    def _notify(self, coordinate: Coordinate, before: int, after: int) -> None:
+        """
+        Сообщает подписчикам об изменении стен клетки, если флаги стен действительно изменились.
+
+        Args:
+            coordinate (Coordinate): Координата изменённой клетки.
+            before (int): Флаги клетки до изменения.
+            after (int): Флаги клетки после изменения.
+        """
+        if (before ^ after) & (LEFT_WALL | UPPER_WALL):
+            for listener in list(self._listeners):
+                listener(self, coordinate)
+
+    @property
+    def buffer(self) -> bytearray:
+        """
+        Возвращает буфер, в котором построчно упакованы флаги всех ячеек карты (включая границы).
+
+        Returns:
+            bytearray: Буфер размера map_height * map_width.
+        """
+        return self._map
+
+    @property
+    def external_buffer(self) -> bool:
+        """
+        Проверяет, лежит ли карта во внешнем буфере (отображённом в память файле или разделяемой памяти),
+        а не в собственном bytearray лабиринта. Для таких лабиринтов решатели не строят копий карты
+        (см. BreadthFirstSearchSolver.solve_in_place).
+
+        Returns:
+            bool: True, если карта лежит во внешнем буфере.
+        """
+        return not isinstance(self._map, bytearray)
+
+    def index(self, coordinate: Coordinate) -> int:
+        """
+        Преобразует координату клетки в смещение в буфере карты.
+
+        Args:
+            coordinate (Coordinate): Координата клетки.
+
+        Returns:
+            int: Смещение клетки в буфере.
+        """
+        return coordinate.row * self._map_width + coordinate.col
+
+    def coordinate(self, index: int) -> Coordinate:
+        """
+        Преобразует смещение в буфере карты в координату клетки.
+
+        Args:
+            index (int): Смещение клетки в буфере.
+
+        Returns:
+            Coordinate: Координата клетки.
+        """
+        return Coordinate(*divmod(index, self._map_width))
+
     def coordinate_inside_map(self, coordinate: Coordinate, consider_auxiliary_area: bool = False) -> bool:
         """
         Проверяет, находятся ли заданные координаты внутри карты лабиринта.
@@ -111,10 +461,10 @@ class Maze:
             coordinate (Coordinate): Координаты ячейки.
 
         Returns:
-            Cell: Ячейка с заданными координатами.
+            Cell: Представление ячейки с заданными координатами, изменения которого сразу попадают в карту.
         """
         if self.coordinate_inside_map(coordinate, consider_auxiliary_area=True):
-            return self._map[coordinate.row][coordinate.col]
+            return CellView(self._map, self.index(coordinate))
 
     def set_cell(self, coordinate: Coordinate, cell: Cell) -> None:
         """
@@ -125,7 +475,12 @@ class Maze:
             cell (Cell): Новая ячейка для установки.
         """
         if self.coordinate_inside_map(coordinate, consider_auxiliary_area=True):
-            self._map[coordinate.row][coordinate.col] = cell
+            offset = self.index(coordinate)
+            before = self._map[offset]
+            self._map[offset] = cell.flags
+            self._version += 1
+            if self._listeners:
+                self._notify(coordinate, before, cell.flags)
 
     def update_cell(self, coordinate: Coordinate, left_wall: bool = None, upper_wall: bool = None,
                     captured: bool = None) -> None:
@@ -141,13 +496,15 @@ class Maze:
         if not self.coordinate_inside_map(coordinate, consider_auxiliary_area=True):
             return
 
-        cell = self.get_cell(coordinate)
-        if left_wall is not None:
-            cell._left_wall = left_wall
-        if upper_wall is not None:
-            cell._upper_wall = upper_wall
-        if captured is not None:
-            cell._captured = captured
+        offset = self.index(coordinate)
+        before = flags = self._map[offset]
+        for flag, value in ((LEFT_WALL, left_wall), (UPPER_WALL, upper_wall), (CAPTURED, captured)):
+            if value is not None:
+                flags = flags | flag if value else flags & ~flag
+        self._map[offset] = flags
+        self._version += 1
+        if self._listeners:
+            self._notify(coordinate, before, flags)
 
     def check_wall(self, cur: Coordinate, neighbor: Coordinate) -> bool:
         """
@@ -161,18 +518,121 @@ class Maze:
             bool: True, если между ячейками есть стена, иначе False.
         """
         if neighbor.row < cur.row:
-            return self.get_cell(cur).upper_wall
+            return bool(self._map[self.index(cur)] & UPPER_WALL)
         if neighbor.row > cur.row:
-            return self.get_cell(neighbor).upper_wall
+            return bool(self._map[self.index(neighbor)] & UPPER_WALL)
         if neighbor.col < cur.col:
-            return self.get_cell(cur).left_wall
+            return bool(self._map[self.index(cur)] & LEFT_WALL)
         if neighbor.col > cur.col:
-            return self.get_cell(neighbor).left_wall
+            return bool(self._map[self.index(neighbor)] & LEFT_WALL)
 
     def reset_captured(self) -> None:
         """
         Сбрасывает флаг блокировки для всех ячеек рабочей части карты.
         """
         for i in range(1, self._map_height - 1):
-            for j in range(1, self._map_width - 1):
-                self.update_cell(Coordinate(i, j), captured=False)
+            begin = i * self._map_width + 1
+            end = begin + self._width
+            self._map[begin:end] = bytes(self._map[begin:end]).translate(_CLEAR_CAPTURED)
+
+    def fingerprint(self) -> str:
+        """
+        Вычисляет отпечаток лабиринта - хеш размеров и карты стен (флаги блокировки не учитываются).
+        Лабиринты с одинаковыми стенами имеют одинаковый отпечаток, что позволяет кешировать их и результаты
+        их решения.
+
+        Returns:
+            str: Шестнадцатеричная строка хеша BLAKE2b.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._height.to_bytes(8, 'little'))
+        digest.update(self._width.to_bytes(8, 'little'))
+        digest.update(bytes(self._map).translate(_WALLS_ONLY))
+        return digest.hexdigest()
+
+    def iter_rows(self) -> Iterator[bytes]:
+        """
+        Последовательно выдаёт строки карты (включая вспомогательные) в упакованном виде.
+
+        Yields:
+            bytes: Флаги ячеек одной строки карты длины map_width.
+        """
+        for i in range(self._map_height):
+            yield bytes(self._map[i * self._map_width:(i + 1) * self._map_width])
+
+    def passage_mask(self, index: int) -> int:
+        """
+        Вычисляет маску проходов одной клетки рабочей части карты (см. passage_masks) без расчёта масок для всей
+        карты - для поисков, которые посещают лишь небольшую часть лабиринта.
+
+        Args:
+            index (int): Смещение клетки рабочей части карты в буфере.
+
+        Returns:
+            int: Маска проходов клетки.
+        """
+        row, col = divmod(index, self._map_width)
+        cell = self._map[index]
+        mask = 0
+        if col < self._width and not self._map[index + 1] & LEFT_WALL:
+            mask |= PASSAGE_RIGHT
+        if row < self._height and not self._map[index + self._map_width] & UPPER_WALL:
+            mask |= PASSAGE_DOWN
+        if col > 1 and not cell & LEFT_WALL:
+            mask |= PASSAGE_LEFT
+        if row > 1 and not cell & UPPER_WALL:
+            mask |= PASSAGE_UP
+        return mask
+
+    def passage_masks(self) -> bytes:
+        """
+        Вычисляет для всех клеток карты маски проходов: бит k маски установлен, если из клетки можно перейти
+        в соседнюю клетку в направлении delta[k] (между ними нет стены и соседняя клетка лежит в рабочей части карты).
+        У вспомогательных клеток маска нулевая.
+
+        Маски считаются блоками по нескольку строк через bytes.translate, без цикла по клеткам, прямо в заранее
+        выделенный буфер, и запоминаются до следующего изменения лабиринта (см. version), поэтому повторные поиски
+        по неизменному лабиринту не просматривают всю карту заново. Запись напрямую в buffer запомненные маски
+        не сбрасывает. Маски - это копия размера карты в памяти процесса (на время построения - две копии
+        и временные данные одного блока), поэтому для карт во внешнем буфере (Maze.external_buffer) поиск
+        в ширину обходится без них.
+
+        Returns:
+            bytes: Маски проходов размера map_height * map_width.
+        """
+        if self._masks_version == self._version:
+            return self._masks
+
+        size = len(self._map)
+        map_width = self._map_width
+        masks = bytearray(size)
+        step = max(1, _MASK_CHUNK_CELLS // map_width) * map_width
+        for begin in range(0, size, step):
+            end = min(begin + step, size)
+            count = end - begin
+            # Блок берётся вместе со следующей строкой: по ней определяются проходы вниз из последней строки блока.
+            data = bytes(self._map[begin:min(end + map_width, size)])
+            own = data[:count].translate(_OWN_PASSAGES)
+            right = data[1:count + 1].translate(_RIGHT_PASSAGE)
+            down = data[map_width:count + map_width].translate(_DOWN_PASSAGE)
+            combined = int.from_bytes(own, 'little') | int.from_bytes(right, 'little') | \
+                int.from_bytes(down, 'little')
+            masks[begin:end] = combined.to_bytes(count, 'little')
+
+        border_row = bytes(self._map_width)
+        masks[:self._map_width] = border_row
+        masks[size - self._map_width:] = border_row
+        for i in range(1, self._map_height - 1):
+            begin = i * self._map_width
+            masks[begin] = 0
+            masks[begin + self._map_width - 1] = 0
+            masks[begin + 1] &= ~PASSAGE_LEFT
+            masks[begin + self._width] &= ~PASSAGE_RIGHT
+
+        for i in range(1, self._width + 1):
+            masks[self._map_width + i] &= ~PASSAGE_UP
+            masks[self._height * self._map_width + i] &= ~PASSAGE_DOWN
+
+        self._masks = bytes(masks)
+        self._masks_version = self._version
+        return self._masks
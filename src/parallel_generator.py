@@ -0,0 +1,187 @@
+import os
+import random
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from src.cell import LEFT_WALL, UPPER_WALL
+from src.disjoint_set_union import DisjointSetUnion
+from src.generator import IGenerator, KruskalGenerator
+from src.maze import Maze
+from src.stats import Stats
+
+
+def generate_tile(generator: Type[IGenerator], height: int, width: int, seed: int) -> bytes:
+    """
+    Генерирует плитку в процессе-исполнителе.
+
+    Args:
+        generator (Type[IGenerator]): Генератор плитки.
+        height (int): Высота плитки.
+        width (int): Ширина плитки.
+        seed (int): Зерно плитки.
+
+    Returns:
+        bytes: Карта плитки в формате Maze.buffer.
+    """
+    return bytes(generator.generate(height, width, seed=seed).buffer)
+
+
+def generate_tiles(executor: Executor, generator: Type[IGenerator], tiles: Sequence[Tuple[int, int, int, int]],
+                   seeds: Sequence[int], window: int) -> Iterator[bytes]:
+    """
+    Генерирует плитки в исполнителе и выдаёт их карты в порядке плиток. В работе одновременно не больше window
+    плиток, поэтому в памяти не накапливаются карты всех плиток сразу.
+
+    Args:
+        executor (Executor): Исполнитель.
+        generator (Type[IGenerator]): Генератор плиток.
+        tiles (Sequence[Tuple[int, int, int, int]]): Плитки (первая строка, первый столбец, высота, ширина).
+        seeds (Sequence[int]): Зёрна плиток.
+        window (int): Наибольшее число одновременно генерируемых плиток.
+
+    Returns:
+        Iterator[bytes]: Карты плиток в формате Maze.buffer.
+    """
+    pending = deque()
+    for (_, _, rows, cols), seed in zip(tiles, seeds):
+        pending.append(executor.submit(generate_tile, generator, rows, cols, seed))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class ParallelTiledGenerator(IGenerator):
+    """
+    Параллельный генератор одного большого идеального лабиринта.
+
+    Лабиринт разбивается на прямоугольные плитки, каждая плитка генерируется как отдельный идеальный лабиринт
+    в процессе-исполнителе, после чего плитки сшиваются проходом Краскала только по рёбрам на границах плиток:
+    в системе непересекающихся множеств каждая плитка - один элемент, и граничная стена открывается, только если
+    она соединяет ещё не связанные плитки. Дерево плиток вместе с остовными деревьями внутри плиток даёт остовное
+    дерево всей сетки, то есть идеальный лабиринт. Границы плиток перебираются в случайном порядке, и на каждой
+    границе, соединяющей ещё не связанные плитки, открывается одна случайная стена, поэтому граничные стены
+    не приходится перечислять.
+
+    Гарантируется только, что лабиринт идеальный и для заданного зерна детерминирован: зёрна плиток и сшивки
+    выводятся из общего зерна, поэтому результат не зависит от числа процессов. Распределение лабиринтов
+    не совпадает с распределением KruskalGenerator на всей сетке: между соседними плитками не больше одного прохода.
+    """
+    @staticmethod
+    def generate(height: int, width: int, seed: Union[int, random.Random, None] = None,
+                 stats: Optional[Stats] = None, tile_height: int = 512, tile_width: int = 512,
+                 generator: Type[IGenerator] = KruskalGenerator, max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None) -> Maze:
+        """
+        Генерация лабиринта по плиткам в нескольких процессах.
+
+        Args:
+            height (int): Высота лабиринта.
+            width (int): Ширина лабиринта.
+            seed (Union[int, random.Random, None]): Зерно или собственный генератор случайных чисел.
+            stats (Optional[Stats]): Статистика генерации.
+            tile_height (int): Высота плитки.
+            tile_width (int): Ширина плитки.
+            generator (Type[IGenerator]): Генератор плиток.
+            max_workers (Optional[int]): Число процессов (не больше числа плиток). По умолчанию - число ядер.
+            executor (Optional[Executor]): Готовый исполнитель вместо собственного пула процессов.
+
+        Returns:
+            Maze: Сгенерированный лабиринт.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        rng = IGenerator.make_random(seed)
+        row_starts = list(range(0, height, tile_height))
+        col_starts = list(range(0, width, tile_width))
+
+        tiles = [(row_start, col_start, min(tile_height, height - row_start), min(tile_width, width - col_start))
+                 for row_start in row_starts for col_start in col_starts]
+        seeds = [rng.getrandbits(64) for _ in tiles]
+        maze = Maze(height, width)
+        stats.lap('reset')
+
+        workers = min(max_workers or os.cpu_count() or 1, len(tiles))
+        if executor is not None:
+            ParallelTiledGenerator.place_tiles(maze, tiles, generate_tiles(executor, generator, tiles, seeds,
+                                                                           2 * workers))
+        elif workers == 1:
+            ParallelTiledGenerator.place_tiles(maze, tiles, (generate_tile(generator, rows, cols, seed)
+                                                             for (_, _, rows, cols), seed in zip(tiles, seeds)))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                ParallelTiledGenerator.place_tiles(maze, tiles, generate_tiles(pool, generator, tiles, seeds,
+                                                                               2 * workers))
+        stats.lap('generate')
+
+        ParallelTiledGenerator.stitch(maze, row_starts, col_starts, rng)
+        stats.lap('stitch')
+
+        # Сшивка проверяет по одной граничной стене на каждую пару соседних плиток.
+        borders = len(row_starts) * (len(col_starts) - 1) + (len(row_starts) - 1) * len(col_starts)
+        stats.record(nodes_expanded=height * width, walls_checked=borders)
+        return maze
+
+    @staticmethod
+    def place_tiles(maze: Maze, tiles: Sequence[Tuple[int, int, int, int]], maps: Iterator[bytes]) -> None:
+        """
+        Копирует карты плиток в лабиринт по мере их получения.
+
+        Args:
+            maze (Maze): Лабиринт.
+            tiles (Sequence[Tuple[int, int, int, int]]): Плитки (первая строка, первый столбец, высота, ширина).
+            maps (Iterator[bytes]): Карты плиток в том же порядке, что и tiles.
+        """
+        buffer = maze.buffer
+        map_width = maze.map_width
+        for (row_start, col_start, rows, cols), tile in zip(tiles, maps):
+            tile_map_width = cols + 2
+            for row in range(1, rows + 1):
+                offset = (row_start + row) * map_width + col_start + 1
+                buffer[offset:offset + cols] = tile[row * tile_map_width + 1:row * tile_map_width + 1 + cols]
+
+    @staticmethod
+    def stitch(maze: Maze, row_starts: List[int], col_starts: List[int], rng: random.Random) -> List[int]:
+        """
+        Соединяет плитки в один идеальный лабиринт проходом Краскала по стенам на границах плиток.
+
+        Args:
+            maze (Maze): Лабиринт из несвязанных между собой идеальных плиток.
+            row_starts (List[int]): Первые строки плиток (от 0).
+            col_starts (List[int]): Первые столбцы плиток (от 0).
+            rng (random.Random): Генератор случайных чисел.
+
+        Returns:
+            List[int]: Смещения клеток, у которых открыта левая или верхняя стена.
+        """
+        tile_rows, tile_cols = len(row_starts), len(col_starts)
+        row_ends = row_starts[1:] + [maze.height]
+        col_ends = col_starts[1:] + [maze.width]
+
+        # Граница между соседними плитками: (плитка, соседняя плитка справа или снизу, признак нижней границы).
+        borders = [(i * tile_cols + j, i * tile_cols + j + 1, False)
+                   for i in range(tile_rows) for j in range(tile_cols - 1)]
+        borders += [(i * tile_cols + j, (i + 1) * tile_cols + j, True)
+                    for i in range(tile_rows - 1) for j in range(tile_cols)]
+        rng.shuffle(borders)
+
+        dsu = DisjointSetUnion(tile_rows * tile_cols)
+        buffer = maze.buffer
+        map_width = maze.map_width
+        passages = []
+        for tile, neighbor, vertical in borders:
+            if not dsu.unite_sets(tile, neighbor):
+                continue
+
+            i, j = divmod(neighbor, tile_cols)
+            if vertical:
+                col = rng.randrange(col_starts[j], col_ends[j])
+                index = (row_starts[i] + 1) * map_width + col + 1
+                buffer[index] &= ~UPPER_WALL
+            else:
+                row = rng.randrange(row_starts[i], row_ends[i])
+                index = (row + 1) * map_width + col_starts[j] + 1
+                buffer[index] &= ~LEFT_WALL
+            passages.append(index)
+        return passages
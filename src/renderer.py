@@ -1,9 +1,17 @@
+import sys
 from abc import abstractmethod, ABC
 from enum import StrEnum
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
 
+from src.cell import LEFT_WALL, UPPER_WALL
 from src.coordinate import Coordinate
 from src.maze import Maze
+from src.stats import Stats
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость, без неё используется отрисовка на чистом Python.
+    np = None
 
 
 class IRenderer(ABC):
@@ -39,6 +47,7 @@ class ConsoleRenderer(IRenderer):
     right_borders = ['╶', '─', '┌', '┬', '└', '┴', '├', '┼']
     upper_borders = ['╵', '└', '┘', '┴', '│', '├', '┤', '┼']
     lower_borders = ['╷', '┌', '┐', '┬', '│', '├', '┤', '┼']
+    no_right_borders = frozenset(borders) - frozenset(right_borders)
 
     @staticmethod
     def render(maze: Maze, path: List[Coordinate] = None) -> List[List[str]]:
@@ -66,6 +75,86 @@ class ConsoleRenderer(IRenderer):
 
         return full_repr_with_path
 
+    @staticmethod
+    def render_lines(maze: Maze, path: List[Coordinate] = None, stats: Optional[Stats] = None) -> List[str]:
+        """
+        Отрисовывает лабиринт с маршрутом в виде списка готовых строк. Если установлен NumPy, используется
+        векторизованная отрисовка (render_lines_numpy), иначе потоковая (iter_lines).
+
+        Args:
+            maze (Maze): Лабиринт, который нужно отобразить.
+            path (Optional[List[Coordinate]]): Список координат, представляющих путь.
+            stats (Optional[Stats]): Статистика, в которую записывается время отрисовки.
+
+        Returns:
+            List[str]: Строки изображения лабиринта.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        if np is not None:
+            lines = ConsoleRenderer.render_lines_numpy(maze, path)
+        else:
+            lines = list(ConsoleRenderer.iter_lines(maze, path))
+        stats.lap('render')
+        return lines
+
+    @staticmethod
+    def render_lines_numpy(maze: Maze, path: List[Coordinate] = None) -> List[str]:
+        """
+        Векторизованная отрисовка лабиринта на NumPy, дающая те же строки, что и render.
+
+        Индекс символа рамки (4 бита: вверх, вправо, вниз, влево) считается сразу для всей сетки из массивов стен
+        и переводится в символы через таблицу borders. Растяжение по горизонтали и вертикали выполняется
+        присваиванием в срезы с шагом, а каждая строка получается из непрерывного массива символов без поэлементной
+        склейки.
+
+        Args:
+            maze (Maze): Лабиринт, который нужно отобразить.
+            path (Optional[List[Coordinate]]): Список координат, представляющих путь.
+
+        Returns:
+            List[str]: Строки изображения лабиринта.
+        """
+        if np is None:
+            raise ImportError("Для векторизованной отрисовки необходим пакет numpy (poetry install --extras fast).")
+
+        height, width = maze.height, maze.width
+        flags = np.frombuffer(maze.buffer, dtype=np.uint8).reshape(maze.map_height, maze.map_width)
+        left = (flags & LEFT_WALL) != 0
+        upper = (flags & UPPER_WALL) != 0
+
+        if upper[1:height + 2, width + 1].any():
+            # Горизонтальная стена у правой вспомогательной колонки меняет длину строк в исходной отрисовке,
+            # такой нестандартный лабиринт отрисовывается обычным способом.
+            return [''.join(row) for row in ConsoleRenderer.render(maze, path)]
+
+        right = upper[1:height + 2, 1:width + 2]
+        code = (left[0:height + 1, 1:width + 2].astype(np.uint8) << 3) | (right.astype(np.uint8) << 2) | \
+            (left[1:height + 2, 1:width + 2].astype(np.uint8) << 1) | upper[1:height + 2, 0:width + 1]
+        borders = np.array(ConsoleRenderer.borders, dtype='<U1')
+
+        line_width = 4 * width + 1
+        full = np.full((2 * height + 1, line_width), ConsoleRenderer.Border.SPACE.value, dtype='<U1')
+
+        horizontal = full[0::2]
+        horizontal[:, 0::4] = borders[code]
+        spans = np.where(right[:, :width], ConsoleRenderer.Border.HORIZONTAL_LINE.value,
+                         ConsoleRenderer.Border.SPACE.value)
+        for shift in range(1, 4):
+            horizontal[:, shift::4] = spans
+
+        vertical = full[1::2]
+        vertical[:, 0::4] = np.where(left[1:height + 1, 1:width + 2], ConsoleRenderer.Border.VERTICAL_LINE.value,
+                                     ConsoleRenderer.Border.SPACE.value)
+
+        if path is not None and len(path) >= 2:
+            for coord in path[1:-1]:
+                vertical[coord.row - 1, (coord.col - 1) * 4 + 2] = ConsoleRenderer.CellContent.ROUTE_USUAL_CELL.value
+            vertical[path[0].row - 1, (path[0].col - 1) * 4 + 2] = ConsoleRenderer.CellContent.START.value
+            vertical[path[-1].row - 1, (path[-1].col - 1) * 4 + 2] = ConsoleRenderer.CellContent.FINISH.value
+
+        return full.view(f'<U{line_width}').ravel().tolist()
+
     @staticmethod
     def render_tiny(maze: Maze) -> List[List[str]]:
         """
@@ -154,7 +243,7 @@ class ConsoleRenderer(IRenderer):
             for y in range(len(narrow_repr[x])-1):
                 char = narrow_repr[x][y]
                 wide_repr[-1].append(char)
-                if char in list(set(ConsoleRenderer.borders) - set(ConsoleRenderer.right_borders)):
+                if char in ConsoleRenderer.no_right_borders:
                     wide_repr[-1].append(ConsoleRenderer.Border.SPACE)
                 else:
                     wide_repr[-1].append(ConsoleRenderer.Border.HORIZONTAL_LINE)
@@ -192,13 +281,135 @@ class ConsoleRenderer(IRenderer):
         return high_repr
 
     @staticmethod
-    def print_to_console(maze: Maze, path: List[Coordinate] = None) -> None:
+    def print_to_console(maze: Maze, path: List[Coordinate] = None, stats: Optional[Stats] = None) -> None:
         """
         Печатает лабиринт с заданным маршрутом в консоль.
 
         Args:
             maze (Maze): Лабиринт, который нужно напечатать.
             path (Optional[List[Coordinate]]): Путь, который нужно отобразить, если передан.
+            stats (Optional[Stats]): Статистика, в которую записывается время отрисовки.
+        """
+        ConsoleRenderer.write(maze, path, sys.stdout, stats=stats)
+
+    @staticmethod
+    def path_overlay(path: List[Coordinate] = None) -> Dict[int, Dict[int, str]]:
+        """
+        Строит таблицу символов маршрута по строкам лабиринта для наложения при потоковой отрисовке.
+
+        Args:
+            path (Optional[List[Coordinate]]): Список координат, представляющий маршрут.
+
+        Returns:
+            Dict[int, Dict[int, str]]: Для каждой строки лабиринта - символы маршрута по столбцам.
+        """
+        overlay = {}
+        if path is None or len(path) < 2:
+            return overlay
+
+        for coord in path[1:-1]:
+            overlay.setdefault(coord.row, {})[coord.col] = ConsoleRenderer.CellContent.ROUTE_USUAL_CELL
+        overlay.setdefault(path[0].row, {})[path[0].col] = ConsoleRenderer.CellContent.START
+        overlay.setdefault(path[-1].row, {})[path[-1].col] = ConsoleRenderer.CellContent.FINISH
+        return overlay
+
+    @staticmethod
+    def iter_lines(maze: Maze, path: List[Coordinate] = None) -> Iterator[str]:
+        """
+        Потоково отрисовывает лабиринт с маршрутом, выдавая готовые строки по одной.
+
+        Args:
+            maze (Maze): Лабиринт, который нужно отобразить.
+            path (Optional[List[Coordinate]]): Список координат, представляющий маршрут.
+
+        Yields:
+            str: Очередная строка изображения, совпадающая с соответствующей строкой render.
+        """
+        return ConsoleRenderer.iter_lines_from_rows(maze.iter_rows(), path)
+
+    @staticmethod
+    def iter_lines_from_rows(rows: Iterable[bytes], path: List[Coordinate] = None) -> Iterator[str]:
+        """
+        Потоково отрисовывает лабиринт, заданный последовательностью упакованных строк карты (с верхней
+        вспомогательной строки до нижней). В памяти одновременно находятся только две соседние строки карты,
+        поэтому расход памяти пропорционален ширине лабиринта, а не числу клеток.
+
+        Для каждой пары строк коды символов рамки (4 бита: вверх, вправо, вниз, влево) собираются операциями
+        над байтами, после чего строка изображения получается одним str.translate.
+
+        Args:
+            rows (Iterable[bytes]): Строки карты в формате Maze.buffer.
+            path (Optional[List[Coordinate]]): Список координат, представляющий маршрут.
+
+        Yields:
+            str: Очередная строка изображения.
+        """
+        up_codes = bytes(8 if b & LEFT_WALL else 0 for b in range(256))
+        own_codes = bytes((4 if b & UPPER_WALL else 0) | (2 if b & LEFT_WALL else 0) for b in range(256))
+        left_codes = bytes(1 if b & UPPER_WALL else 0 for b in range(256))
+        vertical_codes = bytes(1 if b & LEFT_WALL else 0 for b in range(256))
+
+        spans = {code: ConsoleRenderer.borders[code] + (ConsoleRenderer.Border.HORIZONTAL_LINE * 3 if code & 4 else
+                                                        ConsoleRenderer.Border.SPACE * 3) for code in range(16)}
+        walls = {0: ConsoleRenderer.Border.SPACE * 4, 1: ConsoleRenderer.Border.VERTICAL_LINE +
+                 ConsoleRenderer.Border.SPACE * 3}
+        overlay = ConsoleRenderer.path_overlay(path)
+
+        rows = iter(rows)
+        prev = next(rows)
+        pending = None
+        for row, cur in enumerate(rows, start=1):
+            if pending is not None:
+                yield pending
+
+            size = len(cur) - 1
+            codes = (int.from_bytes(prev[1:].translate(up_codes), 'little') |
+                     int.from_bytes(cur[1:].translate(own_codes), 'little') |
+                     int.from_bytes(cur[:-1].translate(left_codes), 'little')).to_bytes(size, 'little')
+            codes = codes.decode('latin-1')
+            yield codes[:-1].translate(spans) + ConsoleRenderer.borders[ord(codes[-1])]
+
+            vertical = cur[1:].translate(vertical_codes).decode('latin-1')
+            pending = vertical[:-1].translate(walls) + walls[ord(vertical[-1])][0]
+            if row in overlay:
+                chars = list(pending)
+                for col, char in overlay[row].items():
+                    chars[(col - 1) * 4 + 2] = char
+                pending = ''.join(chars)
+
+            prev = cur
+
+    @staticmethod
+    def write(maze: Maze, path: List[Coordinate] = None, stream: TextIO = None, chunk_size: int = 1 << 16,
+              stats: Optional[Stats] = None) -> None:
+        """
+        Потоково записывает изображение лабиринта с маршрутом в текстовый поток, накапливая строки в блоки
+        примерно по chunk_size символов.
+
+        Args:
+            maze (Maze): Лабиринт, который нужно отобразить.
+            path (Optional[List[Coordinate]]): Список координат, представляющий маршрут.
+            stream (Optional[TextIO]): Поток для записи. По умолчанию sys.stdout.
+            chunk_size (int): Примерный размер блока записи в символах.
+            stats (Optional[Stats]): Статистика, в которую записывается время отрисовки (вместе с записью в поток).
         """
-        output = ConsoleRenderer.render(maze, path)
-        [print(''.join(output[i])) for i in range(len(output))]
+        if stream is None:
+            stream = sys.stdout
+        stats = Stats.ensure(stats)
+        stats.begin()
+
+        chunk = []
+        buffered = 0
+        for line in ConsoleRenderer.iter_lines(maze, path):
+            chunk.append(line)
+            buffered += len(line) + 1
+            if buffered >= chunk_size:
+                chunk.append('')
+                stream.write('\n'.join(chunk))
+                chunk = []
+                buffered = 0
+
+        if chunk:
+            chunk.append('')
+            stream.write('\n'.join(chunk))
+        stats.lap('render')
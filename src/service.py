@@ -0,0 +1,572 @@
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from src.batch import GENERATORS, SOLVERS
+from src.coordinate import Coordinate
+from src.maze import Maze
+from src.renderer import ConsoleRenderer
+from src.solver import BreadthFirstSearchSolver
+
+logger = logging.getLogger(__name__)
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+           500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+def generate_job(algorithm: str, height: int, width: int, seed: Optional[int]) -> Tuple[str, bytes]:
+    """
+    Генерирует лабиринт в процессе-исполнителе.
+
+    Args:
+        algorithm (str): Алгоритм генерации (ключ GENERATORS).
+        height (int): Высота лабиринта.
+        width (int): Ширина лабиринта.
+        seed (Optional[int]): Зерно генерации.
+
+    Returns:
+        Tuple[str, bytes]: Отпечаток лабиринта и лабиринт в представлении Maze.to_bytes.
+    """
+    maze = GENERATORS[algorithm].generate(height, width, seed=seed)
+    return maze.fingerprint(), maze.to_bytes()
+
+
+def fingerprint_job(data: bytes) -> Tuple[str, int, int]:
+    """
+    Проверяет загруженный лабиринт и вычисляет его отпечаток в процессе-исполнителе.
+
+    Args:
+        data (bytes): Лабиринт в представлении Maze.to_bytes.
+
+    Returns:
+        Tuple[str, int, int]: Отпечаток, высота и ширина лабиринта.
+    """
+    try:
+        maze = Maze.from_bytes(data)
+    except Exception as error:
+        raise ValueError(f"Некорректное представление лабиринта: {error}")
+    return maze.fingerprint(), maze.height, maze.width
+
+
+def solve_job(data: bytes, solver: str, start: Tuple[int, int],
+              finishes: Sequence[Tuple[int, int]]) -> List[Tuple[bool, List[Tuple[int, int]]]]:
+    """
+    Решает лабиринт в процессе-исполнителе для одной стартовой и нескольких финишных клеток. Поиск в ширину
+    отвечает на все финиши одним обходом (BreadthFirstSearchSolver.solve_many), остальные решатели - по очереди.
+
+    Args:
+        data (bytes): Лабиринт в представлении Maze.to_bytes.
+        solver (str): Алгоритм решения (ключ SOLVERS).
+        start (Tuple[int, int]): Стартовая клетка.
+        finishes (Sequence[Tuple[int, int]]): Финишные клетки.
+
+    Returns:
+        List[Tuple[bool, List[Tuple[int, int]]]]: Для каждого финиша признак того, что путь найден, и путь.
+    """
+    maze = Maze.from_bytes(data)
+    start = Coordinate(*start)
+    finishes = [Coordinate(*finish) for finish in finishes]
+    if solver == 'bfs':
+        results = BreadthFirstSearchSolver.solve_many(maze, start, finishes)
+    else:
+        results = [SOLVERS[solver].solve(maze, start, finish) for finish in finishes]
+    return [(found, [(c.row, c.col) for c in path]) for found, path in results]
+
+
+def render_job(data: bytes, path: Sequence[Tuple[int, int]]) -> str:
+    """
+    Отрисовывает лабиринт с маршрутом в процессе-исполнителе.
+
+    Args:
+        data (bytes): Лабиринт в представлении Maze.to_bytes.
+        path (Sequence[Tuple[int, int]]): Маршрут.
+
+    Returns:
+        str: Изображение лабиринта.
+    """
+    maze = Maze.from_bytes(data)
+    return '\n'.join(ConsoleRenderer.iter_lines(maze, [Coordinate(*c) for c in path])) + '\n'
+
+
+class ServiceBusy(Exception):
+    """
+    Очередь заданий сервиса заполнена, запрос нужно повторить позже.
+    """
+    pass
+
+
+class RequestError(Exception):
+    """
+    Некорректный запрос к сервису.
+    """
+    def __init__(self, status: int, message: str):
+        """
+        Инициализация ошибки запроса.
+
+        Args:
+            status (int): HTTP-код ответа.
+            message (str): Описание ошибки.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class MazeService:
+    """
+    Локальный HTTP-сервис генерации, решения и отрисовки лабиринтов на asyncio без сторонних зависимостей.
+
+    Вычисления выполняются в пуле процессов. Задания попадают в ограниченную очередь, из которой их забирают
+    столько обработчиков, сколько процессов в пуле; если очередь заполнена, сервис отвечает 503, а лабиринты
+    больше max_cells клеток не генерируются. Разбор и отпечатки лабиринтов тоже вычисляются в пуле. Одновременные
+    запросы решения одного лабиринта с одной стартовой клеткой объединяются: пока задание ждёт в очереди, к нему
+    присоединяются новые финиши, и все они решаются одним обходом. Сгенерированные и загруженные лабиринты хранятся
+    в ограниченном LRU-реестре под своими отпечатками.
+
+    Точки входа (тела запросов - JSON, кроме POST /mazes):
+        POST /generate {"algorithm", "height", "width", "seed"} - {"maze": отпечаток, "height", "width"};
+            с заголовком Accept: application/octet-stream ответом будет сам лабиринт в формате Maze.to_bytes.
+        POST /mazes (тело - Maze.to_bytes) - регистрирует готовый лабиринт, ответ {"maze": отпечаток, ...}.
+        POST /solve {"maze", "start", "finish", "solver"} - {"found", "path"}.
+        POST /render {"maze", "path"} - изображение лабиринта (text/plain).
+        GET /stats - счётчики сервиса.
+    """
+    def __init__(self, max_workers: Optional[int] = None, queue_size: int = 64, max_mazes: int = 128,
+                 max_body: int = 64 << 20, max_cells: int = 64 << 20, executor: Optional[Executor] = None):
+        """
+        Инициализация сервиса.
+
+        Args:
+            max_workers (Optional[int]): Число процессов пула. По умолчанию - число ядер.
+            queue_size (int): Наибольшее число заданий, ожидающих исполнения.
+            max_mazes (int): Наибольшее число лабиринтов в реестре.
+            max_body (int): Наибольший размер тела запроса в байтах.
+            max_cells (int): Наибольшее число клеток генерируемого лабиринта.
+            executor (Optional[Executor]): Готовый пул исполнителей вместо собственного пула процессов.
+        """
+        self._own_executor = executor is None
+        if executor is None:
+            # Процессы пула создаются по мере поступления заданий, то есть при открытых соединениях клиентов.
+            # Созданные через fork процессы унаследовали бы сокеты соединений и не дали бы им закрыться,
+            # поэтому процессы запускаются через forkserver (или spawn, где его нет).
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
+        self._executor = executor
+        self._workers = max_workers or os.cpu_count() or 1
+        self._queue_size = queue_size
+        self._max_mazes = max_mazes
+        self._max_body = max_body
+        self._max_cells = max_cells
+
+        self._mazes = OrderedDict()
+        self._batches: Dict[Tuple[str, str, Tuple[int, int]], List[Tuple[Tuple[int, int], asyncio.Future]]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._server: Optional[asyncio.Server] = None
+        self._counters = {'requests': 0, 'rejected': 0, 'solve_requests': 0, 'solve_jobs': 0}
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """
+        Возвращает счётчики сервиса: число запросов, отклонённых из-за переполнения очереди, запросов решения
+        и фактически выполненных заданий решения (меньше запросов, если запросы объединялись).
+
+        Returns:
+            Dict[str, int]: Копия счётчиков.
+        """
+        return dict(self._counters)
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> int:
+        """
+        Запускает обработчики очереди и HTTP-сервер.
+
+        Args:
+            host (str): Адрес для прослушивания.
+            port (int): Порт (0 - любой свободный).
+
+        Returns:
+            int: Порт, который слушает сервер.
+        """
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
+        self._server = await asyncio.start_server(self._handle, host, port)
+        port = self._server.sockets[0].getsockname()[1]
+        logger.info("Сервис лабиринтов слушает %s:%d", host, port)
+        return port
+
+    async def serve_forever(self) -> None:
+        """
+        Обслуживает запросы до отмены.
+        """
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Останавливает сервер и обработчики и закрывает собственный пул процессов.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+    async def _worker(self) -> None:
+        """
+        Забирает задания из очереди и выполняет их в пуле процессов.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            job, future = await self._queue.get()
+            try:
+                function, args = job()
+                result = await loop.run_in_executor(self._executor, function, *args)
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    def _submit(self, job) -> asyncio.Future:
+        """
+        Ставит задание в очередь.
+
+        Args:
+            job: Функция без аргументов, которая в момент исполнения возвращает (функция для пула, аргументы).
+
+        Returns:
+            asyncio.Future: Результат задания.
+
+        Raises:
+            ServiceBusy: Если очередь заполнена.
+        """
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((job, future))
+        except asyncio.QueueFull:
+            self._counters['rejected'] += 1
+            raise ServiceBusy("Очередь заданий заполнена.")
+        return future
+
+    async def register(self, data: bytes) -> Tuple[str, int, int]:
+        """
+        Добавляет загруженный лабиринт в реестр. Разбор и отпечаток (хеш всей карты) вычисляются в пуле процессов,
+        чтобы большой лабиринт не останавливал цикл событий.
+
+        Args:
+            data (bytes): Лабиринт в представлении Maze.to_bytes.
+
+        Returns:
+            Tuple[str, int, int]: Отпечаток, высота и ширина лабиринта.
+        """
+        try:
+            key, height, width = await self._submit(lambda: (fingerprint_job, (data,)))
+        except ValueError as error:
+            raise RequestError(400, str(error))
+        self._store(key, data)
+        return key, height, width
+
+    def _store(self, key: str, data: bytes) -> None:
+        """
+        Сохраняет лабиринт в реестре, вытесняя давно использованные лабиринты сверх max_mazes.
+
+        Args:
+            key (str): Отпечаток лабиринта.
+            data (bytes): Лабиринт в представлении Maze.to_bytes.
+        """
+        self._mazes[key] = data
+        self._mazes.move_to_end(key)
+        while len(self._mazes) > self._max_mazes:
+            self._mazes.popitem(last=False)
+
+    def _maze_data(self, key: str) -> bytes:
+        """
+        Возвращает лабиринт из реестра.
+
+        Args:
+            key (str): Отпечаток лабиринта.
+
+        Returns:
+            bytes: Лабиринт в представлении Maze.to_bytes.
+        """
+        data = self._mazes.get(key)
+        if data is None:
+            raise RequestError(404, f"Лабиринт {key} не найден.")
+        self._mazes.move_to_end(key)
+        return data
+
+    async def generate(self, algorithm: str, height: int, width: int, seed: Optional[int] = None) -> Tuple[str, bytes]:
+        """
+        Генерирует лабиринт и добавляет его в реестр.
+
+        Args:
+            algorithm (str): Алгоритм генерации.
+            height (int): Высота лабиринта.
+            width (int): Ширина лабиринта.
+            seed (Optional[int]): Зерно генерации.
+
+        Returns:
+            Tuple[str, bytes]: Отпечаток лабиринта и его представление Maze.to_bytes.
+        """
+        if algorithm not in GENERATORS:
+            raise RequestError(400, f"Неизвестный алгоритм генерации '{algorithm}'.")
+        if height < 1 or width < 1 or height * width < 2:
+            raise RequestError(400, f"Некорректные размеры лабиринта {height}x{width}.")
+        if height * width > self._max_cells:
+            raise RequestError(400, f"Лабиринт {height}x{width} больше допустимых {self._max_cells} клеток.")
+        key, data = await self._submit(lambda: (generate_job, (algorithm, height, width, seed)))
+        self._store(key, data)
+        return key, data
+
+    async def solve(self, key: str, start: Tuple[int, int], finish: Tuple[int, int],
+                    solver: str = 'bfs') -> Tuple[bool, List[Tuple[int, int]]]:
+        """
+        Решает лабиринт из реестра. Запросы с тем же лабиринтом, решателем и стартом, пришедшие до начала
+        исполнения задания, решаются вместе с ним.
+
+        Args:
+            key (str): Отпечаток лабиринта.
+            start (Tuple[int, int]): Стартовая клетка.
+            finish (Tuple[int, int]): Финишная клетка.
+            solver (str): Алгоритм решения.
+
+        Returns:
+            Tuple[bool, List[Tuple[int, int]]]: Признак того, что путь найден, и путь.
+        """
+        if solver not in SOLVERS:
+            raise RequestError(400, f"Неизвестный алгоритм решения '{solver}'.")
+        data = self._maze_data(key)
+        # Границы проверяются по заголовку: карта разбирается только в процессе-исполнителе.
+        height, width = Maze.read_size(data)
+        for row, col in (start, finish):
+            if not (1 <= row <= height and 1 <= col <= width):
+                raise RequestError(400, f"Координата ({row}, {col}) вне лабиринта.")
+
+        self._counters['solve_requests'] += 1
+        batch_key = (key, solver, start)
+        future = asyncio.get_running_loop().create_future()
+        batch = self._batches.get(batch_key)
+        if batch is not None:
+            batch.append((finish, future))
+            return await future
+
+        def job():
+            members = self._batches.pop(batch_key)
+            self._counters['solve_jobs'] += 1
+            return solve_job, (data, solver, start, [finish for finish, _ in members])
+
+        done = self._submit(job)
+        self._batches[batch_key] = [(finish, future)]
+        batch = self._batches[batch_key]
+        done.add_done_callback(lambda result: self._resolve_batch(batch, result))
+        return await future
+
+    @staticmethod
+    def _resolve_batch(batch: List[Tuple[Tuple[int, int], asyncio.Future]], result: asyncio.Future) -> None:
+        """
+        Раздаёт результаты объединённого задания решения ожидающим запросам.
+
+        Args:
+            batch (List[Tuple[Tuple[int, int], asyncio.Future]]): Финиши и ожидающие их запросы.
+            result (asyncio.Future): Результат задания.
+        """
+        if result.cancelled():
+            for _, future in batch:
+                future.cancel()
+            return
+        if result.exception() is not None:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(result.exception())
+            return
+        for (_, future), answer in zip(batch, result.result()):
+            if not future.done():
+                future.set_result(answer)
+
+    async def render(self, key: str, path: Sequence[Tuple[int, int]] = ()) -> str:
+        """
+        Отрисовывает лабиринт из реестра с маршрутом.
+
+        Args:
+            key (str): Отпечаток лабиринта.
+            path (Sequence[Tuple[int, int]]): Маршрут.
+
+        Returns:
+            str: Изображение лабиринта.
+        """
+        data = self._maze_data(key)
+        return await self._submit(lambda: (render_job, (data, list(path))))
+
+    async def _route(self, method: str, target: str, headers: Dict[str, str],
+                     body: bytes) -> Tuple[int, str, bytes, Dict[str, str]]:
+        """
+        Выполняет HTTP-запрос.
+
+        Args:
+            method (str): Метод запроса.
+            target (str): Путь запроса.
+            headers (Dict[str, str]): Заголовки (имена в нижнем регистре).
+            body (bytes): Тело запроса.
+
+        Returns:
+            Tuple[int, str, bytes, Dict[str, str]]: Код ответа, тип содержимого, тело и дополнительные заголовки.
+        """
+        path = urlsplit(target).path
+        if method == 'GET' and path == '/stats':
+            stats = self.counters
+            stats.update(queued=self._queue.qsize(), mazes=len(self._mazes))
+            return 200, 'application/json', json.dumps(stats).encode(), {}
+        if method != 'POST':
+            raise RequestError(405, f"Метод {method} не поддерживается.")
+
+        if path == '/mazes':
+            key, height, width = await self.register(body)
+            return self._json({'maze': key, 'height': height, 'width': width})
+
+        try:
+            request = json.loads(body or b'{}')
+        except ValueError as error:
+            raise RequestError(400, f"Некорректный JSON: {error}")
+
+        try:
+            if path == '/generate':
+                height, width = int(request['height']), int(request['width'])
+                seed = request.get('seed')
+                key, data = await self.generate(request.get('algorithm', 'kruskal'), height, width,
+                                                int(seed) if seed is not None else None)
+                if headers.get('accept') == 'application/octet-stream':
+                    return 200, 'application/octet-stream', data, {'X-Maze': key}
+                return self._json({'maze': key, 'height': height, 'width': width})
+            if path == '/solve':
+                found, route = await self.solve(request['maze'], tuple(map(int, request['start'])),
+                                                tuple(map(int, request['finish'])), request.get('solver', 'bfs'))
+                return self._json({'found': found, 'path': route})
+            if path == '/render':
+                text = await self.render(request['maze'], [tuple(map(int, c)) for c in request.get('path', [])])
+                return 200, 'text/plain; charset=utf-8', text.encode(), {}
+        except (KeyError, TypeError, ValueError) as error:
+            raise RequestError(400, f"Некорректные параметры запроса: {error!r}")
+
+        raise RequestError(404, f"Неизвестный путь {path}.")
+
+    @staticmethod
+    def _json(payload: dict) -> Tuple[int, str, bytes, Dict[str, str]]:
+        """
+        Формирует успешный ответ в формате JSON.
+
+        Args:
+            payload (dict): Содержимое ответа.
+
+        Returns:
+            Tuple[int, str, bytes, Dict[str, str]]: Ответ для _route.
+        """
+        return 200, 'application/json', json.dumps(payload).encode(), {}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Обслуживает одно соединение HTTP/1.1 (с поддержкой keep-alive).
+
+        Args:
+            reader (asyncio.StreamReader): Входной поток соединения.
+            writer (asyncio.StreamWriter): Выходной поток соединения.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                self._counters['requests'] += 1
+                length = int(headers.get('content-length', 0))
+                extra = {}
+                if length > self._max_body:
+                    status, content_type, body = 413, 'application/json', b'{"error": "payload too large"}'
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length)
+                    keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                    try:
+                        status, content_type, body, extra = await self._route(method, target, headers, body)
+                    except ServiceBusy as error:
+                        status, content_type, body = 503, 'application/json', json.dumps({'error': str(error)}).encode()
+                        extra = {'Retry-After': '1'}
+                    except RequestError as error:
+                        status, content_type, body = error.status, 'application/json', \
+                            json.dumps({'error': str(error)}).encode()
+                    except Exception as error:
+                        logger.exception("Ошибка обработки запроса %s %s", method, target)
+                        status, content_type, body = 500, 'application/json', \
+                            json.dumps({'error': repr(error)}).encode()
+
+                head = [f"HTTP/1.1 {status} {REASONS.get(status, '')}", f"Content-Type: {content_type}",
+                        f"Content-Length: {len(body)}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                head.extend(f"{name}: {value}" for name, value in extra.items())
+                writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str, port: int, max_workers: Optional[int], queue_size: int, max_cells: int) -> None:
+    """
+    Запускает сервис и обслуживает запросы до прерывания.
+
+    Args:
+        host (str): Адрес для прослушивания.
+        port (int): Порт.
+        max_workers (Optional[int]): Число процессов пула.
+        queue_size (int): Размер очереди заданий.
+        max_cells (int): Наибольшее число клеток генерируемого лабиринта.
+    """
+    service = MazeService(max_workers=max_workers, queue_size=queue_size, max_cells=max_cells)
+    await service.start(host, port)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Локальный HTTP-сервис генерации, решения и отрисовки лабиринтов.")
+    parser.add_argument('--host', default='127.0.0.1', help="Адрес для прослушивания.")
+    parser.add_argument('--port', type=int, default=8765, help="Порт.")
+    parser.add_argument('--workers', type=int, default=None, help="Число процессов (по умолчанию - число ядер).")
+    parser.add_argument('--queue-size', type=int, default=64, help="Наибольшее число ожидающих заданий.")
+    parser.add_argument('--max-cells', type=int, default=64 << 20,
+                        help="Наибольшее число клеток генерируемого лабиринта.")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue_size, args.max_cells))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    logging.getLogger().setLevel(logging.INFO)
+    main()
@@ -0,0 +1,222 @@
+import os
+import struct
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+from src.coordinate import Coordinate
+from src.maze import Maze
+
+# Заголовок сегмента разделяемой памяти: высота и ширина рабочей части лабиринта и случайный номер публикации,
+# за которым следует карта в формате Maze.buffer. Номер публикации отличает сегмент от удалённого сегмента
+# с тем же именем.
+_HEADER = struct.Struct('<IIQ')
+
+# Сегменты, подключённые в текущем процессе, по имени, от давно использованных к недавним. Процесс-исполнитель
+# подключается к сегменту один раз и переиспользует его в следующих заданиях; сверх _MAX_ATTACHED сегментов
+# давно использованные отключаются.
+_attached: 'OrderedDict[str, SharedMaze]' = OrderedDict()
+_MAX_ATTACHED = 4
+
+
+class SharedMaze:
+    """
+    Лабиринт в разделяемой памяти (multiprocessing.shared_memory) для решения одного большого лабиринта
+    в нескольких процессах без копирования.
+
+    Публикующий процесс один раз копирует карту лабиринта в именованный сегмент. Другие процессы подключаются
+    к сегменту по имени и получают Maze поверх его памяти (Maze.from_buffer), поэтому время подключения
+    и расход памяти на процесс не зависят от размера лабиринта, а в задания передаются только имя сегмента
+    и номер публикации. Поиск в ширину по такому лабиринту читает стены прямо из сегмента, без масок проходов
+    (Maze.external_buffer). Изменения карты через подключённый лабиринт видны всем процессам, но слушатели
+    изменений (Maze.add_listener) вызываются, а версия лабиринта увеличивается только в том процессе, где
+    изменение сделано.
+    """
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool):
+        """
+        Инициализация по открытому сегменту. Для создания объекта используются publish и attach.
+
+        Args:
+            segment (shared_memory.SharedMemory): Сегмент разделяемой памяти.
+            owner (bool): True, если сегмент создан этим объектом и должен быть удалён им же.
+        """
+        height, width, self._token = _HEADER.unpack_from(segment.buf)
+        self._segment = segment
+        self._owner = owner
+        self._view = segment.buf[_HEADER.size:_HEADER.size + (height + 2) * (width + 2)]
+        self._maze = Maze.from_buffer(height, width, self._view)
+
+    @classmethod
+    def publish(cls, maze: Maze, name: Optional[str] = None) -> 'SharedMaze':
+        """
+        Создаёт сегмент разделяемой памяти и копирует в него лабиринт.
+
+        Args:
+            maze (Maze): Лабиринт.
+            name (Optional[str]): Имя сегмента. По умолчанию выбирается автоматически.
+
+        Returns:
+            SharedMaze: Опубликованный лабиринт. Сегмент удаляется методом unlink (или при выходе из блока with).
+        """
+        buffer = maze.buffer
+        segment = shared_memory.SharedMemory(name=name, create=True, size=_HEADER.size + len(buffer))
+        _HEADER.pack_into(segment.buf, 0, maze.height, maze.width, int.from_bytes(os.urandom(8), 'little'))
+        segment.buf[_HEADER.size:_HEADER.size + len(buffer)] = buffer
+        return cls(segment, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedMaze':
+        """
+        Подключается к опубликованному лабиринту по имени сегмента без копирования карты.
+
+        Процессы-исполнители, запущенные публикующим процессом, используют его resource_tracker, поэтому
+        подключение не передаёт им владение сегментом: он удаляется только публикующим процессом.
+
+        Args:
+            name (str): Имя сегмента.
+
+        Returns:
+            SharedMaze: Подключённый лабиринт.
+        """
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        """
+        Возвращает имя сегмента, по которому к лабиринту подключаются другие процессы.
+
+        Returns:
+            str: Имя сегмента.
+        """
+        return self._segment.name
+
+    @property
+    def token(self) -> int:
+        """
+        Возвращает номер публикации сегмента. Сегмент, удалённый и опубликованный заново под тем же именем,
+        получает другой номер.
+
+        Returns:
+            int: Номер публикации.
+        """
+        return self._token
+
+    @property
+    def maze(self) -> Maze:
+        """
+        Возвращает лабиринт, работающий непосредственно с памятью сегмента. После close лабиринт недоступен.
+
+        Returns:
+            Maze: Лабиринт.
+        """
+        return self._maze
+
+    def close(self) -> None:
+        """
+        Отключается от сегмента в текущем процессе. Сам сегмент продолжает существовать до вызова unlink.
+        """
+        if self._view is None:
+            return
+        if _attached.get(self.name) is self:
+            del _attached[self.name]
+        self._view.release()
+        self._view = None
+        self._segment.close()
+
+    def unlink(self) -> None:
+        """
+        Отключается от сегмента и удаляет его. Вызывается публикующим процессом, когда сегмент больше не нужен.
+        Подключение solve_shared к этому сегменту в текущем процессе тоже закрывается.
+        """
+        stale = _attached.get(self.name)
+        if stale is not None and stale.token == self.token:
+            stale.close()
+        self.close()
+        self._segment.unlink()
+
+    def __enter__(self) -> 'SharedMaze':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def solve_many(self, queries: Sequence[Tuple[Coordinate, Coordinate]], solver: str = 'bfs',
+                   max_workers: Optional[int] = None, executor: Optional[Executor] = None,
+                   chunk_size: int = 16) -> List[Tuple[bool, List[Coordinate]]]:
+        """
+        Решает запросы к лабиринту в пуле процессов. Исполнителям передаётся только имя сегмента и координаты.
+
+        Args:
+            queries (Sequence[Tuple[Coordinate, Coordinate]]): Пары (старт, финиш).
+            solver (str): Алгоритм решения (ключ SOLVERS из src.batch).
+            max_workers (Optional[int]): Число процессов. По умолчанию - число ядер.
+            executor (Optional[Executor]): Готовый исполнитель вместо собственного пула процессов.
+            chunk_size (int): Сколько запросов передаётся исполнителю за один раз.
+
+        Returns:
+            List[Tuple[bool, List[Coordinate]]]: Для каждого запроса признак того, что путь найден, и путь.
+        """
+        args = ([self.name] * len(queries), [self.token] * len(queries), [solver] * len(queries),
+                [(start.row, start.col) for start, _ in queries], [(finish.row, finish.col) for _, finish in queries])
+        if executor is not None:
+            results = list(executor.map(solve_shared, *args))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(solve_shared, *args, chunksize=chunk_size))
+        return [(found, [Coordinate(*c) for c in path]) for found, path in results]
+
+
+def solve_shared(name: str, token: int, solver: str, start: Tuple[int, int],
+                 finish: Tuple[int, int]) -> Tuple[bool, List[Tuple[int, int]]]:
+    """
+    Решает лабиринт из разделяемой памяти в процессе-исполнителе. Сегмент подключается при первом обращении
+    и переиспользуется следующими заданиями; подключение к сегменту с другим номером публикации (удалённому
+    и опубликованному заново под тем же именем) заменяется новым. Поиск в ширину читает стены прямо из памяти
+    сегмента (BreadthFirstSearchSolver.solve_in_place), не копируя карту в процесс.
+
+    Args:
+        name (str): Имя сегмента.
+        token (int): Номер публикации сегмента (SharedMaze.token).
+        solver (str): Алгоритм решения (ключ SOLVERS из src.batch).
+        start (Tuple[int, int]): Стартовая клетка.
+        finish (Tuple[int, int]): Финишная клетка.
+
+    Returns:
+        Tuple[bool, List[Tuple[int, int]]]: Признак того, что путь найден, и путь.
+    """
+    from src.batch import SOLVERS
+
+    shared = attached(name, token)
+    found, path = SOLVERS[solver].solve(shared.maze, Coordinate(*start), Coordinate(*finish))
+    return found, [(c.row, c.col) for c in path]
+
+
+def attached(name: str, token: int) -> SharedMaze:
+    """
+    Возвращает подключение текущего процесса к сегменту, подключаясь заново, если сегмент опубликован повторно,
+    и отключая давно использованные сегменты сверх _MAX_ATTACHED.
+
+    Args:
+        name (str): Имя сегмента.
+        token (int): Номер публикации сегмента.
+
+    Returns:
+        SharedMaze: Подключённый лабиринт.
+    """
+    shared = _attached.pop(name, None)
+    if shared is not None and shared.token != token:
+        shared.close()
+        shared = None
+    if shared is None:
+        shared = SharedMaze.attach(name)
+        if shared.token != token:
+            shared.close()
+            raise FileNotFoundError(f"Сегмент '{name}' опубликован заново, задание устарело.")
+    _attached[name] = shared
+    while len(_attached) > _MAX_ATTACHED:
+        _attached.popitem(last=False)[1].close()
+    return shared
@@ -1,15 +1,19 @@
 from abc import ABC, abstractmethod
+from array import array
 from collections import deque
-from typing import List, Tuple
+from heapq import heappop, heappush
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple
 
+from src.cell import LEFT_WALL, UPPER_WALL
 from src.coordinate import Coordinate, delta
-from src.maze import Maze
+from src.maze import Maze, PASSAGE_RIGHT, PASSAGE_DOWN, PASSAGE_LEFT, PASSAGE_UP
+from src.stats import Stats, peak_queue_frontier
 
 
 class ISolver(ABC):
     @staticmethod
     @abstractmethod
-    def solve(maze: Maze, start: Coordinate, finish: Coordinate) -> List[Coordinate]:
+    def solve(maze: Maze, start: Coordinate, finish: Coordinate, stats: Optional[Stats] = None) -> List[Coordinate]:
         """
         Решает лабиринт, возвращая маршрут от стартовой до конечной координаты.
 
@@ -17,16 +21,40 @@ class ISolver(ABC):
             maze (Maze): Лабиринт, в котором нужно найти путь.
             start (Coordinate): Начальная координата.
             finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика, в которую записываются счётчики и время фаз поиска.
 
         Returns:
             List[Coordinate]: Список координат, представляющих путь от старта до финиша.
         """
         pass
 
+    @staticmethod
+    def restore_path(maze: Maze, parent: Mapping[int, int], source: int, target: int) -> List[Coordinate]:
+        """
+        Восстанавливает путь по таблице родителей, построенной поиском по смещениям клеток.
+
+        Args:
+            maze (Maze): Лабиринт.
+            parent (Mapping[int, int]): Родитель каждой достигнутой клетки (массив или словарь по смещениям).
+            source (int): Смещение стартовой клетки.
+            target (int): Смещение конечной клетки.
+
+        Returns:
+            List[Coordinate]: Путь от старта до конечной клетки.
+        """
+        path = [maze.coordinate(target)]
+        cur = target
+        while cur != source:
+            cur = parent[cur]
+            path.append(maze.coordinate(cur))
+        path.reverse()
+        return path
+
 
 class BacktrackSolver(ISolver):
     @staticmethod
-    def solve(maze: Maze, start: Coordinate, finish: Coordinate) -> Tuple[bool, List[Coordinate]]:
+    def solve(maze: Maze, start: Coordinate, finish: Coordinate,
+              stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
         """
         Решает лабиринт с использованием метода бэктрекинга.
 
@@ -34,6 +62,7 @@ class BacktrackSolver(ISolver):
             maze (Maze): Лабиринт, в котором нужно найти путь.
             start (Coordinate): Начальная координата.
             finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска.
 
         Returns:
             Tuple[bool, List[Coordinate]]: Возвращает кортеж, где:
@@ -41,65 +70,105 @@ class BacktrackSolver(ISolver):
                 - List[Coordinate]: Список координат, представляющих найденный путь (если путь найден).
         """
 
-        path = []
-
-        maze.reset_captured()
-        BacktrackSolver.recursive_backtrack(start, finish, maze, path)
+        path = BacktrackSolver.iterative_backtrack(start, finish, maze, stats)
         return len(path) > 0, path
 
     @staticmethod
-    def reached_finish(path: List[Coordinate], finish: Coordinate) -> bool:
+    def init_visited(maze: Maze) -> bytearray:
         """
-        Проверяет, достиг ли путь конечной координаты.
+        Создаёт битовую карту посещённых клеток, в которой вспомогательные клетки по краям карты сразу отмечены
+        посещёнными, чтобы при обходе не проверять выход за границы.
 
         Args:
-            path (List[Coordinate]): Текущий маршрут.
-            finish (Coordinate): Конечная координата.
+            maze (Maze): Лабиринт.
 
         Returns:
-            bool: True, если путь достиг финиша, иначе False.
+            bytearray: Карта посещённых клеток размера map_height * map_width.
         """
-        return len(path) > 0 and path[-1] == finish
+        border_row = b'\x01' * maze.map_width
+        inner_row = b'\x01' + b'\x00' * maze.width + b'\x01'
+        return bytearray(border_row + inner_row * maze.height + border_row)
 
     @staticmethod
-    def recursive_backtrack(cur: Coordinate, finish: Coordinate, maze: Maze, path: List[Coordinate]) -> None:
+    def iterative_backtrack(start: Coordinate, finish: Coordinate, maze: Maze,
+                            stats: Optional[Stats] = None) -> List[Coordinate]:
         """
-        Метод для поиска пути с помощью рекурсивного бэктрекинга.
+        Поиск пути бэктрекингом на явном стеке. Посещённые клетки отмечаются в собственной битовой карте,
+        а не во флагах лабиринта, поэтому сам лабиринт не изменяется и может одновременно решаться несколькими
+        поисками.
 
         Args:
-            cur (Coordinate): Текущая координата.
+            start (Coordinate): Начальная координата.
             finish (Coordinate): Конечная координата.
             maze (Maze): Лабиринт, в котором осуществляется поиск.
-            path (List[Coordinate]): Список координат, представляющих путь.
-        """
+            stats (Optional[Stats]): Статистика поиска.
 
-        maze.update_cell(cur, captured=True)
-        path.append(cur)
+        Returns:
+            List[Coordinate]: Найденный путь от старта до финиша или пустой список, если пути нет.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        buffer = maze.buffer
+        map_width = maze.map_width
+        offsets = [d[0] * map_width + d[1] for d in delta]
+        visited = BacktrackSolver.init_visited(maze)
 
-        if BacktrackSolver.reached_finish(path, finish):
-            return
+        target = maze.index(finish)
+        stack_cells = array('q', [maze.index(start)])
+        stack_moves = array('b', [0])
+        visited[stack_cells[0]] = 1
+        stats.lap('reset')
 
-        possibilities = []
+        # Стены проверяются не чаще одного раза на пару соседних клеток, а глубина стека растёт только при
+        # входе в новую клетку, поэтому эти два счётчика почти не влияют на время обхода.
+        walls_checked = 0
+        peak = 1
+        while stack_cells:
+            cur = stack_cells[-1]
+            if cur == target:
+                break
 
-        for d in delta:
-            neighbor = Coordinate(cur.row + d[0], cur.col + d[1])
-            if maze.coordinate_inside_map(neighbor):
-                possibilities.append(neighbor)
+            move = stack_moves[-1]
+            if move == len(offsets):
+                stack_cells.pop()
+                stack_moves.pop()
+                continue
+            stack_moves[-1] = move + 1
 
-        for neighbor in possibilities:
-            if maze.get_cell(neighbor).captured or maze.check_wall(cur, neighbor):
+            neighbor = cur + offsets[move]
+            if visited[neighbor]:
+                continue
+            walls_checked += 1
+            if move == 0:
+                wall = buffer[neighbor] & LEFT_WALL
+            elif move == 1:
+                wall = buffer[neighbor] & UPPER_WALL
+            elif move == 2:
+                wall = buffer[cur] & LEFT_WALL
+            else:
+                wall = buffer[cur] & UPPER_WALL
+            if wall:
                 continue
 
-            BacktrackSolver.recursive_backtrack(neighbor, finish, maze, path)
-            if BacktrackSolver.reached_finish(path, finish):
-                return
+            visited[neighbor] = 1
+            stack_cells.append(neighbor)
+            stack_moves.append(0)
+            if len(stack_cells) > peak:
+                peak = len(stack_cells)
+        stats.lap('search')
 
-        path.pop()
+        if stats.enabled:
+            outside = len(visited) - maze.height * maze.width
+            stats.record(nodes_expanded=visited.count(1) - outside, walls_checked=walls_checked, frontier=peak)
+        path = [maze.coordinate(index) for index in stack_cells]
+        stats.lap('path')
+        return path
 
 
 class BreadthFirstSearchSolver(ISolver):
     @staticmethod
-    def solve(maze: Maze, start: Coordinate, finish: Coordinate) -> Tuple[bool, List[Coordinate]]:
+    def solve(maze: Maze, start: Coordinate, finish: Coordinate,
+              stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
         """
         Решает лабиринт с использованием поиска в ширину (BFS).
 
@@ -107,15 +176,169 @@ class BreadthFirstSearchSolver(ISolver):
             maze (Maze): Лабиринт, в котором нужно найти путь.
             start (Coordinate): Начальная координата.
             finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска.
 
         Returns:
             Tuple[bool, List[Coordinate]]: Возвращает кортеж, где:
                 - bool: True, если путь найден, иначе False.
                 - List[Coordinate]: Список координат, представляющих найденный путь (если путь найден).
         """
+        if isinstance(maze, Maze):
+            if maze.external_buffer:
+                return BreadthFirstSearchSolver.solve_in_place(maze, start, finish, stats)
+            return BreadthFirstSearchSolver.solve_indexed(maze, start, finish, stats)
+        return BreadthFirstSearchSolver.solve_by_coordinates(maze, start, finish, stats)
+
+    @staticmethod
+    def solve_indexed(maze: Maze, start: Coordinate, finish: Coordinate,
+                      stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
+        """
+        Поиск в ширину по смещениям клеток в буфере карты. Проходы берутся из заранее посчитанных масок
+        (Maze.passage_masks), родители хранятся в плоском массиве array('i'), а координаты создаются только
+        для клеток найденного пути.
+
+        Args:
+            maze (Maze): Лабиринт, в котором нужно найти путь.
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и сам путь.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        masks = maze.passage_masks()
+        map_width = maze.map_width
+        source = maze.index(start)
+        target = maze.index(finish)
+
+        parent = array('i', [-1]) * len(masks)
+        parent[source] = source
+        queue = array('i', [source])
+        head = 0
+        stats.lap('reset')
+
+        while head < len(queue):
+            cur = queue[head]
+            head += 1
+            if cur == target:
+                break
+
+            mask = masks[cur]
+            if mask & PASSAGE_RIGHT and parent[cur + 1] < 0:
+                parent[cur + 1] = cur
+                queue.append(cur + 1)
+            if mask & PASSAGE_DOWN and parent[cur + map_width] < 0:
+                parent[cur + map_width] = cur
+                queue.append(cur + map_width)
+            if mask & PASSAGE_LEFT and parent[cur - 1] < 0:
+                parent[cur - 1] = cur
+                queue.append(cur - 1)
+            if mask & PASSAGE_UP and parent[cur - map_width] < 0:
+                parent[cur - map_width] = cur
+                queue.append(cur - map_width)
+        stats.lap('search')
+
+        if stats.enabled:
+            expanded = head - (parent[target] >= 0)
+            stats.record(nodes_expanded=expanded, walls_checked=4 * expanded,
+                         frontier=peak_queue_frontier(queue, parent))
+        if parent[target] < 0:
+            return False, []
+        path = ISolver.restore_path(maze, parent, source, target)
+        stats.lap('path')
+        return True, path
+
+    @staticmethod
+    def solve_in_place(maze: Maze, start: Coordinate, finish: Coordinate,
+                       stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
+        """
+        Поиск в ширину по смещениям клеток, читающий стены прямо из буфера карты, без масок проходов. Используется
+        для лабиринтов во внешнем буфере (Maze.external_buffer): маски - это копия размера карты в памяти процесса,
+        а для отображённого файла или разделяемой памяти такая копия лишает смысла работу с общим буфером.
+        Вспомогательные клетки заранее отмечаются в таблице родителей как достигнутые, поэтому поиск в них не заходит.
+
+        Args:
+            maze (Maze): Лабиринт, в котором нужно найти путь.
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и сам путь.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        flags = maze.buffer
+        map_width = maze.map_width
+        size = maze.map_height * map_width
+        source = maze.index(start)
+        target = maze.index(finish)
+
+        parent = array('i', [-1]) * size
+        border_row = array('i', [0]) * map_width
+        parent[:map_width] = border_row
+        parent[size - map_width:] = border_row
+        for begin in range(map_width, size - map_width, map_width):
+            parent[begin] = parent[begin + map_width - 1] = 0
+        parent[source] = source
+        queue = array('i', [source])
+        head = 0
+        stats.lap('reset')
+
+        while head < len(queue):
+            cur = queue[head]
+            head += 1
+            if cur == target:
+                break
+
+            own = flags[cur]
+            if parent[cur + 1] < 0 and not flags[cur + 1] & LEFT_WALL:
+                parent[cur + 1] = cur
+                queue.append(cur + 1)
+            if parent[cur + map_width] < 0 and not flags[cur + map_width] & UPPER_WALL:
+                parent[cur + map_width] = cur
+                queue.append(cur + map_width)
+            if parent[cur - 1] < 0 and not own & LEFT_WALL:
+                parent[cur - 1] = cur
+                queue.append(cur - 1)
+            if parent[cur - map_width] < 0 and not own & UPPER_WALL:
+                parent[cur - map_width] = cur
+                queue.append(cur - map_width)
+        stats.lap('search')
+
+        if stats.enabled:
+            expanded = head - (parent[target] >= 0)
+            stats.record(nodes_expanded=expanded, walls_checked=4 * expanded,
+                         frontier=peak_queue_frontier(queue, parent))
+        if parent[target] < 0:
+            return False, []
+        path = ISolver.restore_path(maze, parent, source, target)
+        stats.lap('path')
+        return True, path
+
+    @staticmethod
+    def solve_by_coordinates(maze: Maze, start: Coordinate, finish: Coordinate,
+                             stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
+        """
+        Поиск в ширину по координатам клеток. Работает с любым объектом, предоставляющим интерфейс лабиринта
+        (coordinate_inside_map и check_wall), а не только с упакованным Maze.
 
+        Args:
+            maze (Maze): Лабиринт, в котором нужно найти путь.
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и сам путь.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
         queue = deque([start])
         parent = {start: None}
+        stats.lap('reset')
 
         while queue:
             cur = queue.popleft()
@@ -128,7 +351,12 @@ class BreadthFirstSearchSolver(ISolver):
                         not maze.check_wall(cur, neighbor):
                     queue.append(neighbor)
                     parent[neighbor] = cur
+        stats.lap('search')
 
+        if stats.enabled:
+            expanded = len(parent) - len(queue) - (finish in parent)
+            stats.record(nodes_expanded=expanded, walls_checked=4 * expanded,
+                         frontier=peak_queue_frontier(list(parent), parent))
         path = []
         if finish in parent:
             cur = finish
@@ -136,6 +364,294 @@ class BreadthFirstSearchSolver(ISolver):
                 path.append(cur)
                 cur = parent[cur]
             path.reverse()
+            stats.lap('path')
             return True, path
         else:
             return False, path
+
+    @staticmethod
+    def distance_field(maze: Maze, source: Coordinate, until: Iterable[Coordinate] = (),
+                       stats: Optional[Stats] = None) -> Tuple[array, array]:
+        """
+        Поиск в ширину из одной клетки с сохранением расстояний и родителей всех достигнутых клеток в плоских
+        массивах, индексируемых смещениями Maze.index. По таблице родителей путь до любой клетки восстанавливается
+        через ISolver.restore_path без повторного поиска.
+
+        Args:
+            maze (Maze): Лабиринт.
+            source (Coordinate): Клетка-источник.
+            until (Iterable[Coordinate]): Клетки, после раскрытия которых поиск можно остановить. Если не заданы,
+                обходится вся компонента связности источника.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[array, array]: Расстояния (число переходов, -1 для недостигнутых клеток) и родители
+            (-1 для недостигнутых клеток, у источника - он сам).
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        masks = maze.passage_masks()
+        map_width = maze.map_width
+        origin = maze.index(source)
+
+        distance = array('i', [-1]) * len(masks)
+        parent = array('i', [-1]) * len(masks)
+        distance[origin] = 0
+        parent[origin] = origin
+        queue = array('i', [origin])
+        head = 0
+
+        wanted = bytearray(len(masks))
+        for target in until:
+            wanted[maze.index(target)] = 1
+        remaining = sum(wanted) or -1
+        stats.lap('reset')
+
+        while head < len(queue):
+            cur = queue[head]
+            head += 1
+            if wanted[cur]:
+                remaining -= 1
+                if remaining == 0:
+                    break
+
+            mask = masks[cur]
+            step = distance[cur] + 1
+            if mask & PASSAGE_RIGHT and parent[cur + 1] < 0:
+                parent[cur + 1] = cur
+                distance[cur + 1] = step
+                queue.append(cur + 1)
+            if mask & PASSAGE_DOWN and parent[cur + map_width] < 0:
+                parent[cur + map_width] = cur
+                distance[cur + map_width] = step
+                queue.append(cur + map_width)
+            if mask & PASSAGE_LEFT and parent[cur - 1] < 0:
+                parent[cur - 1] = cur
+                distance[cur - 1] = step
+                queue.append(cur - 1)
+            if mask & PASSAGE_UP and parent[cur - map_width] < 0:
+                parent[cur - map_width] = cur
+                distance[cur - map_width] = step
+                queue.append(cur - map_width)
+        stats.lap('search')
+
+        if stats.enabled:
+            expanded = head - (remaining == 0)
+            stats.record(nodes_expanded=expanded, walls_checked=4 * expanded,
+                         frontier=peak_queue_frontier(queue, parent))
+        return distance, parent
+
+    @staticmethod
+    def solve_many(maze: Maze, start: Coordinate, finishes: Sequence[Coordinate],
+                   stats: Optional[Stats] = None) -> List[Tuple[bool, List[Coordinate]]]:
+        """
+        Находит кратчайшие пути от одной стартовой клетки до нескольких финишных за один обход в ширину,
+        который останавливается, как только раскрыты все финишные клетки.
+
+        Args:
+            maze (Maze): Лабиринт.
+            start (Coordinate): Начальная координата.
+            finishes (Sequence[Coordinate]): Конечные координаты.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            List[Tuple[bool, List[Coordinate]]]: Для каждой финишной клетки (в том же порядке) признак того,
+            что путь найден, и сам путь.
+        """
+        if not finishes:
+            return []
+
+        stats = Stats.ensure(stats)
+        distance, parent = BreadthFirstSearchSolver.distance_field(maze, start, finishes, stats)
+        source = maze.index(start)
+
+        results = []
+        for finish in finishes:
+            target = maze.index(finish)
+            if distance[target] < 0:
+                results.append((False, []))
+            else:
+                results.append((True, ISolver.restore_path(maze, parent, source, target)))
+        stats.lap('path')
+        return results
+
+    @staticmethod
+    def diameter(maze: Maze, source: Coordinate = Coordinate(1, 1),
+                 stats: Optional[Stats] = None) -> Tuple[int, Coordinate, Coordinate]:
+        """
+        Находит концы самого длинного кратчайшего пути двойным поиском в ширину: сначала ищется клетка,
+        самая далёкая от source, затем самая далёкая от неё. Для идеального лабиринта (дерева) результат точен,
+        для лабиринта с циклами это нижняя оценка диаметра. Рассматривается компонента связности source.
+
+        Args:
+            maze (Maze): Лабиринт.
+            source (Coordinate): Любая клетка нужной компоненты связности.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[int, Coordinate, Coordinate]: Длина пути (число переходов) и его концы.
+        """
+        distance, _ = BreadthFirstSearchSolver.distance_field(maze, source, stats=stats)
+        first = distance.index(max(distance))
+        distance, _ = BreadthFirstSearchSolver.distance_field(maze, maze.coordinate(first), stats=stats)
+        length = max(distance)
+        return length, maze.coordinate(first), maze.coordinate(distance.index(length))
+
+
+def passage_steps(maze: Maze) -> List[Tuple[int, int]]:
+    """
+    Возвращает пары (бит маски проходов, сдвиг смещения клетки) для всех четырёх направлений.
+
+    Args:
+        maze (Maze): Лабиринт.
+
+    Returns:
+        List[Tuple[int, int]]: Бит направления и соответствующий ему сдвиг в буфере карты.
+    """
+    return [(PASSAGE_RIGHT, 1), (PASSAGE_DOWN, maze.map_width), (PASSAGE_LEFT, -1), (PASSAGE_UP, -maze.map_width)]
+
+
+class AStarSolver(ISolver):
+    @staticmethod
+    def solve(maze: Maze, start: Coordinate, finish: Coordinate,
+              stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
+        """
+        Решает лабиринт алгоритмом A* с манхэттенской эвристикой и двоичной кучей. Проходы проверяются только
+        у раскрываемых клеток, а состояние поиска хранится в словарях, поэтому затраты пропорциональны
+        исследованной части лабиринта.
+
+        Args:
+            maze (Maze): Лабиринт, в котором нужно найти путь.
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и кратчайший путь.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        map_width = maze.map_width
+        source = maze.index(start)
+        target = maze.index(finish)
+        steps = passage_steps(maze)
+
+        def heuristic(index: int) -> int:
+            row, col = divmod(index, map_width)
+            return abs(row - finish.row) + abs(col - finish.col)
+
+        distance = {source: 0}
+        parent = {source: source}
+        estimate = heuristic(source)
+        heap = [(estimate, estimate, source)]
+        stats.lap('reset')
+
+        # Раскрытие клетки в A* и так дорогое (маска проходов, эвристика, операции с кучей), поэтому счётчики
+        # раскрытий и размера кучи ведутся прямо в цикле.
+        expanded = 0
+        peak = 1
+        found = False
+        while heap:
+            total, estimate, cur = heappop(heap)
+            passed = total - estimate
+            if passed > distance[cur]:
+                continue
+            if cur == target:
+                found = True
+                break
+
+            expanded += 1
+            mask = maze.passage_mask(cur)
+            for bit, step in steps:
+                if not mask & bit:
+                    continue
+                neighbor = cur + step
+                if passed + 1 < distance.get(neighbor, passed + 2):
+                    distance[neighbor] = passed + 1
+                    parent[neighbor] = cur
+                    estimate = heuristic(neighbor)
+                    heappush(heap, (passed + 1 + estimate, estimate, neighbor))
+            if len(heap) > peak:
+                peak = len(heap)
+        stats.lap('search')
+
+        stats.record(nodes_expanded=expanded, walls_checked=4 * expanded, frontier=peak)
+        if not found:
+            return False, []
+        path = ISolver.restore_path(maze, parent, source, target)
+        stats.lap('path')
+        return True, path
+
+
+class BidirectionalBFSSolver(ISolver):
+    @staticmethod
+    def solve(maze: Maze, start: Coordinate, finish: Coordinate,
+              stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
+        """
+        Решает лабиринт двунаправленным поиском в ширину: фронты растут от старта и от финиша (каждый раз
+        раскрывается целый уровень меньшего фронта) и поиск останавливается, как только они встретятся.
+
+        Args:
+            maze (Maze): Лабиринт, в котором нужно найти путь.
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и кратчайший путь.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        source = maze.index(start)
+        target = maze.index(finish)
+        if source == target:
+            return True, [start]
+
+        steps = passage_steps(maze)
+        forward = ({source: 0}, {source: source}, [source])
+        backward = ({target: 0}, {target: target}, [target])
+        stats.lap('reset')
+
+        expanded = 0
+        peak = 2
+        while forward[2] and backward[2]:
+            forward_turn = len(forward[2]) <= len(backward[2])
+            (distance, parent, frontier), other = (forward, backward) if forward_turn else (backward, forward)
+            expanded += len(frontier)
+
+            next_frontier = []
+            best = None
+            for cur in frontier:
+                mask = maze.passage_mask(cur)
+                for bit, step in steps:
+                    if not mask & bit:
+                        continue
+                    neighbor = cur + step
+                    if neighbor in distance:
+                        continue
+                    distance[neighbor] = distance[cur] + 1
+                    parent[neighbor] = cur
+                    next_frontier.append(neighbor)
+                    if neighbor in other[0]:
+                        length = distance[neighbor] + other[0][neighbor]
+                        if best is None or length < best[0]:
+                            best = (length, neighbor)
+
+            peak = max(peak, len(next_frontier) + len(other[2]))
+            if best is not None:
+                stats.lap('search')
+                stats.record(nodes_expanded=expanded, walls_checked=4 * expanded, frontier=peak)
+                meeting = best[1]
+                path = ISolver.restore_path(maze, forward[1], source, meeting)
+                cur = meeting
+                while cur != target:
+                    cur = backward[1][cur]
+                    path.append(maze.coordinate(cur))
+                stats.lap('path')
+                return True, path
+
+            frontier[:] = next_frontier
+        stats.lap('search')
+
+        stats.record(nodes_expanded=expanded, walls_checked=4 * expanded, frontier=peak)
+        return False, []
@@ -0,0 +1,209 @@
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from src.coordinate import Coordinate
+from src.maze import Maze
+from src.solver import BreadthFirstSearchSolver, ISolver
+from src.stats import Stats
+
+
+class SolverCache:
+    """
+    Кеш деревьев кратчайших путей перед поиском в ширину.
+
+    Для каждого источника хранится таблица родителей полного обхода в ширину (BreadthFirstSearchSolver.distance_field)
+    под ключом (отпечаток лабиринта, смещение источника). Повторный запрос с тем же источником (или с источником,
+    совпадающим с финишем предыдущих запросов) отвечается восстановлением пути по таблице за O(длины пути).
+
+    Отпечаток лабиринта запоминается вместе с версией Maze.version и пересчитывается только после изменения
+    лабиринта через set_cell или update_cell, поэтому изменённый лабиринт автоматически получает другие ключи,
+    а деревья старого содержимого вытесняются по LRU. Лабиринты с одинаковыми стенами используют общие деревья.
+    Объём кеша ограничен суммарным размером таблиц родителей в байтах.
+    """
+    def __init__(self, max_bytes: int = 64 << 20):
+        """
+        Инициализация кеша.
+
+        Args:
+            max_bytes (int): Наибольший суммарный размер хранимых таблиц родителей в байтах.
+        """
+        self._max_bytes = max_bytes
+        self._trees = OrderedDict()
+        self._fingerprints = WeakKeyDictionary()
+        self._bytes_held = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """
+        Возвращает число запросов, ответ на которые найден в кеше.
+
+        Returns:
+            int: Число попаданий в кеш.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Возвращает число запросов, для которых пришлось выполнить обход.
+
+        Returns:
+            int: Число промахов кеша.
+        """
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Возвращает долю запросов, ответ на которые найден в кеше.
+
+        Returns:
+            float: Доля попаданий от 0 до 1 (0, если запросов не было).
+        """
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    @property
+    def bytes_held(self) -> int:
+        """
+        Возвращает суммарный размер хранимых таблиц родителей.
+
+        Returns:
+            int: Размер в байтах.
+        """
+        return self._bytes_held
+
+    @property
+    def cached_trees(self) -> int:
+        """
+        Возвращает число хранимых деревьев.
+
+        Returns:
+            int: Число деревьев в кеше.
+        """
+        return len(self._trees)
+
+    def clear(self) -> None:
+        """
+        Удаляет все деревья и сбрасывает счётчики.
+        """
+        self._trees.clear()
+        self._fingerprints.clear()
+        self._bytes_held = 0
+        self._hits = 0
+        self._misses = 0
+
+    def fingerprint(self, maze: Maze) -> str:
+        """
+        Возвращает отпечаток лабиринта, пересчитывая его только при изменении версии лабиринта.
+
+        Args:
+            maze (Maze): Лабиринт.
+
+        Returns:
+            str: Отпечаток Maze.fingerprint.
+        """
+        known = self._fingerprints.get(maze)
+        if known is None or known[0] != maze.version:
+            known = (maze.version, maze.fingerprint())
+            self._fingerprints[maze] = known
+        return known[1]
+
+    def _lookup(self, key: Tuple[str, int]) -> Optional[array]:
+        """
+        Ищет дерево в кеше и отмечает его как недавно использованное.
+
+        Args:
+            key (Tuple[str, int]): Отпечаток лабиринта и смещение источника.
+
+        Returns:
+            Optional[array]: Таблица родителей или None.
+        """
+        parent = self._trees.get(key)
+        if parent is not None:
+            self._trees.move_to_end(key)
+        return parent
+
+    def _store(self, key: Tuple[str, int], parent: array) -> None:
+        """
+        Сохраняет дерево и вытесняет давно не использованные деревья, пока кеш не уложится в ограничение.
+        Дерево, которое само больше ограничения, не сохраняется.
+
+        Args:
+            key (Tuple[str, int]): Отпечаток лабиринта и смещение источника.
+            parent (array): Таблица родителей.
+        """
+        size = len(parent) * parent.itemsize
+        if size > self._max_bytes:
+            return
+
+        self._trees[key] = parent
+        self._bytes_held += size
+        while self._bytes_held > self._max_bytes:
+            _, evicted = self._trees.popitem(last=False)
+            self._bytes_held -= len(evicted) * evicted.itemsize
+
+    def tree(self, maze: Maze, source: Coordinate, stats: Optional[Stats] = None) -> array:
+        """
+        Возвращает дерево кратчайших путей из клетки source (таблицу родителей по смещениям Maze.index),
+        строя его обходом в ширину, если его нет в кеше.
+
+        Args:
+            maze (Maze): Лабиринт.
+            source (Coordinate): Клетка-источник.
+            stats (Optional[Stats]): Статистика обхода при промахе кеша.
+
+        Returns:
+            array: Таблица родителей (-1 для недостижимых клеток).
+        """
+        key = (self.fingerprint(maze), maze.index(source))
+        parent = self._lookup(key)
+        if parent is not None:
+            self._hits += 1
+            return parent
+
+        self._misses += 1
+        _, parent = BreadthFirstSearchSolver.distance_field(maze, source, stats=stats)
+        self._store(key, parent)
+        return parent
+
+    def solve(self, maze: Maze, start: Coordinate, finish: Coordinate,
+              stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
+        """
+        Находит кратчайший путь с тем же интерфейсом, что и ISolver.solve. Если в кеше уже есть дерево
+        с источником в финише, путь берётся из него в обратном порядке.
+
+        Args:
+            maze (Maze): Лабиринт.
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и кратчайший путь.
+        """
+        stats = Stats.ensure(stats)
+        source, target = maze.index(start), maze.index(finish)
+
+        reverse = self._lookup((self.fingerprint(maze), target))
+        if reverse is not None:
+            self._hits += 1
+            stats.begin()
+            if reverse[source] < 0:
+                return False, []
+            path = ISolver.restore_path(maze, reverse, target, source)
+            path.reverse()
+            stats.lap('path')
+            return True, path
+
+        parent = self.tree(maze, start, stats)
+        stats.begin()
+        if parent[target] < 0:
+            return False, []
+        path = ISolver.restore_path(maze, parent, source, target)
+        stats.lap('path')
+        return True, path
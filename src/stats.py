@@ -0,0 +1,170 @@
+import cProfile
+import io
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class Stats:
+    """
+    Счётчики и замеры времени одного запуска генерации, решения и отрисовки лабиринта.
+
+    Объект передаётся в генераторы, решатели и отрисовку необязательным аргументом stats. Счётчики накапливаются
+    по всем вызовам, в которые передан один и тот же объект, а время - по фазам (reset, generate, search, path,
+    render). Алгоритмы не трогают счётчики внутри горячих циклов: значения выводятся после поиска из уже имеющихся
+    структур (очереди, таблицы родителей, карты посещённых клеток) и только если сбор статистики включён.
+    """
+    enabled = True
+
+    def __init__(self):
+        """
+        Инициализация пустой статистики.
+        """
+        self.nodes_expanded = 0
+        self.walls_checked = 0
+        self.peak_frontier = 0
+        self.passes = 0
+        self.phases: Dict[str, float] = {}
+        self._clock = time.perf_counter()
+
+    @staticmethod
+    def ensure(stats: Optional['Stats']) -> 'Stats':
+        """
+        Возвращает переданную статистику или общий отключённый объект NULL_STATS, чтобы алгоритмам не нужно было
+        проверять stats на None перед каждым вызовом.
+
+        Args:
+            stats (Optional[Stats]): Статистика или None.
+
+        Returns:
+            Stats: Статистика для записи.
+        """
+        return NULL_STATS if stats is None else stats
+
+    def begin(self) -> None:
+        """
+        Запускает отсчёт времени первой фазы.
+        """
+        self._clock = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """
+        Относит время, прошедшее с предыдущей отметки, к заданной фазе и начинает отсчёт следующей.
+
+        Args:
+            phase (str): Название завершившейся фазы.
+        """
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._clock
+        self._clock = now
+
+    def record(self, nodes_expanded: int = 0, walls_checked: int = 0, frontier: int = 0, passes: int = 0) -> None:
+        """
+        Добавляет результаты одного вызова алгоритма.
+
+        Args:
+            nodes_expanded (int): Число раскрытых клеток.
+            walls_checked (int): Число проверенных стен (проходов) между соседними клетками.
+            frontier (int): Наибольший размер фронта (очереди, стека или кучи) за вызов.
+            passes (int): Число проходов по сетке у алгоритмов, обрабатывающих её целиком за проход.
+        """
+        self.nodes_expanded += nodes_expanded
+        self.walls_checked += walls_checked
+        self.peak_frontier = max(self.peak_frontier, frontier)
+        self.passes += passes
+
+    def as_dict(self) -> dict:
+        """
+        Возвращает статистику в виде словаря, пригодного для сериализации в JSON.
+
+        Returns:
+            dict: Счётчики и время фаз в секундах.
+        """
+        return {'nodes_expanded': self.nodes_expanded, 'walls_checked': self.walls_checked,
+                'peak_frontier': self.peak_frontier, 'passes': self.passes, 'phases': dict(self.phases)}
+
+    def log(self, target: logging.Logger = logger, level: int = logging.INFO) -> None:
+        """
+        Записывает статистику в журнал.
+
+        Args:
+            target (logging.Logger): Журнал для записи.
+            level (int): Уровень сообщений.
+        """
+        target.log(level, "Раскрыто клеток: %d, проверено стен: %d, наибольший фронт: %d", self.nodes_expanded,
+                   self.walls_checked, self.peak_frontier)
+        if self.passes:
+            target.log(level, "Проходов по сетке: %d", self.passes)
+        for phase, seconds in self.phases.items():
+            target.log(level, "Фаза %-8s %.6f с", phase, seconds)
+
+
+class NullStats(Stats):
+    """
+    Отключённая статистика: все методы записи ничего не делают.
+    """
+    enabled = False
+
+    def begin(self) -> None:
+        pass
+
+    def lap(self, phase: str) -> None:
+        pass
+
+    def record(self, nodes_expanded: int = 0, walls_checked: int = 0, frontier: int = 0, passes: int = 0) -> None:
+        pass
+
+
+NULL_STATS = NullStats()
+
+
+def peak_queue_frontier(order: Sequence[int], parent: Mapping[int, int]) -> int:
+    """
+    Восстанавливает наибольший размер очереди поиска в ширину по порядку обнаружения клеток. Когда раскрывается
+    клетка на позиции i, в очереди лежат клетки с позиций i + 1 .. j, где j - позиция последнего обнаруженного
+    ею соседа, поэтому размер фронта равен j - i.
+
+    Args:
+        order (Sequence[int]): Клетки в порядке постановки в очередь (первая - источник).
+        parent (Mapping[int, int]): Родитель каждой клетки, кроме источника.
+
+    Returns:
+        int: Наибольший размер очереди.
+    """
+    position = {cell: i for i, cell in enumerate(order)}
+    peak = 1 if order else 0
+    for j in range(1, len(order)):
+        peak = max(peak, j - position[parent[order[j]]])
+    return peak
+
+
+@contextmanager
+def profiled(path: Optional[str] = None, top: int = 25) -> Iterator[cProfile.Profile]:
+    """
+    Выполняет блок под cProfile, после чего сохраняет pstats в файл (если он задан) и записывает в журнал
+    самые затратные по суммарному времени функции.
+
+    Args:
+        path (Optional[str]): Файл для сохранения статистики pstats.
+        top (int): Число функций в журнале.
+
+    Yields:
+        cProfile.Profile: Работающий профилировщик.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path:
+            profiler.dump_stats(path)
+            logger.info("Профиль сохранён в %s", path)
+        import pstats  # модуль отчёта загружается только при профилировании
+
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        logger.info("Профиль выполнения:\n%s", report.getvalue())
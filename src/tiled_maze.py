@@ -0,0 +1,236 @@
+import hashlib
+import random
+from collections import OrderedDict
+from typing import Optional, Tuple, Type
+
+from src.cell import Cell
+from src.coordinate import Coordinate
+from src.generator import IGenerator, KruskalGenerator
+from src.maze import Maze
+
+
+class TiledMaze:
+    """
+    Лабиринт неограниченного (или очень большого) размера, разбитый на плитки фиксированного размера.
+
+    Каждая плитка - отдельный идеальный лабиринт, который лениво генерируется выбранным генератором из зерна,
+    детерминированно выведенного из (seed, строка плитки, столбец плитки). Между каждой парой соседних плиток
+    открыт ровно один проход, положение которого тоже выводится из зерна, поэтому весь лабиринт связен,
+    а любая его часть воспроизводится одинаково при каждом обращении. Сгенерированные плитки хранятся
+    в ограниченном LRU-кеше.
+
+    Координаты клеток такие же, как в Maze: рабочая часть начинается с (1, 1), строка и столбец 0 - вспомогательные.
+    Класс предоставляет интерфейс Maze, нужный для поиска по координатам (get_cell, check_wall,
+    coordinate_inside_map), поэтому BreadthFirstSearchSolver может прокладывать маршруты через весь лабиринт.
+    """
+    def __init__(self, tile_height: int, tile_width: int, seed: int = 0,
+                 generator: Type[IGenerator] = KruskalGenerator, cache_size: int = 64,
+                 height: Optional[int] = None, width: Optional[int] = None):
+        """
+        Инициализация плиточного лабиринта.
+
+        Args:
+            tile_height (int): Высота плитки.
+            tile_width (int): Ширина плитки.
+            seed (int): Общее зерно лабиринта.
+            generator (Type[IGenerator]): Генератор плиток.
+            cache_size (int): Максимальное число плиток в кеше.
+            height (Optional[int]): Высота лабиринта или None для неограниченной высоты.
+            width (Optional[int]): Ширина лабиринта или None для неограниченной ширины.
+        """
+        self._tile_height = tile_height
+        self._tile_width = tile_width
+        self._seed = seed
+        self._generator = generator
+        self._cache_size = cache_size
+        self._height = height
+        self._width = width
+
+        self._tiles = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def height(self) -> Optional[int]:
+        """
+        Возвращает высоту рабочей части лабиринта.
+
+        Returns:
+            Optional[int]: Высота или None, если лабиринт не ограничен по высоте.
+        """
+        return self._height
+
+    @property
+    def width(self) -> Optional[int]:
+        """
+        Возвращает ширину рабочей части лабиринта.
+
+        Returns:
+            Optional[int]: Ширина или None, если лабиринт не ограничен по ширине.
+        """
+        return self._width
+
+    @property
+    def hits(self) -> int:
+        """
+        Возвращает число обращений к плиткам, найденным в кеше.
+
+        Returns:
+            int: Число попаданий в кеш.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Возвращает число обращений к плиткам, которые пришлось сгенерировать.
+
+        Returns:
+            int: Число промахов кеша.
+        """
+        return self._misses
+
+    @property
+    def cached_tiles(self) -> int:
+        """
+        Возвращает число плиток, находящихся в кеше.
+
+        Returns:
+            int: Число плиток в кеше.
+        """
+        return len(self._tiles)
+
+    def _derive(self, *key) -> int:
+        """
+        Детерминированно выводит 64-битное число из общего зерна и ключа.
+
+        Args:
+            *key: Составляющие ключа (тип величины и номера плиток).
+
+        Returns:
+            int: Выведенное число.
+        """
+        digest = hashlib.blake2b(repr((self._seed,) + key).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'little')
+
+    def _tile_size(self, tile_row: int, tile_col: int) -> Tuple[int, int]:
+        """
+        Возвращает размеры плитки с учётом того, что плитки у края ограниченного лабиринта могут быть неполными.
+
+        Args:
+            tile_row (int): Строка плитки.
+            tile_col (int): Столбец плитки.
+
+        Returns:
+            Tuple[int, int]: Высота и ширина плитки.
+        """
+        height, width = self._tile_height, self._tile_width
+        if self._height is not None:
+            height = min(height, self._height - tile_row * self._tile_height)
+        if self._width is not None:
+            width = min(width, self._width - tile_col * self._tile_width)
+        return height, width
+
+    def _tile(self, tile_row: int, tile_col: int) -> Tuple[Maze, int, int]:
+        """
+        Возвращает плитку из кеша или генерирует её.
+
+        Args:
+            tile_row (int): Строка плитки.
+            tile_col (int): Столбец плитки.
+
+        Returns:
+            Tuple[Maze, int, int]: Лабиринт плитки, строка прохода в левой границе плитки и столбец прохода
+            в верхней границе плитки (в локальных координатах плитки).
+        """
+        key = (tile_row, tile_col)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._hits += 1
+            self._tiles.move_to_end(key)
+            return tile
+
+        self._misses += 1
+        height, width = self._tile_size(tile_row, tile_col)
+        maze = self._generator.generate(height, width, seed=random.Random(self._derive('tile', tile_row, tile_col)))
+        left_opening = self._derive('left', tile_row, tile_col) % height + 1
+        upper_opening = self._derive('upper', tile_row, tile_col) % width + 1
+
+        tile = (maze, left_opening, upper_opening)
+        self._tiles[key] = tile
+        if len(self._tiles) > self._cache_size:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def coordinate_inside_map(self, coordinate: Coordinate, consider_auxiliary_area: bool = False) -> bool:
+        """
+        Проверяет, находятся ли заданные координаты внутри карты лабиринта.
+
+        Args:
+            coordinate (Coordinate): Проверяемая координата.
+            consider_auxiliary_area (bool): Учитывать ли вспомогательные границы карты.
+
+        Returns:
+            bool: True, если заданные координаты находятся внутри карты, иначе False.
+        """
+        low = 0 if consider_auxiliary_area else 1
+        extra = 1 if consider_auxiliary_area else 0
+        if coordinate.row < low or coordinate.col < low:
+            return False
+        if self._height is not None and coordinate.row > self._height + extra:
+            return False
+        if self._width is not None and coordinate.col > self._width + extra:
+            return False
+        return True
+
+    def get_cell(self, coordinate: Coordinate) -> Cell:
+        """
+        Возвращает ячейку по заданным координатам. Стены на границах плиток закрыты всюду, кроме проходов
+        между плитками.
+
+        Args:
+            coordinate (Coordinate): Координаты ячейки.
+
+        Returns:
+            Cell: Копия ячейки с заданными координатами (изменение которой не влияет на лабиринт).
+        """
+        if not self.coordinate_inside_map(coordinate, consider_auxiliary_area=True):
+            return None
+        if not self.coordinate_inside_map(coordinate):
+            below = self._height is not None and coordinate.row == self._height + 1 and coordinate.col > 0
+            right = self._width is not None and coordinate.col == self._width + 1 and coordinate.row > 0
+            return Cell(left_wall=right and not below, upper_wall=below and not right, captured=True)
+
+        tile_row, local_row = divmod(coordinate.row - 1, self._tile_height)
+        tile_col, local_col = divmod(coordinate.col - 1, self._tile_width)
+        maze, left_opening, upper_opening = self._tile(tile_row, tile_col)
+        cell = maze.get_cell(Coordinate(local_row + 1, local_col + 1))
+
+        left_wall = cell.left_wall
+        if local_col == 0:
+            left_wall = tile_col == 0 or local_row + 1 != left_opening
+        upper_wall = cell.upper_wall
+        if local_row == 0:
+            upper_wall = tile_row == 0 or local_col + 1 != upper_opening
+
+        return Cell(left_wall=left_wall, upper_wall=upper_wall, captured=False)
+
+    def check_wall(self, cur: Coordinate, neighbor: Coordinate) -> bool:
+        """
+        Проверяет, есть ли стена между двумя соседними ячейками.
+
+        Args:
+            cur (Coordinate): Текущая ячейка.
+            neighbor (Coordinate): Соседняя ячейка.
+
+        Returns:
+            bool: True, если между ячейками есть стена, иначе False.
+        """
+        if neighbor.row < cur.row:
+            return self.get_cell(cur).upper_wall
+        if neighbor.row > cur.row:
+            return self.get_cell(neighbor).upper_wall
+        if neighbor.col < cur.col:
+            return self.get_cell(cur).left_wall
+        if neighbor.col > cur.col:
+            return self.get_cell(neighbor).left_wall
@@ -0,0 +1,212 @@
+from array import array
+from typing import List, Optional, Tuple
+
+from src.coordinate import Coordinate
+from src.maze import Maze, PASSAGE_RIGHT, PASSAGE_DOWN, PASSAGE_LEFT, PASSAGE_UP
+
+# Таблица для bytes.translate: число проходов вправо и вниз - каждый проход лабиринта учитывается ровно один раз.
+_FORWARD_PASSAGES = bytes(bool(mask & PASSAGE_RIGHT) + bool(mask & PASSAGE_DOWN) for mask in range(256))
+
+
+class TreePathIndex:
+    """
+    Индекс расстояний и путей в идеальном лабиринте (лабиринте без циклов, проходы которого образуют дерево).
+
+    Индекс строится один раз за O(n) по числу клеток: каждая компонента связности подвешивается за корень,
+    запоминаются родители, глубины и эйлеров обход. Над глубинами эйлерова обхода строится разреженная таблица
+    минимумов по блокам, поэтому глубина наименьшего общего предка, а значит и расстояние между клетками,
+    находится за O(1), а путь восстанавливается подъёмом по родителям за O(длины пути).
+    """
+    BLOCK = 32
+
+    def __init__(self, maze: Maze):
+        """
+        Строит индекс для лабиринта.
+
+        Args:
+            maze (Maze): Идеальный лабиринт.
+
+        Raises:
+            ValueError: Если в лабиринте есть циклы и расстояния по дереву не совпадают с кратчайшими.
+        """
+        self._maze = maze
+        masks = maze.passage_masks()
+
+        cells = maze.height * maze.width
+        edges = sum(masks.translate(_FORWARD_PASSAGES))
+        if edges >= cells:
+            raise ValueError(f"Лабиринт содержит циклы ({edges} проходов на {cells} клеток), "
+                             f"TreePathIndex применим только к идеальным лабиринтам.")
+
+        size = len(masks)
+        self._parent = array('i', [-1]) * size
+        self._depth = array('i', [-1]) * size
+        self._first = array('i', [-1]) * size
+        self._component = array('i', [-1]) * size
+        self._euler_depth = array('i')
+
+        self._build_tour(masks)
+        self._build_sparse_table()
+
+    def _build_tour(self, masks: bytes) -> None:
+        """
+        Подвешивает каждую компоненту связности за её первую клетку и строит эйлеров обход итеративным поиском
+        в глубину.
+
+        Args:
+            masks (bytes): Маски проходов лабиринта.
+        """
+        map_width = self._maze.map_width
+        step = {PASSAGE_RIGHT: 1, PASSAGE_DOWN: map_width, PASSAGE_LEFT: -1, PASSAGE_UP: -map_width}
+        parent, depth, first, component = self._parent, self._depth, self._first, self._component
+        euler_depth = self._euler_depth
+
+        visited = bytearray(b'\x01' * len(masks))
+        for row in range(1, self._maze.height + 1):
+            visited[row * map_width + 1:row * map_width + 1 + self._maze.width] = b'\x00' * self._maze.width
+
+        root = visited.find(0)
+        while root >= 0:
+            parent[root] = root
+            depth[root] = 0
+            first[root] = len(euler_depth)
+            component[root] = root
+            euler_depth.append(0)
+            visited[root] = 1
+
+            stack = [root]
+            pending = [masks[root]]
+            while stack:
+                remaining = pending[-1]
+                if not remaining:
+                    stack.pop()
+                    pending.pop()
+                    if stack:
+                        euler_depth.append(depth[stack[-1]])
+                    continue
+
+                bit = remaining & -remaining
+                pending[-1] = remaining ^ bit
+                cur = stack[-1]
+                child = cur + step[bit]
+                if child == parent[cur]:
+                    continue
+                if visited[child]:
+                    raise ValueError("Лабиринт содержит циклы, TreePathIndex применим только к идеальным лабиринтам.")
+
+                visited[child] = 1
+                parent[child] = cur
+                depth[child] = depth[cur] + 1
+                first[child] = len(euler_depth)
+                component[child] = root
+                euler_depth.append(depth[child])
+                stack.append(child)
+                pending.append(masks[child])
+
+            root = visited.find(0, root)
+
+    def _build_sparse_table(self) -> None:
+        """
+        Строит разреженную таблицу минимумов по блокам эйлерова обхода: уровень k хранит минимальную глубину
+        на отрезках из 2^k подряд идущих блоков.
+        """
+        euler_depth = self._euler_depth
+        level = array('i', (min(euler_depth[i:i + self.BLOCK]) for i in range(0, len(euler_depth), self.BLOCK)))
+        self._table = [level]
+
+        blocks = len(level)
+        span = 1
+        while 2 * span <= blocks:
+            prev = level
+            level = array('i', map(min, prev[:len(prev) - span], prev[span:]))
+            self._table.append(level)
+            span *= 2
+
+    def _min_depth(self, left: int, right: int) -> int:
+        """
+        Находит минимальную глубину на отрезке эйлерова обхода [left, right].
+
+        Args:
+            left (int): Начало отрезка.
+            right (int): Конец отрезка (включительно).
+
+        Returns:
+            int: Минимальная глубина на отрезке.
+        """
+        euler_depth = self._euler_depth
+        left_block, right_block = left // self.BLOCK, right // self.BLOCK
+        if left_block == right_block:
+            return min(euler_depth[left:right + 1])
+
+        result = min(min(euler_depth[left:(left_block + 1) * self.BLOCK]),
+                     min(euler_depth[right_block * self.BLOCK:right + 1]))
+        if left_block + 1 < right_block:
+            begin, end = left_block + 1, right_block - 1
+            level = (end - begin + 1).bit_length() - 1
+            table = self._table[level]
+            result = min(result, table[begin], table[end - (1 << level) + 1])
+        return result
+
+    def distance(self, a: Coordinate, b: Coordinate) -> Optional[int]:
+        """
+        Возвращает длину пути (число переходов) между двумя клетками.
+
+        Args:
+            a (Coordinate): Первая клетка.
+            b (Coordinate): Вторая клетка.
+
+        Returns:
+            Optional[int]: Расстояние или None, если клетки лежат в разных компонентах связности.
+        """
+        u, v = self._maze.index(a), self._maze.index(b)
+        if self._component[u] != self._component[v]:
+            return None
+
+        left, right = sorted((self._first[u], self._first[v]))
+        return self._depth[u] + self._depth[v] - 2 * self._min_depth(left, right)
+
+    def path(self, a: Coordinate, b: Coordinate) -> List[Coordinate]:
+        """
+        Восстанавливает единственный путь между двумя клетками подъёмом по родителям до общего предка.
+
+        Args:
+            a (Coordinate): Начальная клетка.
+            b (Coordinate): Конечная клетка.
+
+        Returns:
+            List[Coordinate]: Путь от a до b или пустой список, если клетки не связаны.
+        """
+        u, v = self._maze.index(a), self._maze.index(b)
+        if self._component[u] != self._component[v]:
+            return []
+
+        parent, depth = self._parent, self._depth
+        head, tail = [], []
+        while depth[u] > depth[v]:
+            head.append(u)
+            u = parent[u]
+        while depth[v] > depth[u]:
+            tail.append(v)
+            v = parent[v]
+        while u != v:
+            head.append(u)
+            tail.append(v)
+            u, v = parent[u], parent[v]
+        head.append(u)
+        head.extend(reversed(tail))
+
+        return [self._maze.coordinate(index) for index in head]
+
+    def solve(self, start: Coordinate, finish: Coordinate) -> Tuple[bool, List[Coordinate]]:
+        """
+        Находит путь между клетками в формате решателей ISolver.
+
+        Args:
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и сам путь.
+        """
+        path = self.path(start, finish)
+        return len(path) > 0, path
@@ -1,12 +1,12 @@
-import os
 from enum import Enum
 from typing import Tuple, Optional
 
 from src.coordinate import Coordinate
-from src.generator import KruskalGenerator, BacktrackGenerator
+from src.generator import KruskalGenerator, BacktrackGenerator, EllerGenerator
 from src.maze import Maze
 from src.renderer import ConsoleRenderer
-from src.solver import BacktrackSolver, BreadthFirstSearchSolver
+from src.solver import AStarSolver, BacktrackSolver, BidirectionalBFSSolver, BreadthFirstSearchSolver
+from src.stats import Stats
 
 
 class UserInteraction:
@@ -16,6 +16,7 @@ class UserInteraction:
         """
         BACKTRACKING = (1, "Метод рекурсивного бэктрекинга")
         KRUSKAL = (2, "Алгоритм Краскала")
+        ELLER = (3, "Алгоритм Эллера")
 
         def __init__(self, value, description):
             self._value_ = value
@@ -27,19 +28,24 @@ class UserInteraction:
         """
         BACKTRACKING = (1, "Метод рекурсивного бэктрекинга")
         BFS = (2, "Поиск в ширину")
+        ASTAR = (3, "A* с манхэттенской эвристикой")
+        BIDIRECTIONAL_BFS = (4, "Двунаправленный поиск в ширину")
 
         def __init__(self, value, description):
             self._value_ = value
             self.description = description
 
     @staticmethod
-    def read_maze_params_and_gen_maze() -> None:
+    def read_maze_params_and_gen_maze(stats: Optional[Stats] = None) -> None:
         """
         Считывание параметров лабиринта (размеры и метод генерации) и решение с использованием выбранного метода.
 
         Генерирует лабиринт на основе введённых пользователем параметров, решает его с использованием
         выбранного алгоритма, выводит результат (найден ли путь) и визуализирует лабиринт с маршрутом.
 
+        Args:
+            stats (Optional[Stats]): Статистика генерации, решения и отрисовки.
+
         Returns:
             None
         """
@@ -49,25 +55,31 @@ class UserInteraction:
 
         maze: Maze = Maze(height, width)
         if generator_params[0] == UserInteraction.GeneratorAlgorithm.BACKTRACKING:
-            maze = BacktrackGenerator.generate(height, width, generator_params[1])
+            maze = BacktrackGenerator.generate(height, width, generator_params[1], stats=stats)
         elif generator_params[0] == UserInteraction.GeneratorAlgorithm.KRUSKAL:
-            maze = KruskalGenerator.generate(height, width)
+            maze = KruskalGenerator.generate(height, width, stats=stats)
+        elif generator_params[0] == UserInteraction.GeneratorAlgorithm.ELLER:
+            maze = EllerGenerator.generate(height, width, stats=stats)
 
         solver_method, start, finish = UserInteraction.read_solver_params(height, width)
 
         ok: bool = False
         path: list[Coordinate] = []
         if solver_method == UserInteraction.SolverAlgorithm.BACKTRACKING:
-            ok, path = BacktrackSolver.solve(maze, start, finish)
+            ok, path = BacktrackSolver.solve(maze, start, finish, stats)
         elif solver_method == UserInteraction.SolverAlgorithm.BFS:
-            ok, path = BreadthFirstSearchSolver.solve(maze, start, finish)
+            ok, path = BreadthFirstSearchSolver.solve(maze, start, finish, stats)
+        elif solver_method == UserInteraction.SolverAlgorithm.ASTAR:
+            ok, path = AStarSolver.solve(maze, start, finish, stats)
+        elif solver_method == UserInteraction.SolverAlgorithm.BIDIRECTIONAL_BFS:
+            ok, path = BidirectionalBFSSolver.solve(maze, start, finish, stats)
 
         if ok:
             print("\nПуть найден!\n")
-            ConsoleRenderer.print_to_console(maze, path)
+            ConsoleRenderer.print_to_console(maze, path, stats)
         else:
             print("\nПуть не найден!")
-            ConsoleRenderer.print_to_console(maze)
+            ConsoleRenderer.print_to_console(maze, stats=stats)
 
     @staticmethod
     def read_height_width() -> Tuple[int, int]:
@@ -117,11 +129,9 @@ class UserInteraction:
         """
 
         UserInteraction.clear_console()
-        msg = f"Выберите метод генерации лабиринта: " \
-              f"{UserInteraction.GeneratorAlgorithm.BACKTRACKING.value} - " \
-              f"{UserInteraction.GeneratorAlgorithm.BACKTRACKING.description}, " \
-              f"{UserInteraction.GeneratorAlgorithm.KRUSKAL.value} - " \
-              f"{UserInteraction.GeneratorAlgorithm.KRUSKAL.description}.\n"
+        msg = "Выберите метод генерации лабиринта: " + \
+              ", ".join(f"{algorithm.value} - {algorithm.description}"
+                        for algorithm in UserInteraction.GeneratorAlgorithm) + ".\n"
 
         print(msg)
         method = UserInteraction.read_natural_number(len(UserInteraction.GeneratorAlgorithm))
@@ -154,11 +164,9 @@ class UserInteraction:
         """
 
         UserInteraction.clear_console()
-        msg = f"Выберите метод решения лабиринта: " \
-              f"{UserInteraction.SolverAlgorithm.BACKTRACKING.value} - " \
-              f"{UserInteraction.SolverAlgorithm.BACKTRACKING.description}, " \
-              f"{UserInteraction.SolverAlgorithm.BFS.value} - " \
-              f"{UserInteraction.SolverAlgorithm.BFS.description}.\n"
+        msg = "Выберите метод решения лабиринта: " + \
+              ", ".join(f"{algorithm.value} - {algorithm.description}"
+                        for algorithm in UserInteraction.SolverAlgorithm) + ".\n"
 
         print(msg)
         method = UserInteraction.read_natural_number(len(UserInteraction.SolverAlgorithm))
@@ -234,4 +242,5 @@ class UserInteraction:
         Returns:
             None
         """
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Управляющая последовательность ANSI вместо запуска внешней команды clear/cls на каждом экране.
+        print('\033[H\033[2J', end='', flush=True)
@@ -0,0 +1,261 @@
+from typing import Iterable, List, Optional, Tuple
+
+from src.cell import LEFT_WALL, UPPER_WALL
+from src.coordinate import Coordinate
+from src.maze import Maze
+from src.solver import ISolver
+from src.stats import Stats
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость, без неё векторизованные решатели недоступны.
+    np = None
+
+
+def passage_arrays(maze: Maze) -> List[Tuple['np.ndarray', int]]:
+    """
+    Вычисляет по массивам стен маски проходов в каждом из четырёх направлений для всей карты сразу.
+
+    Args:
+        maze (Maze): Лабиринт.
+
+    Returns:
+        List[Tuple[np.ndarray, int]]: Для направлений вправо, вниз, влево и вверх - булев массив размера карты
+        (True, если из клетки можно перейти в соседнюю в этом направлении) и сдвиг смещения клетки.
+    """
+    if np is None:
+        raise ImportError("Для векторизованного поиска необходим пакет numpy (poetry install --extras fast).")
+
+    height, width, map_width = maze.height, maze.width, maze.map_width
+    flags = np.frombuffer(maze.buffer, dtype=np.uint8).reshape(maze.map_height, map_width)
+
+    # Переход влево или вверх открыт, если у самой клетки нет соответствующей стены и соседняя клетка лежит
+    # в рабочей части карты. Переход вправо и вниз - это переход влево и вверх из соседней клетки.
+    left = np.zeros(flags.shape, dtype=bool)
+    up = np.zeros(flags.shape, dtype=bool)
+    left[1:height + 1, 2:width + 1] = (flags[1:height + 1, 2:width + 1] & LEFT_WALL) == 0
+    up[2:height + 1, 1:width + 1] = (flags[2:height + 1, 1:width + 1] & UPPER_WALL) == 0
+    right = np.zeros(flags.shape, dtype=bool)
+    down = np.zeros(flags.shape, dtype=bool)
+    right[:, :-1] = left[:, 1:]
+    down[:-1] = up[1:]
+
+    return [(right.ravel(), 1), (down.ravel(), map_width), (left.ravel(), -1), (up.ravel(), -map_width)]
+
+
+def frontier_search(directions: List[Tuple['np.ndarray', int]], origin: int,
+                    targets: List[int]) -> Tuple['np.ndarray', 'np.ndarray', int, int]:
+    """
+    Поиск в ширину по уровням с фронтом в виде массива смещений клеток.
+
+    Args:
+        directions (List[Tuple[np.ndarray, int]]): Маски проходов по направлениям и сдвиги (см. passage_arrays).
+        origin (int): Смещение клетки-источника.
+        targets (List[int]): Смещения клеток, после достижения которых поиск можно остановить.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, int, int]: Расстояния, родители, число раскрытых клеток и наибольший
+        размер фронта.
+    """
+    size = len(directions[0][0])
+    distance = np.full(size, -1, dtype=np.int32)
+    parent = np.full(size, -1, dtype=np.int32)
+    distance[origin] = 0
+    parent[origin] = origin
+    targets = np.array(targets, dtype=np.int64)
+    frontier = np.array([origin], dtype=np.int64)
+
+    level = 0
+    expanded = 0
+    peak = 1
+    while frontier.size:
+        expanded += frontier.size
+        if targets.size and (parent[targets] >= 0).all():
+            break
+
+        level += 1
+        reached = []
+        for passable, step in directions:
+            cells = frontier[passable[frontier]]
+            neighbors = cells + step
+            fresh = parent[neighbors] < 0
+            neighbors = neighbors[fresh]
+            parent[neighbors] = cells[fresh]
+            distance[neighbors] = level
+            reached.append(neighbors)
+        frontier = np.concatenate(reached)
+        peak = max(peak, frontier.size)
+    return distance, parent, expanded, peak
+
+
+class VectorizedBFSSolver(ISolver):
+    """
+    Поиск в ширину на NumPy, раскрывающий за один шаг весь уровень (все клетки на одном расстоянии от старта).
+
+    Фронт хранится массивом смещений клеток. Для каждого направления выбираются клетки фронта с открытым
+    проходом, их соседи отсеиваются по таблице родителей (ещё не достигнутые клетки), и родители записываются
+    одним присваиванием. Сосед, достигнутый из двух клеток фронта, отсеивается при обработке второго направления,
+    поэтому новый фронт не содержит повторов без отдельной дедупликации. Число операций на Python пропорционально
+    числу уровней, а не числу клеток.
+    """
+    @staticmethod
+    def solve(maze: Maze, start: Coordinate, finish: Coordinate,
+              stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
+        """
+        Решает лабиринт векторизованным поиском в ширину.
+
+        Args:
+            maze (Maze): Лабиринт, в котором нужно найти путь.
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и кратчайший путь.
+        """
+        stats = Stats.ensure(stats)
+        distance, parent = VectorizedBFSSolver.distance_field(maze, start, (finish,), stats)
+        target = maze.index(finish)
+        if distance[target] < 0:
+            return False, []
+
+        path = ISolver.restore_path(maze, parent.data, maze.index(start), target)
+        stats.lap('path')
+        return True, path
+
+    @staticmethod
+    def distance_field(maze: Maze, source: Coordinate, until: Iterable[Coordinate] = (),
+                       stats: Optional[Stats] = None) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Векторизованный аналог BreadthFirstSearchSolver.distance_field.
+
+        Args:
+            maze (Maze): Лабиринт.
+            source (Coordinate): Клетка-источник.
+            until (Iterable[Coordinate]): Клетки, после достижения которых поиск можно остановить. Если не заданы,
+                обходится вся компонента связности источника.
+            stats (Optional[Stats]): Статистика поиска.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Расстояния и родители (int32, -1 для недостигнутых клеток, у источника
+            родитель - он сам).
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        directions = passage_arrays(maze)
+        stats.lap('reset')
+
+        distance, parent, expanded, peak = frontier_search(directions, maze.index(source),
+                                                           [maze.index(target) for target in until])
+        stats.lap('search')
+
+        stats.record(nodes_expanded=expanded, walls_checked=4 * expanded, frontier=peak)
+        return distance, parent
+
+
+class DeadEndFillingSolver(ISolver):
+    """
+    Решатель заполнением тупиков, векторизованный по всей сетке.
+
+    Для каждой клетки считается число открытых проходов к ещё не заполненным соседям (степень). Каждый проход
+    заполняет все текущие тупики - клетки степени не больше 1, кроме старта и финиша, - и уменьшает степень их
+    соседей. Первый проход просматривает всю сетку, следующие - только соседей клеток, заполненных на предыдущем
+    проходе. Число проходов равно длине самого длинного тупикового ответвления. В идеальном лабиринте после
+    заполнения остаётся ровно коридор решения; в лабиринте с циклами остаются и циклы, но ни одна клетка
+    кратчайшего пути не заполняется, поэтому путь затем ищется поиском в ширину только по оставшимся клеткам.
+
+    Как и VectorizedBFSSolver, требует NumPy (дополнительная зависимость fast).
+    """
+    @staticmethod
+    def solve(maze: Maze, start: Coordinate, finish: Coordinate,
+              stats: Optional[Stats] = None) -> Tuple[bool, List[Coordinate]]:
+        """
+        Решает лабиринт заполнением тупиков.
+
+        Args:
+            maze (Maze): Лабиринт, в котором нужно найти путь.
+            start (Coordinate): Начальная координата.
+            finish (Coordinate): Конечная координата.
+            stats (Optional[Stats]): Статистика поиска. Число проходов заполнения записывается в Stats.passes.
+
+        Returns:
+            Tuple[bool, List[Coordinate]]: Признак того, что путь найден, и кратчайший путь.
+        """
+        stats = Stats.ensure(stats)
+        stats.begin()
+        directions = passage_arrays(maze)
+        source, target = maze.index(start), maze.index(finish)
+        stats.lap('reset')
+
+        alive, passes, sealed, peak = DeadEndFillingSolver.fill(maze, directions, source, target)
+        stats.lap('fill')
+
+        # Поиск пути только по незаполненным клеткам: проход открыт, если открыт и соседняя клетка не заполнена.
+        corridor = []
+        for passable, step in directions:
+            open_to_alive = np.zeros_like(passable)
+            if step > 0:
+                open_to_alive[:-step] = passable[:-step] & alive[step:]
+            else:
+                open_to_alive[-step:] = passable[-step:] & alive[:step]
+            corridor.append((open_to_alive, step))
+        distance, parent, expanded, _ = frontier_search(corridor, source, [target])
+        stats.record(nodes_expanded=sealed + expanded, walls_checked=4 * (sealed + expanded), frontier=peak,
+                     passes=passes)
+        if distance[target] < 0:
+            return False, []
+
+        path = ISolver.restore_path(maze, parent.data, source, target)
+        stats.lap('path')
+        return True, path
+
+    @staticmethod
+    def fill(maze: Maze, directions: List[Tuple['np.ndarray', int]], source: int,
+             target: int) -> Tuple['np.ndarray', int, int, int]:
+        """
+        Заполняет тупики лабиринта.
+
+        Args:
+            maze (Maze): Лабиринт.
+            directions (List[Tuple[np.ndarray, int]]): Маски проходов по направлениям (см. passage_arrays).
+            source (int): Смещение стартовой клетки.
+            target (int): Смещение конечной клетки.
+
+        Returns:
+            Tuple[np.ndarray, int, int, int]: Маска незаполненных клеток рабочей части, число проходов, число
+            заполненных клеток и наибольшее число клеток, заполненных за один проход.
+        """
+        alive = np.zeros((maze.map_height, maze.map_width), dtype=bool)
+        alive[1:maze.height + 1, 1:maze.width + 1] = True
+        alive = alive.ravel()
+        degree = np.zeros(len(alive), dtype=np.uint8)
+        for passable, _ in directions:
+            degree += passable
+
+        candidates = np.flatnonzero(alive & (degree <= 1))
+        order = np.empty(len(alive), dtype=np.int64)
+        passes = 0
+        sealed = 0
+        peak = 0
+        while True:
+            dead = candidates[alive[candidates] & (candidates != source) & (candidates != target)]
+            # Клетка, ставшая тупиком сразу с двух сторон, попадает в кандидаты дважды: оставляется одно вхождение.
+            order[dead] = np.arange(dead.size)
+            dead = dead[order[dead] == np.arange(dead.size)]
+            if not dead.size:
+                break
+
+            passes += 1
+            sealed += dead.size
+            peak = max(peak, dead.size)
+            alive[dead] = False
+            touched = []
+            for passable, step in directions:
+                # Для одного направления соседи разных клеток различны, поэтому степень уменьшается без np.add.at.
+                neighbors = dead[passable[dead]] + step
+                neighbors = neighbors[alive[neighbors]]
+                degree[neighbors] -= 1
+                touched.append(neighbors)
+            candidates = np.concatenate(touched)
+            candidates = candidates[degree[candidates] <= 1]
+        return alive, passes, sealed, peak
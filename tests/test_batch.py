@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from src.batch import BatchRunner
+from src.coordinate import Coordinate
+from src.maze import Maze
+
+
+class TestBatchRunner:
+    def test_parse_json_lines_manifest(self):
+        lines = [
+            json.dumps({'id': 'a', 'algorithm': 'kruskal', 'height': 4, 'width': 6, 'seed': 1}),
+            '',
+            json.dumps({'algorithm': 'backtracking', 'height': 3, 'width': 3, 'start': [2, 2], 'finish': [1, 3],
+                        'solver': 'backtracking'}),
+        ]
+        first, second = BatchRunner.parse_manifest(lines)
+
+        assert first.id == 'a' and first.seed == 1
+        assert first.start == Coordinate(1, 1) and first.finish == Coordinate(4, 6)
+        assert second.id == '1' and second.seed is None and second.solver == 'backtracking'
+        assert second.start == Coordinate(2, 2) and second.finish == Coordinate(1, 3)
+
+    def test_parse_csv_manifest(self):
+        lines = ['id,algorithm,height,width,seed,start_row,start_col,finish_row,finish_col,solver\n',
+                 'x,kruskal,5,5,9,1,1,5,5,bfs\n']
+        task, = BatchRunner.parse_manifest(lines, csv_format=True)
+
+        assert task.id == 'x' and task.seed == 9 and task.finish == Coordinate(5, 5)
+
+    def test_parse_manifest_rejects_unknown_algorithm(self):
+        with pytest.raises(ValueError):
+            BatchRunner.parse_manifest([json.dumps({'algorithm': 'prim', 'height': 2, 'width': 2})])
+
+    def test_run_returns_all_results(self):
+        lines = [json.dumps({'id': str(i), 'algorithm': 'kruskal', 'height': 6, 'width': 7, 'seed': i})
+                 for i in range(6)]
+        tasks = BatchRunner.parse_manifest(lines)
+
+        results = list(BatchRunner.run(tasks, max_workers=2, chunk_size=2, include_maze=True))
+
+        assert sorted(result.id for result in results) == [str(i) for i in range(6)]
+        for result in results:
+            assert result.found and result.generate_seconds >= 0
+            assert Maze.from_bytes(result.maze).fingerprint() == result.fingerprint
@@ -0,0 +1,112 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src import cli
+from src import main as main_module
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator, KruskalGenerator
+from src.maze import Maze
+from src.solver import BreadthFirstSearchSolver
+
+
+def run(argv, monkeypatch, capsys, stdin=b''):
+    monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BytesIO(stdin)))
+    code = cli.main(argv)
+    return code, capsys.readouterr()
+
+
+class TestCli:
+    def test_generate_to_file_and_solve(self, monkeypatch, capsys, tmp_path):
+        path = str(tmp_path / 'maze.bin')
+        argv = ['generate', '--height', '6', '--width', '7', '--seed', '3', '-o', path]
+        assert run(argv, monkeypatch, capsys)[0] == 0
+        maze = Maze.load(path)
+        assert maze.fingerprint() == KruskalGenerator.generate(6, 7, seed=3).fingerprint()
+        assert Maze.read_header(path).algorithm == 'kruskal'
+
+        code, output = run(['solve', '--maze', path, '--start', '1', '1', '--finish', '6', '7'], monkeypatch, capsys)
+        expected = BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(6, 7))[1]
+        assert code == 0 and json.loads(output.out) == {'found': True, 'length': len(expected),
+                                                        'path': [[c.row, c.col] for c in expected]}
+
+    def test_stdin_maze_and_params(self, monkeypatch, capsys, tmp_path):
+        maze = KruskalGenerator.generate(5, 5, seed=1)
+        code, output = run(['render', '--solver', 'astar'], monkeypatch, capsys, maze.to_bytes())
+        assert code == 0 and 'S' in output.out and 'F' in output.out
+
+        path = str(tmp_path / 'maze.bin')
+        maze.save(path)
+        params = json.dumps({'maze': path, 'solver': 'bidirectional_bfs', 'finish': [3, 3], 'no_path': True})
+        code, output = run(['--params', '-', 'solve', '--finish', '5', '5'], monkeypatch, capsys, params.encode())
+        assert json.loads(output.out) == {'found': True,
+                                          'length': len(BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1),
+                                                                                       Coordinate(5, 5))[1])}
+
+        with pytest.raises(SystemExit):
+            run(['--params', '-', 'solve'], monkeypatch, capsys, b'{"height": 5}')
+
+    def test_errors_and_bench(self, monkeypatch, capsys):
+        data = KruskalGenerator.generate(4, 4, seed=2).to_bytes()
+        code, output = run(['solve', '--finish', '9', '9'], monkeypatch, capsys, data)
+        assert code == 1 and 'solve:' in output.err
+        assert run(['generate'], monkeypatch, capsys)[0] == 1
+
+        code, output = run(['bench', '--height', '8', '--width', '9', '--repeat', '2', '--render'], monkeypatch, capsys)
+        record = json.loads(output.out)
+        assert code == 0 and record['found'] and record['repeat'] == 2
+        assert {'generate', 'search', 'render'} <= set(record['phases'])
+
+    def test_bench_rejects_zero_repeat(self, monkeypatch, capsys):
+        for argv, stdin in ((['bench', '--height', '4', '--width', '4', '--repeat', '0'], b''),
+                            (['--params', '-', 'bench'], b'{"height": 4, "width": 4, "repeat": 0}')):
+            with pytest.raises(SystemExit) as exit_info:
+                run(argv, monkeypatch, capsys, stdin)
+            assert exit_info.value.code == 2 and '--repeat' in capsys.readouterr().err
+
+    def test_stdin_saved_file_is_checked(self, monkeypatch, capsys, tmp_path):
+        path = tmp_path / 'maze.bin'
+        maze = KruskalGenerator.generate(4, 5, seed=1)
+        maze.save(str(path))
+        data = path.read_bytes()
+        code, output = run(['solve', '--no-path'], monkeypatch, capsys, data)
+        assert code == 0 and json.loads(output.out)['found']
+
+        for corrupted in (data[:-1], data + b'\0'):
+            code, output = run(['solve'], monkeypatch, capsys, corrupted)
+            assert code == 1 and 'solve:' in output.err and output.out == ''
+
+    def test_origin_only_for_backtracking(self, monkeypatch, capsys, tmp_path):
+        path = str(tmp_path / 'maze.bin')
+        argv = ['generate', '--algorithm', 'backtracking', '--height', '5', '--width', '6', '--seed', '2',
+                '--origin', '3', '4', '-o', path]
+        assert run(argv, monkeypatch, capsys)[0] == 0
+        expected = BacktrackGenerator.generate(5, 6, Coordinate(3, 4), seed=2)
+        assert Maze.load(path).fingerprint() == expected.fingerprint()
+
+        code, output = run(['generate', '--height', '5', '--width', '5', '--origin', '2', '2'], monkeypatch, capsys)
+        assert code == 1 and '--origin' in output.err and output.out == ''
+
+    def test_vectorized_solver_without_numpy(self, monkeypatch, capsys):
+        from src import vectorized_solver
+
+        monkeypatch.setattr(vectorized_solver, 'np', None)
+        data = KruskalGenerator.generate(4, 4, seed=2).to_bytes()
+        code, output = run(['solve', '--solver', 'dead_end_filling'], monkeypatch, capsys, data)
+        assert code == 1 and 'numpy' in output.err and '--extras fast' in output.err
+
+    def test_main_dispatches_commands(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BytesIO(KruskalGenerator.generate(3, 3).to_bytes())))
+        with pytest.raises(SystemExit) as exit_info:
+            main_module.main(['solve', '--no-path'])
+        assert exit_info.value.code == 0
+        assert json.loads(capsys.readouterr().out)['found']
+
+    def test_import_is_lazy(self):
+        code = "import sys, src.cli; print(sorted(m for m in sys.modules if m.startswith('src.')))"
+        loaded = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        for module in ('src.generator', 'src.solver', 'src.renderer', 'src.user_interaction'):
+            assert module not in loaded
@@ -0,0 +1,22 @@
+from src.disjoint_set_union import DisjointSetUnion
+
+
+class TestDisjointSetUnion:
+    def test_unite_and_get_set(self):
+        dsu = DisjointSetUnion(5)
+        assert dsu.unite_sets(0, 1)
+        assert dsu.unite_sets(3, 4)
+        assert not dsu.unite_sets(1, 0)
+
+        assert dsu.get_set(0) == dsu.get_set(1)
+        assert dsu.get_set(3) == dsu.get_set(4)
+        assert dsu.get_set(0) != dsu.get_set(3)
+        assert dsu.get_set(2) == 2
+
+    def test_long_chain_without_recursion(self):
+        elements = 200_000
+        dsu = DisjointSetUnion(elements)
+        for v in range(1, elements):
+            dsu._parent[v] = v - 1
+
+        assert dsu.get_set(elements - 1) == 0
@@ -0,0 +1,64 @@
+import random
+
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator, EllerGenerator, KruskalGenerator
+from src.renderer import ConsoleRenderer
+from src.solver import BreadthFirstSearchSolver
+from src.tree_path_index import TreePathIndex
+
+
+def count_passages(maze):
+    passages = 0
+    for row in range(1, maze.height + 1):
+        for col in range(1, maze.width + 1):
+            cur = Coordinate(row, col)
+            for neighbor in (Coordinate(row + 1, col), Coordinate(row, col + 1)):
+                if maze.coordinate_inside_map(neighbor) and not maze.check_wall(cur, neighbor):
+                    passages += 1
+    return passages
+
+
+class TestBacktrackGenerator:
+    def test_generates_perfect_maze(self):
+        maze = BacktrackGenerator.generate(12, 9, Coordinate(6, 4))
+        assert count_passages(maze) == 12 * 9 - 1
+
+        found, path = BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(12, 9))
+        assert found
+
+    def test_handles_deep_mazes_without_recursion(self):
+        maze = BacktrackGenerator.generate(1, 50_000)
+        assert count_passages(maze) == 50_000 - 1
+
+    def test_same_seed_gives_same_maze(self):
+        first = BacktrackGenerator.generate(10, 10, seed=7)
+        second = BacktrackGenerator.generate(10, 10, seed=random.Random(7))
+        assert first.fingerprint() == second.fingerprint()
+        assert first.fingerprint() != BacktrackGenerator.generate(10, 10, seed=8).fingerprint()
+
+
+class TestKruskalGenerator:
+    def test_generates_perfect_maze(self):
+        maze = KruskalGenerator.generate(8, 11)
+        assert count_passages(maze) == 8 * 11 - 1
+
+    def test_same_seed_gives_same_maze(self):
+        first = KruskalGenerator.generate(10, 12, seed=3)
+        second = KruskalGenerator.generate(10, 12, seed=3)
+        assert first.fingerprint() == second.fingerprint()
+
+
+class TestEllerGenerator:
+    def test_generates_perfect_maze(self):
+        for height, width in ((1, 2), (7, 1), (13, 17)):
+            maze = EllerGenerator.generate(height, width, seed=height)
+            assert count_passages(maze) == height * width - 1
+            assert TreePathIndex(maze).distance(Coordinate(1, 1), Coordinate(height, width)) is not None
+
+    def test_rows_match_generated_maze(self):
+        maze = EllerGenerator.generate(6, 9, seed=5)
+        rows = list(EllerGenerator.iter_rows(6, 9, seed=5))
+
+        assert b''.join(rows) == maze.buffer
+        assert list(ConsoleRenderer.iter_lines_from_rows(iter(rows))) == \
+            [''.join(row) for row in ConsoleRenderer.render(maze)]
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from src.coordinate import Coordinate
+from src.generator import KruskalGenerator
+from src.incremental_solver import LifelongPlanningAStarSolver
+from src.solver import BreadthFirstSearchSolver
+
+
+def assert_valid_path(maze, path, start, finish):
+    assert path[0] == start and path[-1] == finish
+    for cur, neighbor in zip(path, path[1:]):
+        assert abs(cur.row - neighbor.row) + abs(cur.col - neighbor.col) == 1
+        assert not maze.check_wall(cur, neighbor)
+
+
+class TestLifelongPlanningAStarSolver:
+    def test_matches_bfs_under_random_edits(self):
+        rng = random.Random(5)
+        maze = KruskalGenerator.generate(12, 14, seed=5)
+        start, finish = Coordinate(1, 1), Coordinate(12, 14)
+        solver = LifelongPlanningAStarSolver(maze, start, finish)
+
+        for _ in range(150):
+            cell = Coordinate(rng.randint(1, 12), rng.randint(1, 14))
+            if rng.random() < 0.5:
+                maze.update_cell(cell, left_wall=not maze.get_cell(cell).left_wall)
+            else:
+                maze.update_cell(cell, upper_wall=not maze.get_cell(cell).upper_wall)
+
+            found, path = solver.solve()
+            expected_found, expected_path = BreadthFirstSearchSolver.solve(maze, start, finish)
+            assert found == expected_found
+            if found:
+                assert len(path) == len(expected_path)
+                assert_valid_path(maze, path, start, finish)
+
+    def test_local_edit_expands_few_cells(self):
+        maze = KruskalGenerator.generate(40, 40, seed=9)
+        start, finish = Coordinate(1, 1), Coordinate(40, 40)
+        solver = LifelongPlanningAStarSolver(maze, start, finish)
+        found, path = solver.solve()
+        initial = solver.expanded
+
+        # Открытие стены рядом с финишем, вне найденного пути, не должно вызывать перепросмотр всего лабиринта.
+        on_path = set(path)
+        cell = next(Coordinate(40, col) for col in range(39, 1, -1)
+                    if Coordinate(40, col) not in on_path and Coordinate(40, col - 1) not in on_path)
+        maze.update_cell(cell, left_wall=False)
+        assert solver.solve()[0]
+        assert solver.expanded < initial
+
+        solver.solve()
+        assert solver.expanded == 0
+
+    def test_unreachable_and_close(self, unsolvable_maze, start_finish_coordinates):
+        start, finish = start_finish_coordinates
+        solver = LifelongPlanningAStarSolver(unsolvable_maze, start, finish)
+        assert solver.solve() == (False, [])
+
+        for row in range(1, 6):
+            for col in range(1, 6):
+                unsolvable_maze.update_cell(Coordinate(row, col), left_wall=col == 1, upper_wall=row == 1)
+        found, path = solver.solve()
+        assert found and len(path) == 9
+
+        solver.close()
+        with pytest.raises(ValueError):
+            solver.close()
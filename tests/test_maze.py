@@ -0,0 +1,157 @@
+import pickle
+import tracemalloc
+
+import pytest
+
+from src.cell import Cell
+from src.coordinate import Coordinate, delta
+from src.generator import KruskalGenerator
+from src import maze as maze_module
+from src.maze import Maze
+from src.solver import BacktrackSolver, BreadthFirstSearchSolver
+
+
+class TestMazeStorage:
+    def test_map_is_one_byte_per_cell(self):
+        maze = Maze(4, 6)
+        assert len(maze.buffer) == maze.map_height * maze.map_width
+
+    def test_update_cell_through_view(self, simple_maze):
+        cell = simple_maze.get_cell(Coordinate(3, 3))
+        assert not cell.left_wall and not cell.upper_wall
+
+        cell.left_wall = True
+        assert simple_maze.check_wall(Coordinate(3, 3), Coordinate(3, 2))
+        assert not simple_maze.check_wall(Coordinate(3, 3), Coordinate(2, 3))
+
+        simple_maze.update_cell(Coordinate(3, 3), left_wall=False, upper_wall=True)
+        assert not cell.left_wall and cell.upper_wall
+
+    def test_set_cell_packs_flags(self, simple_maze):
+        simple_maze.set_cell(Coordinate(1, 2), Cell(left_wall=True, upper_wall=False, captured=True))
+        cell = simple_maze.get_cell(Coordinate(1, 2))
+        assert (cell.left_wall, cell.upper_wall, cell.captured) == (True, False, True)
+
+    def test_reset_captured_keeps_border(self):
+        maze = Maze(3, 3)
+        maze.update_cell(Coordinate(2, 2), captured=True)
+        maze.reset_captured()
+        assert not maze.get_cell(Coordinate(2, 2)).captured
+        assert maze.get_cell(Coordinate(2, 2)).left_wall
+        assert maze.get_cell(Coordinate(0, 2)).captured
+        assert maze.get_cell(Coordinate(2, 4)).captured
+
+    def test_index_roundtrip(self, simple_maze):
+        coordinate = Coordinate(4, 2)
+        assert simple_maze.coordinate(simple_maze.index(coordinate)) == coordinate
+
+    def test_passage_masks_match_check_wall(self, simple_maze):
+        masks = simple_maze.passage_masks()
+        for row in range(simple_maze.map_height):
+            for col in range(simple_maze.map_width):
+                cur = Coordinate(row, col)
+                expected = 0
+                for k, d in enumerate(delta):
+                    neighbor = Coordinate(row + d[0], col + d[1])
+                    if simple_maze.coordinate_inside_map(cur) and simple_maze.coordinate_inside_map(neighbor) \
+                            and not simple_maze.check_wall(cur, neighbor):
+                        expected |= 1 << k
+                assert masks[simple_maze.index(cur)] == expected
+
+    def test_passage_masks_in_chunks(self, monkeypatch):
+        maze = KruskalGenerator.generate(13, 17, seed=7)
+        expected = maze.passage_masks()
+        for chunk in (1, 19, 40, 1000):
+            monkeypatch.setattr(maze_module, '_MASK_CHUNK_CELLS', chunk)
+            assert Maze.from_bytes(maze.to_bytes()).passage_masks() == expected
+
+    def test_passage_masks_memory_is_bounded(self):
+        maze = Maze(800, 1200)
+        size = len(maze.buffer)
+        tracemalloc.start()
+        try:
+            maze.passage_masks()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < 3 * size
+
+    def test_passage_masks_cached_per_version(self, simple_maze):
+        masks = simple_maze.passage_masks()
+        assert simple_maze.passage_masks() is masks
+
+        cell = Coordinate(2, 2)
+        simple_maze.update_cell(cell, left_wall=not simple_maze.get_cell(cell).left_wall)
+        updated = simple_maze.passage_masks()
+        assert updated is not masks
+        assert updated[simple_maze.index(cell)] != masks[simple_maze.index(cell)]
+
+    def test_fingerprint_tracks_walls_only(self, simple_maze):
+        fingerprint = simple_maze.fingerprint()
+        simple_maze.update_cell(Coordinate(3, 3), captured=True)
+        assert simple_maze.fingerprint() == fingerprint
+
+        simple_maze.update_cell(Coordinate(3, 3), left_wall=True)
+        assert simple_maze.fingerprint() != fingerprint
+
+    def test_serialization_roundtrip(self, simple_maze):
+        restored = Maze.from_bytes(simple_maze.to_bytes())
+        assert restored.buffer == simple_maze.buffer
+        assert Maze.read_size(simple_maze.to_bytes()) == (simple_maze.height, simple_maze.width)
+        assert pickle.loads(pickle.dumps(simple_maze)).fingerprint() == simple_maze.fingerprint()
+
+
+class TestMazeFile:
+    def test_save_and_load(self, tmp_path):
+        maze = KruskalGenerator.generate(9, 13, seed=5)
+        path = str(tmp_path / 'maze.bin')
+        maze.save(path, algorithm='kruskal', seed=5)
+
+        header = Maze.read_header(path)
+        assert (header.height, header.width, header.algorithm, header.seed) == (9, 13, 'kruskal', 5)
+
+        loaded = Maze.load(path)
+        assert loaded.fingerprint() == maze.fingerprint()
+        assert loaded.check_wall(Coordinate(1, 1), Coordinate(1, 2)) == maze.check_wall(Coordinate(1, 1),
+                                                                                          Coordinate(1, 2))
+        assert BreadthFirstSearchSolver.solve(loaded, Coordinate(1, 1), Coordinate(9, 13)) == \
+            BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(9, 13))
+        assert BacktrackSolver.solve(loaded, Coordinate(9, 1), Coordinate(1, 13))[0]
+
+    def test_load_writable_persists_changes(self, tmp_path):
+        path = str(tmp_path / 'maze.bin')
+        Maze(3, 3).save(path)
+        assert Maze.read_header(path).seed is None
+
+        maze = Maze.load(path, writable=True)
+        maze.update_cell(Coordinate(2, 2), left_wall=False)
+        del maze
+
+        assert not Maze.load(path).check_wall(Coordinate(2, 2), Coordinate(2, 1))
+
+    def test_load_as_context_manager_closes_file(self, tmp_path):
+        path = str(tmp_path / 'maze.bin')
+        KruskalGenerator.generate(4, 5, seed=3).save(path)
+        with Maze.load(path) as loaded:
+            assert BreadthFirstSearchSolver.solve(loaded, Coordinate(1, 1), Coordinate(4, 5))[0]
+            assert loaded.external_buffer and loaded._masks is None
+        with pytest.raises(ValueError):
+            loaded.buffer[0]
+        loaded.close()
+        Maze(2, 2).close()
+
+    def test_from_file_bytes_checks_size(self, tmp_path):
+        path = tmp_path / 'maze.bin'
+        maze = KruskalGenerator.generate(3, 4, seed=2)
+        maze.save(str(path))
+        data = path.read_bytes()
+        assert Maze.from_file_bytes(data).fingerprint() == maze.fingerprint()
+        for corrupted in (data[:-1], data + b'\0', data[:10]):
+            with pytest.raises(ValueError):
+                Maze.from_file_bytes(corrupted)
+
+    def test_load_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / 'other.bin'
+        path.write_bytes(b'\0' * 100)
+        with pytest.raises(ValueError):
+            Maze.load(str(path))
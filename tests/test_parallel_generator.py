@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator, KruskalGenerator
+from src.parallel_generator import ParallelTiledGenerator, generate_tiles
+from src.solver import BreadthFirstSearchSolver
+from src.stats import Stats
+from tests.test_generator import count_passages
+
+
+def reachable_cells(maze):
+    distance, _ = BreadthFirstSearchSolver.distance_field(maze, Coordinate(1, 1))
+    return sum(1 for row in range(1, maze.height + 1) for col in range(1, maze.width + 1)
+               if distance[maze.index(Coordinate(row, col))] >= 0)
+
+
+class TestParallelTiledGenerator:
+    def test_generates_perfect_maze_from_uneven_tiles(self):
+        stats = Stats()
+        maze = ParallelTiledGenerator.generate(23, 31, seed=1, stats=stats, tile_height=5, tile_width=7,
+                                               executor=ThreadPoolExecutor(2))
+        assert count_passages(maze) == 23 * 31 - 1
+        assert reachable_cells(maze) == 23 * 31
+        assert {'generate', 'stitch'} <= set(stats.phases)
+        assert stats.walls_checked == 5 * 4 + 4 * 5
+
+    def test_result_does_not_depend_on_workers(self):
+        sequential = ParallelTiledGenerator.generate(20, 20, seed=4, tile_height=6, tile_width=6, max_workers=1)
+        parallel = ParallelTiledGenerator.generate(20, 20, seed=4, tile_height=6, tile_width=6, max_workers=2)
+        assert sequential.fingerprint() == parallel.fingerprint()
+        assert count_passages(parallel) == 20 * 20 - 1
+
+    def test_other_tile_generator_and_single_tile(self):
+        maze = ParallelTiledGenerator.generate(12, 12, seed=2, tile_height=4, tile_width=4,
+                                               generator=BacktrackGenerator, max_workers=1)
+        assert count_passages(maze) == 12 * 12 - 1
+
+        single = ParallelTiledGenerator.generate(6, 9, seed=3)
+        assert count_passages(single) == 6 * 9 - 1 and reachable_cells(single) == 6 * 9
+
+    def test_tiles_are_generated_in_bounded_window(self):
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, *args, **kwargs):
+                CountingExecutor.submitted += 1
+                return super().submit(*args, **kwargs)
+
+        tiles = [(0, 0, 3, 4)] * 10
+        with CountingExecutor(2) as executor:
+            for consumed, tile in enumerate(generate_tiles(executor, KruskalGenerator, tiles, range(10), 3), 1):
+                assert len(tile) == 5 * 6
+                assert CountingExecutor.submitted <= consumed + 2
+        assert CountingExecutor.submitted == 10
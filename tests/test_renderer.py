@@ -1,7 +1,13 @@
+import io
 import unittest
+
+import pytest
+
 from src.coordinate import Coordinate
+from src.generator import KruskalGenerator
 from src.maze import Maze
 from src.renderer import ConsoleRenderer
+from src.solver import BreadthFirstSearchSolver
 
 
 class TestConsoleRenderer(unittest.TestCase):
@@ -41,3 +47,29 @@ class TestConsoleRenderer(unittest.TestCase):
         expanded_repr_vertically = ConsoleRenderer.expand_vertically(expanded_repr_horizontally)
 
         self.assertEqual(len(expanded_repr_vertically), len(expanded_repr_horizontally) * 2 - 1)
+
+    def test_render_lines_matches_render(self):
+        path = [Coordinate(1, 1), Coordinate(2, 1), Coordinate(3, 1), Coordinate(3, 2), Coordinate(3, 3)]
+        expected = [''.join(row) for row in ConsoleRenderer.render(self.maze, path)]
+
+        self.assertEqual(ConsoleRenderer.render_lines(self.maze, path), expected)
+
+    def test_render_lines_numpy_is_identical(self):
+        pytest.importorskip('numpy')
+        maze = KruskalGenerator.generate(7, 9)
+        path = BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(7, 9))[1]
+
+        for route in (None, path):
+            expected = [''.join(row) for row in ConsoleRenderer.render(maze, route)]
+            self.assertEqual(ConsoleRenderer.render_lines_numpy(maze, route), expected)
+
+    def test_stream_write_matches_render(self):
+        maze = KruskalGenerator.generate(6, 8)
+        path = BreadthFirstSearchSolver.solve(maze, Coordinate(6, 1), Coordinate(1, 8))[1]
+        expected = [''.join(row) for row in ConsoleRenderer.render(maze, path)]
+
+        self.assertEqual(list(ConsoleRenderer.iter_lines(maze, path)), expected)
+
+        stream = io.StringIO()
+        ConsoleRenderer.write(maze, path, stream, chunk_size=16)
+        self.assertEqual(stream.getvalue(), '\n'.join(expected) + '\n')
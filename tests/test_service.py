@@ -0,0 +1,130 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.coordinate import Coordinate
+from src.generator import KruskalGenerator
+from src.maze import Maze
+from src.service import MazeService, ServiceBusy
+from src.solver import BreadthFirstSearchSolver
+
+
+async def request(port, method, path, body=b'', headers=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    head = [f"{method} {path} HTTP/1.1", "Host: localhost", f"Content-Length: {len(body)}", "Connection: close"]
+    head.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    writer.write(('\r\n'.join(head) + '\r\n\r\n').encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, payload = response.partition(b'\r\n\r\n')
+    lines = head.decode().split('\r\n')
+    response_headers = dict(line.split(': ', 1) for line in lines[1:])
+    return int(lines[0].split()[1]), response_headers, payload
+
+
+def run_service(scenario, **kwargs):
+    async def main():
+        service = MazeService(**kwargs)
+        port = await service.start()
+        try:
+            return await scenario(service, port)
+        finally:
+            await service.close()
+
+    return asyncio.run(main())
+
+
+class TestMazeService:
+    def test_generate_solve_render_over_http(self):
+        async def scenario(service, port):
+            status, _, body = await request(port, 'POST', '/generate', json.dumps(
+                {'algorithm': 'kruskal', 'height': 6, 'width': 7, 'seed': 3}).encode())
+            assert status == 200
+            key = json.loads(body)['maze']
+
+            status, headers, data = await request(port, 'POST', '/generate', json.dumps(
+                {'algorithm': 'kruskal', 'height': 6, 'width': 7, 'seed': 3}).encode(),
+                {'Accept': 'application/octet-stream'})
+            maze = Maze.from_bytes(data)
+            assert headers['X-Maze'] == key == maze.fingerprint()
+
+            status, _, body = await request(port, 'POST', '/solve', json.dumps(
+                {'maze': key, 'start': [1, 1], 'finish': [6, 7]}).encode())
+            answer = json.loads(body)
+            expected = BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(6, 7))[1]
+            assert answer['found'] and answer['path'] == [[c.row, c.col] for c in expected]
+
+            status, headers, text = await request(port, 'POST', '/render', json.dumps(
+                {'maze': key, 'path': answer['path']}).encode())
+            assert status == 200 and headers['Content-Type'].startswith('text/plain')
+            assert 'S' in text.decode() and 'F' in text.decode()
+
+        run_service(scenario, max_workers=2)
+
+    def test_binary_upload_and_errors(self):
+        async def scenario(service, port):
+            maze = KruskalGenerator.generate(4, 5, seed=1)
+            status, _, body = await request(port, 'POST', '/mazes', maze.to_bytes(),
+                                            {'Content-Type': 'application/octet-stream'})
+            assert status == 200 and json.loads(body)['maze'] == maze.fingerprint()
+
+            assert (await request(port, 'POST', '/solve', json.dumps(
+                {'maze': 'missing', 'start': [1, 1], 'finish': [1, 2]}).encode()))[0] == 404
+            assert (await request(port, 'POST', '/solve', json.dumps(
+                {'maze': maze.fingerprint(), 'start': [1, 1], 'finish': [9, 9]}).encode()))[0] == 400
+            for start in ([0, 1], [5, 4], [4, 6]):
+                assert (await request(port, 'POST', '/solve', json.dumps(
+                    {'maze': maze.fingerprint(), 'start': start, 'finish': [4, 5]}).encode()))[0] == 400
+            assert (await request(port, 'POST', '/generate', b'not json'))[0] == 400
+            too_big = json.dumps({'height': 100, 'width': 100}).encode()
+            assert (await request(port, 'POST', '/generate', too_big))[0] == 400
+            assert (await request(port, 'POST', '/mazes', b'\1\0\0\0\1\0\0\0\0'))[0] == 400
+            assert (await request(port, 'GET', '/generate'))[0] == 405
+            assert (await request(port, 'POST', '/unknown', b'{}'))[0] == 404
+
+            status, _, body = await request(port, 'GET', '/stats')
+            assert status == 200 and json.loads(body)['mazes'] == 1
+
+        run_service(scenario, executor=ThreadPoolExecutor(2), max_workers=2, max_cells=50 * 50)
+
+    def test_concurrent_solves_are_coalesced(self):
+        async def scenario(service, port):
+            maze = KruskalGenerator.generate(10, 10, seed=2)
+            key, _, _ = await service.register(maze.to_bytes())
+            finishes = [(row, col) for row in range(1, 11, 3) for col in range(1, 11, 3)]
+
+            answers = await asyncio.gather(*(service.solve(key, (1, 1), finish) for finish in finishes))
+            for (found, path), finish in zip(answers, finishes):
+                expected = BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(*finish))[1]
+                assert found and path == [(c.row, c.col) for c in expected]
+
+            assert service.counters['solve_requests'] == len(finishes)
+            assert service.counters['solve_jobs'] == 1
+
+        run_service(scenario, max_workers=1)
+
+    def test_full_queue_rejects(self):
+        async def scenario(service, port):
+            calls = [service.generate('kruskal', 5, 5, seed) for seed in range(3)]
+            results = await asyncio.gather(*calls, return_exceptions=True)
+            assert isinstance(results[-1], ServiceBusy)
+            assert service.counters['rejected'] >= 1
+
+            with pytest.raises(ServiceBusy):
+                await asyncio.gather(*(service.generate('kruskal', 5, 5, seed) for seed in range(3)))
+
+        run_service(scenario, executor=ThreadPoolExecutor(1), max_workers=1, queue_size=1)
+
+    def test_cancelled_solve_job_cancels_waiters(self):
+        async def scenario(service, port):
+            loop = asyncio.get_running_loop()
+            result, waiters = loop.create_future(), [loop.create_future() for _ in range(2)]
+            result.cancel()
+            MazeService._resolve_batch([((1, 1), waiter) for waiter in waiters], result)
+            assert all(waiter.cancelled() for waiter in waiters)
+
+        run_service(scenario, executor=ThreadPoolExecutor(1), max_workers=1)
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from src.coordinate import Coordinate
+from src.generator import KruskalGenerator
+from src import shared_maze
+from src.shared_maze import SharedMaze
+from src.solver import AStarSolver, BreadthFirstSearchSolver
+
+
+class TestSharedMaze:
+    def test_attach_shares_memory(self):
+        maze = KruskalGenerator.generate(9, 11, seed=1)
+        with SharedMaze.publish(maze) as shared:
+            attached = SharedMaze.attach(shared.name)
+            assert attached.maze.fingerprint() == maze.fingerprint()
+            start, finish = Coordinate(1, 1), Coordinate(9, 11)
+            assert AStarSolver.solve(attached.maze, start, finish) == AStarSolver.solve(maze, start, finish)
+
+            attached.maze.update_cell(Coordinate(5, 5), left_wall=not maze.get_cell(Coordinate(5, 5)).left_wall)
+            assert shared.maze.fingerprint() == attached.maze.fingerprint() != maze.fingerprint()
+            attached.close()
+            attached.close()
+
+        with pytest.raises(FileNotFoundError):
+            SharedMaze.attach(shared.name)
+
+    def test_solve_many_in_worker_processes(self):
+        maze = KruskalGenerator.generate(30, 40, seed=2)
+        queries = [(Coordinate(1, 1), Coordinate(row, 3 * row)) for row in range(1, 14)]
+        queries.append((Coordinate(30, 40), Coordinate(15, 1)))
+        with SharedMaze.publish(maze) as shared:
+            results = shared.solve_many(queries, max_workers=2, chunk_size=4)
+        assert results == [BreadthFirstSearchSolver.solve(maze, start, finish) for start, finish in queries]
+
+    def test_worker_attachment_is_reused_and_evicted(self):
+        maze = KruskalGenerator.generate(12, 15, seed=4)
+        with SharedMaze.publish(maze) as shared:
+            first = shared_maze.solve_shared(shared.name, shared.token, 'bfs', (1, 1), (12, 15))
+            attached = shared_maze._attached[shared.name]
+            second = shared_maze.solve_shared(shared.name, shared.token, 'bfs', (12, 1), (1, 15))
+            assert shared_maze._attached[shared.name] is attached
+            assert first[0] and second[0]
+            assert attached.maze.external_buffer and attached.maze._masks is None
+        assert shared.name not in shared_maze._attached
+
+        small = KruskalGenerator.generate(2, 3, seed=1)
+        others = [SharedMaze.publish(small) for _ in range(shared_maze._MAX_ATTACHED + 1)]
+        try:
+            for other in others:
+                assert shared_maze.solve_shared(other.name, other.token, 'bfs', (1, 1), (2, 3))[0]
+            assert list(shared_maze._attached) == [other.name for other in others[1:]]
+        finally:
+            for other in others:
+                other.unlink()
+        assert not shared_maze._attached
+
+    def test_republished_segment_is_reattached(self):
+        name = f'maze_{os.getpid()}_republish'
+        first = SharedMaze.publish(KruskalGenerator.generate(1, 4, seed=1), name)
+        stale = SharedMaze.attach(name)
+        first.unlink()
+        shared_maze._attached[name] = stale
+
+        blocked = KruskalGenerator.generate(1, 4, seed=1)
+        blocked.update_cell(Coordinate(1, 3), left_wall=True)
+        with SharedMaze.publish(blocked, name) as shared:
+            assert shared_maze.solve_shared(name, shared.token, 'bfs', (1, 1), (1, 4)) == (False, [])
+            assert shared_maze._attached[name] is not stale
+            with pytest.raises(FileNotFoundError):
+                shared_maze.solve_shared(name, stale.token, 'bfs', (1, 1), (1, 4))
+        assert not shared_maze._attached
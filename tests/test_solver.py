@@ -1,4 +1,7 @@
-from src.solver import BreadthFirstSearchSolver, BacktrackSolver
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator, KruskalGenerator
+from src.maze import Maze
+from src.solver import AStarSolver, BacktrackSolver, BidirectionalBFSSolver, BreadthFirstSearchSolver
 
 
 class TestBacktrackSolver:
@@ -12,6 +15,19 @@ class TestBacktrackSolver:
         found, path = BacktrackSolver.solve(unsolvable_maze, start, finish)
         assert not found, "В неразрешимом лабиринте пути не существует."
 
+    def test_backtrack_solver_does_not_mutate_maze(self, simple_maze, start_finish_coordinates):
+        start, finish = start_finish_coordinates
+        before = bytes(simple_maze.buffer)
+        found, path = BacktrackSolver.solve(simple_maze, start, finish)
+        assert found and path[0] == start and path[-1] == finish
+        assert bytes(simple_maze.buffer) == before
+
+    def test_backtrack_solver_deep_maze(self):
+        maze = BacktrackGenerator.generate(2, 20_000)
+        found, path = BacktrackSolver.solve(maze, Coordinate(1, 1), Coordinate(2, 20_000))
+        assert found
+        assert len(path) >= 20_000
+
 
 class TestBreadthFirstSearchSolver:
     def test_bfs_solver_simple_maze(self, simple_maze, start_finish_coordinates):
@@ -24,4 +40,80 @@ class TestBreadthFirstSearchSolver:
     def test_bfs_solver_unsolvable_maze(self, unsolvable_maze, start_finish_coordinates):
         start, finish = start_finish_coordinates
         found, path = BreadthFirstSearchSolver.solve(unsolvable_maze, start, finish)
-        assert not found, "В неразрешимом лабиринте пути не существует."
\ No newline at end of file
+        assert not found, "В неразрешимом лабиринте пути не существует."
+
+    def test_bfs_indexed_matches_coordinate_search(self, simple_maze, start_finish_coordinates):
+        start, finish = start_finish_coordinates
+        assert BreadthFirstSearchSolver.solve_indexed(simple_maze, start, finish) == \
+            BreadthFirstSearchSolver.solve_by_coordinates(simple_maze, start, finish)
+
+    def test_bfs_in_place_on_external_buffer(self):
+        maze = KruskalGenerator.generate(9, 12, seed=6)
+        for row in range(maze.map_height):
+            maze.buffer[row * maze.map_width + maze.width + 1] = 0
+        external = Maze.from_buffer(maze.height, maze.width, memoryview(bytearray(maze.buffer)))
+        assert external.external_buffer and not maze.external_buffer
+        for start, finish in ((Coordinate(1, 1), Coordinate(9, 12)), (Coordinate(9, 12), Coordinate(5, 1))):
+            assert BreadthFirstSearchSolver.solve(external, start, finish) == \
+                BreadthFirstSearchSolver.solve_indexed(maze, start, finish)
+        assert external._masks is None
+
+
+class TestAStarSolver:
+    def test_astar_solver_simple_maze(self, simple_maze, start_finish_coordinates):
+        start, finish = start_finish_coordinates
+        found, path = AStarSolver.solve(simple_maze, start, finish)
+        assert found
+        assert len(path) == len(BreadthFirstSearchSolver.solve(simple_maze, start, finish)[1])
+
+    def test_astar_solver_unsolvable_maze(self, unsolvable_maze, start_finish_coordinates):
+        start, finish = start_finish_coordinates
+        found, path = AStarSolver.solve(unsolvable_maze, start, finish)
+        assert not found and path == []
+
+
+class TestBidirectionalBFSSolver:
+    def test_bidirectional_solver_matches_bfs(self):
+        maze = KruskalGenerator.generate(15, 20, seed=4)
+        start, finish = Coordinate(3, 17), Coordinate(14, 2)
+        found, path = BidirectionalBFSSolver.solve(maze, start, finish)
+        assert found
+        assert path == BreadthFirstSearchSolver.solve(maze, start, finish)[1]
+
+    def test_bidirectional_solver_unsolvable_maze(self, unsolvable_maze, start_finish_coordinates):
+        start, finish = start_finish_coordinates
+        found, path = BidirectionalBFSSolver.solve(unsolvable_maze, start, finish)
+        assert not found
+
+
+class TestDistanceField:
+    def test_distance_field_matches_solve(self):
+        maze = KruskalGenerator.generate(9, 11, seed=8)
+        start = Coordinate(5, 6)
+        distance, parent = BreadthFirstSearchSolver.distance_field(maze, start)
+        assert parent[maze.index(start)] == maze.index(start)
+        for row in range(1, 10):
+            for col in range(1, 12):
+                found, path = BreadthFirstSearchSolver.solve(maze, start, Coordinate(row, col))
+                assert found and distance[maze.index(Coordinate(row, col))] == len(path) - 1
+
+    def test_distance_field_unreachable(self, unsolvable_maze, start_finish_coordinates):
+        start, finish = start_finish_coordinates
+        distance, parent = BreadthFirstSearchSolver.distance_field(unsolvable_maze, start)
+        assert distance[unsolvable_maze.index(finish)] == -1 and parent[unsolvable_maze.index(finish)] == -1
+
+    def test_solve_many_matches_solve(self, simple_maze, unsolvable_maze):
+        finishes = [Coordinate(5, 5), Coordinate(1, 1), Coordinate(3, 4), Coordinate(2, 2)]
+        for maze in (simple_maze, unsolvable_maze):
+            results = BreadthFirstSearchSolver.solve_many(maze, Coordinate(1, 1), finishes)
+            assert results == [BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), f) for f in finishes]
+        assert BreadthFirstSearchSolver.solve_many(simple_maze, Coordinate(1, 1), []) == []
+
+    def test_diameter_of_perfect_maze(self):
+        maze = BacktrackGenerator.generate(8, 10, seed=6)
+        cells = [Coordinate(row, col) for row in range(1, 9) for col in range(1, 11)]
+        longest = max(max(BreadthFirstSearchSolver.distance_field(maze, cell)[0]) for cell in cells)
+
+        length, first, last = BreadthFirstSearchSolver.diameter(maze)
+        assert length == longest
+        assert len(BreadthFirstSearchSolver.solve(maze, first, last)[1]) == length + 1
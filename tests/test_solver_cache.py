@@ -0,0 +1,61 @@
+from src.coordinate import Coordinate
+from src.generator import KruskalGenerator
+from src.maze import Maze
+from src.solver import BreadthFirstSearchSolver
+from src.solver_cache import SolverCache
+
+
+class TestSolverCache:
+    def test_repeated_queries_hit_cache(self):
+        maze = KruskalGenerator.generate(10, 12, seed=1)
+        cache = SolverCache()
+        start = Coordinate(1, 1)
+        for finish in (Coordinate(10, 12), Coordinate(5, 5), Coordinate(1, 12)):
+            assert cache.solve(maze, start, finish) == BreadthFirstSearchSolver.solve(maze, start, finish)
+
+        assert cache.misses == 1 and cache.hits == 2
+        assert cache.hit_rate == 2 / 3
+        assert cache.cached_trees == 1 and cache.bytes_held == 4 * len(maze.buffer)
+
+    def test_reverse_query_uses_finish_tree(self):
+        maze = KruskalGenerator.generate(8, 8, seed=2)
+        cache = SolverCache()
+        cache.solve(maze, Coordinate(8, 8), Coordinate(1, 1))
+        found, path = cache.solve(maze, Coordinate(1, 1), Coordinate(8, 8))
+        assert found and path == BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(8, 8))[1]
+        assert cache.hits == 1
+
+    def test_mutation_invalidates(self, simple_maze, start_finish_coordinates):
+        start, finish = start_finish_coordinates
+        cache = SolverCache()
+        assert cache.solve(simple_maze, start, finish)[0]
+
+        version = simple_maze.version
+        for row in range(1, 6):
+            simple_maze.update_cell(Coordinate(row, 3), left_wall=True)
+        assert simple_maze.version > version
+        assert cache.solve(simple_maze, start, finish) == (False, [])
+        assert cache.misses == 2
+
+    def test_equal_mazes_share_trees(self):
+        first = KruskalGenerator.generate(6, 7, seed=3)
+        second = Maze.from_bytes(first.to_bytes())
+        cache = SolverCache()
+        cache.solve(first, Coordinate(1, 1), Coordinate(6, 7))
+        cache.solve(second, Coordinate(1, 1), Coordinate(3, 3))
+        assert cache.hits == 1
+
+    def test_lru_eviction_by_bytes(self):
+        maze = KruskalGenerator.generate(5, 5, seed=4)
+        tree_bytes = 4 * len(maze.buffer)
+        cache = SolverCache(max_bytes=2 * tree_bytes)
+        for col in (1, 2, 3):
+            cache.tree(maze, Coordinate(1, col))
+        assert cache.cached_trees == 2 and cache.bytes_held == 2 * tree_bytes
+
+        cache.tree(maze, Coordinate(1, 1))
+        assert cache.misses == 4
+
+        small = SolverCache(max_bytes=tree_bytes - 1)
+        assert small.solve(maze, Coordinate(1, 1), Coordinate(5, 5))[0]
+        assert small.cached_trees == 0 and small.bytes_held == 0
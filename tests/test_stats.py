@@ -0,0 +1,86 @@
+import io
+import logging
+from collections import deque
+
+from src import main as main_module
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator, KruskalGenerator
+from src.renderer import ConsoleRenderer
+from src.solver import AStarSolver, BacktrackSolver, BidirectionalBFSSolver, BreadthFirstSearchSolver
+from src.stats import NULL_STATS, Stats, peak_queue_frontier
+from src.user_interaction import UserInteraction
+
+
+class TestStats:
+    def test_solvers_record_counters_and_phases(self):
+        maze = KruskalGenerator.generate(12, 15, seed=2)
+        start, finish = Coordinate(1, 1), Coordinate(12, 15)
+        for solver in (BacktrackSolver, BreadthFirstSearchSolver, AStarSolver, BidirectionalBFSSolver):
+            stats = Stats()
+            assert solver.solve(maze, start, finish, stats) == solver.solve(maze, start, finish)
+            assert 0 < stats.nodes_expanded <= 12 * 15
+            assert stats.walls_checked > 0 and stats.peak_frontier > 0
+            assert {'reset', 'search', 'path'} <= set(stats.phases)
+
+    def test_bfs_counters_match_simulation(self, simple_maze):
+        start, finish = Coordinate(1, 1), Coordinate(5, 4)
+        stats = Stats()
+        BreadthFirstSearchSolver.solve(simple_maze, start, finish, stats)
+
+        queue, seen, expanded, peak = deque([start]), {start}, 0, 1
+        while queue:
+            cur = queue.popleft()
+            if cur == finish:
+                break
+            expanded += 1
+            for neighbor in (Coordinate(cur.row, cur.col + 1), Coordinate(cur.row + 1, cur.col),
+                             Coordinate(cur.row, cur.col - 1), Coordinate(cur.row - 1, cur.col)):
+                if simple_maze.coordinate_inside_map(neighbor) and neighbor not in seen and \
+                        not simple_maze.check_wall(cur, neighbor):
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+                    peak = max(peak, len(queue))
+
+        assert stats.nodes_expanded == expanded
+        assert stats.walls_checked == 4 * expanded
+        assert stats.peak_frontier == peak
+
+    def test_peak_queue_frontier(self):
+        # 0 -> 1, 2, 3; 1 -> 4; 2 -> 5, 6: самая длинная очередь (2, 3, 4, 5, 6) после раскрытия клетки 2.
+        order = [0, 1, 2, 3, 4, 5, 6]
+        parent = {1: 0, 2: 0, 3: 0, 4: 1, 5: 2, 6: 2}
+        assert peak_queue_frontier(order, parent) == 4
+        assert peak_queue_frontier([], {}) == 0
+
+    def test_generators_and_renderer_accumulate(self):
+        stats = Stats()
+        maze = BacktrackGenerator.generate(6, 7, seed=1, stats=stats)
+        ConsoleRenderer.write(maze, stream=io.StringIO(), stats=stats)
+        assert stats.nodes_expanded == 42
+        assert stats.walls_checked == 2 * (6 * 6 + 7 * 5)
+        assert 0 < stats.peak_frontier <= 42
+        assert {'reset', 'generate', 'render'} <= set(stats.phases)
+        assert stats.as_dict()['nodes_expanded'] == 42
+
+    def test_null_stats_stay_empty(self):
+        maze = KruskalGenerator.generate(5, 5, seed=0)
+        BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(5, 5), None)
+        assert not NULL_STATS.enabled
+        assert NULL_STATS.nodes_expanded == 0 and NULL_STATS.phases == {}
+
+
+class TestMain:
+    def test_stats_and_profile_switches(self, monkeypatch, tmp_path, caplog):
+        received = []
+        monkeypatch.setattr(UserInteraction, 'read_maze_params_and_gen_maze', received.append)
+
+        profile = tmp_path / 'run.pstats'
+        with caplog.at_level(logging.INFO):
+            main_module.main(['--stats', '--profile', str(profile)])
+
+        assert isinstance(received[0], Stats)
+        assert profile.exists()
+        assert any('Раскрыто клеток' in record.getMessage() for record in caplog.records)
+
+        main_module.main([])
+        assert received[1] is None
@@ -0,0 +1,44 @@
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator
+from src.solver import BreadthFirstSearchSolver
+from src.tiled_maze import TiledMaze
+
+
+class TestTiledMaze:
+    def test_route_crosses_tiles(self):
+        maze = TiledMaze(6, 5, seed=3, cache_size=8)
+        start, finish = Coordinate(1, 1), Coordinate(40, 33)
+        found, path = BreadthFirstSearchSolver.solve(maze, start, finish)
+
+        assert found and path[0] == start and path[-1] == finish
+        for cur, nxt in zip(path, path[1:]):
+            assert not maze.check_wall(cur, nxt)
+        assert maze.cached_tiles <= 8
+        assert maze.misses > 0 and maze.hits > 0
+
+    def test_tiles_are_deterministic(self):
+        first = TiledMaze(4, 4, seed=9, cache_size=1, generator=BacktrackGenerator)
+        second = TiledMaze(4, 4, seed=9, cache_size=100, generator=BacktrackGenerator)
+
+        for row in range(1, 17):
+            for col in range(1, 17):
+                a, b = first.get_cell(Coordinate(row, col)), second.get_cell(Coordinate(row, col))
+                assert (a.left_wall, a.upper_wall) == (b.left_wall, b.upper_wall)
+
+    def test_bounded_maze_has_one_opening_per_tile_border(self):
+        maze = TiledMaze(4, 3, seed=1, height=10, width=8)
+        assert not maze.coordinate_inside_map(Coordinate(11, 1))
+        assert maze.check_wall(Coordinate(10, 8), Coordinate(10, 9))
+        assert maze.check_wall(Coordinate(10, 8), Coordinate(11, 8))
+
+        passages = 0
+        for row in range(1, 11):
+            for col in range(1, 9):
+                cur = Coordinate(row, col)
+                for neighbor in (Coordinate(row + 1, col), Coordinate(row, col + 1)):
+                    if maze.coordinate_inside_map(neighbor) and not maze.check_wall(cur, neighbor):
+                        passages += 1
+        found, _ = BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(10, 8))
+        assert found
+        tiles, tile_borders = 3 * 3, 3 * 2 + 2 * 3
+        assert passages == 10 * 8 - tiles + tile_borders
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator
+from src.solver import BreadthFirstSearchSolver
+from src.tree_path_index import TreePathIndex
+
+
+class TestTreePathIndex:
+    def test_matches_bfs_on_perfect_maze(self):
+        maze = BacktrackGenerator.generate(25, 30, seed=11)
+        index = TreePathIndex(maze)
+        rng = random.Random(0)
+
+        for _ in range(100):
+            start = Coordinate(rng.randint(1, 25), rng.randint(1, 30))
+            finish = Coordinate(rng.randint(1, 25), rng.randint(1, 30))
+            found, path = BreadthFirstSearchSolver.solve(maze, start, finish)
+
+            assert index.solve(start, finish) == (found, path)
+            assert index.distance(start, finish) == len(path) - 1
+
+    def test_disconnected_cells(self, unsolvable_maze, start_finish_coordinates):
+        start, finish = start_finish_coordinates
+        index = TreePathIndex(unsolvable_maze)
+
+        assert index.distance(start, finish) is None
+        assert index.solve(start, finish) == (False, [])
+        assert index.distance(start, start) == 0
+
+    def test_rejects_maze_with_cycles(self, simple_maze):
+        with pytest.raises(ValueError):
+            TreePathIndex(simple_maze)
@@ -42,7 +42,8 @@ class TestUserInteraction(unittest.TestCase):
         self.assertEqual(start, Coordinate(1, 1))
         self.assertEqual(finish, Coordinate(1, 1))
 
-    @patch('builtins.input', side_effect=['3', '0', f'{UserInteraction.SolverAlgorithm.BFS.value}',
+    @patch('builtins.input', side_effect=[f'{len(UserInteraction.SolverAlgorithm) + 1}', '0',
+                                          f'{UserInteraction.SolverAlgorithm.BFS.value}',
                                           f'{UserInteraction.SolverAlgorithm.BACKTRACKING.value}'])
     @patch('src.user_interaction.UserInteraction.get_cell_coords', return_value=Coordinate(2, 2))
     def test_read_solver_params_bfs(self, mock_get_cell_coords, mock_input):
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from src.coordinate import Coordinate
+from src.generator import BacktrackGenerator, KruskalGenerator
+from src.maze import Maze
+from src.solver import BreadthFirstSearchSolver
+from src.stats import Stats
+from src.vectorized_solver import DeadEndFillingSolver, VectorizedBFSSolver
+
+np = pytest.importorskip('numpy')
+
+
+class TestVectorizedBFSSolver:
+    def test_distance_field_matches_bfs_with_cycles(self):
+        rng = random.Random(3)
+        maze = KruskalGenerator.generate(15, 17, seed=3)
+        for _ in range(40):
+            maze.update_cell(Coordinate(rng.randint(1, 15), rng.randint(1, 17)), left_wall=False)
+
+        expected, _ = BreadthFirstSearchSolver.distance_field(maze, Coordinate(3, 4))
+        distance, parent = VectorizedBFSSolver.distance_field(maze, Coordinate(3, 4))
+        assert distance.dtype == parent.dtype == np.int32
+        assert distance.tolist() == list(expected)
+
+        for finish in (Coordinate(15, 17), Coordinate(1, 1), Coordinate(8, 9)):
+            found, path = VectorizedBFSSolver.solve(maze, Coordinate(3, 4), finish)
+            assert found and len(path) == len(BreadthFirstSearchSolver.solve(maze, Coordinate(3, 4), finish)[1])
+            for cur, neighbor in zip(path, path[1:]):
+                assert not maze.check_wall(cur, neighbor)
+
+    def test_open_field_and_unreachable(self, unsolvable_maze, start_finish_coordinates):
+        distance, _ = VectorizedBFSSolver.distance_field(Maze(30, 30, walls_inside=False), Coordinate(1, 1))
+        assert distance.max() == 58 and (distance[Maze(30, 30).index(Coordinate(1, 1))] == 0)
+
+        assert VectorizedBFSSolver.solve(unsolvable_maze, *start_finish_coordinates) == (False, [])
+
+    def test_stops_at_finish_and_records_stats(self):
+        maze = KruskalGenerator.generate(20, 20, seed=1)
+        stats = Stats()
+        found, path = VectorizedBFSSolver.solve(maze, Coordinate(1, 1), Coordinate(1, 2), stats)
+        assert found and path == BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1), Coordinate(1, 2))[1]
+        assert 0 < stats.nodes_expanded < 20 * 20
+        assert {'reset', 'search', 'path'} <= set(stats.phases)
+
+
+class TestDeadEndFillingSolver:
+    def test_matches_bfs_on_perfect_mazes(self):
+        for generator in (KruskalGenerator, BacktrackGenerator):
+            maze = generator.generate(15, 17, seed=2)
+            for start, finish in ((Coordinate(1, 1), Coordinate(15, 17)), (Coordinate(8, 8), Coordinate(1, 17)),
+                                  (Coordinate(3, 3), Coordinate(3, 3))):
+                assert DeadEndFillingSolver.solve(maze, start, finish) == \
+                    BreadthFirstSearchSolver.solve(maze, start, finish)
+
+    def test_maze_with_cycles_and_unreachable(self, unsolvable_maze, start_finish_coordinates):
+        rng = random.Random(4)
+        maze = KruskalGenerator.generate(12, 12, seed=4)
+        for _ in range(30):
+            maze.update_cell(Coordinate(rng.randint(1, 12), rng.randint(1, 12)), upper_wall=False)
+        found, path = DeadEndFillingSolver.solve(maze, Coordinate(1, 1), Coordinate(12, 12))
+        assert found and len(path) == len(BreadthFirstSearchSolver.solve(maze, Coordinate(1, 1),
+                                                                         Coordinate(12, 12))[1])
+
+        assert DeadEndFillingSolver.solve(unsolvable_maze, *start_finish_coordinates) == (False, [])
+
+    def test_reports_passes(self):
+        maze = Maze(1, 6)
+        for col in range(2, 7):
+            maze.update_cell(Coordinate(1, col), left_wall=False)
+        stats = Stats()
+        found, path = DeadEndFillingSolver.solve(maze, Coordinate(1, 1), Coordinate(1, 3), stats)
+        assert found and len(path) == 3
+        assert stats.passes == 3 and stats.as_dict()['passes'] == 3
+        assert {'reset', 'fill', 'path'} <= set(stats.phases)